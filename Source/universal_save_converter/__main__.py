@@ -0,0 +1,12 @@
+# __main__.py
+
+import os
+import sys
+
+# Allow `python -m universal_save_converter` from the Source folder:
+# the project's modules are imported relative to this directory.
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from main import main
+
+main()
@@ -0,0 +1,25 @@
+# cli/cli_args.py
+
+from systems.n64.n64_constants import SaveSystem, SaveType
+from systems.n64.n64_utils import resolve_target_type  # re-exported for the commands
+
+# Accepted spellings for --byteswap, mapped onto the GUI options
+BYTESWAP_CHOICES = {"default": "Default", "auto": "Auto", "2": "2 bytes", "4": "4 bytes"}
+
+
+def parse_system(name: str) -> SaveSystem:
+    """Parse a --src/--tgt value such as 'pj64' into a SaveSystem."""
+    try:
+        return SaveSystem[name.upper()]
+    except KeyError:
+        raise ValueError(f"unknown system '{name}' (choose from: "
+                         f"{', '.join(s.name.lower() for s in SaveSystem)})") from None
+
+
+def parse_save_type(name: str) -> SaveType:
+    """Parse a --src-type/--tgt-type value such as 'sra' into a SaveType."""
+    try:
+        return SaveType[name.upper().lstrip(".")]
+    except KeyError:
+        raise ValueError(f"unknown save type '{name}' (choose from: "
+                         f"{', '.join(t.name.lower() for t in SaveType)})") from None
@@ -0,0 +1,197 @@
+# cli/cli_batch.py
+
+import glob
+import os
+import sys
+from core.batch_runner import BatchTask, run_batch, write_report
+from core.conversion_types import ConversionOptions
+from core.result_cache import ResultCache
+from systems.n64.n64_catalog import open_catalog, scan_saves
+from systems.n64.n64_constants import SAVE_TYPE_EXT, SaveType
+from systems.n64.n64_engine import convert_file
+from systems.n64.n64_resolve import resolve_types
+from systems.n64.n64_rom import scan_rom_dir
+from cli.cli_args import BYTESWAP_CHOICES, parse_save_type, parse_system
+
+
+def _inside(path: str, folder: str) -> bool:
+    """True if path (a realpath) is strictly inside folder (a realpath)."""
+    return path != folder and os.path.commonpath((path, folder)) == folder
+
+
+def _glob_root(pattern: str) -> str:
+    """The folder a glob pattern searches from: its leading parts without wildcards."""
+    parts = os.path.normpath(pattern).split(os.sep)
+    fixed = next((i for i, part in enumerate(parts) if glob.has_magic(part)), len(parts) - 1)
+    return os.sep.join(parts[:fixed]) or (os.sep if pattern.startswith(os.sep) else ".")
+
+
+def collect_inputs(pattern: str, recursive: bool = False, exclude=()) -> list[tuple[str, str]]:
+    """
+    Return (path, relative_path) pairs for a directory or glob pattern.
+    Relative paths preserve the folder layout under the output directory.
+    exclude lists files and folders to leave out (compared by realpath),
+    e.g. the output folder and report of a batch writing into its own input
+    tree; a folder only counts when it lies inside the one being searched.
+    """
+    exclude = {os.path.realpath(path) for path in exclude}
+    if os.path.isdir(pattern):
+        root = os.path.realpath(pattern)
+        skip = {path for path in exclude if path == root or _inside(path, root)}
+        found = []
+        stack = [pattern]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if os.path.realpath(entry.path) in skip:
+                        continue
+                    if entry.is_file():
+                        found.append((entry.path, os.path.relpath(entry.path, pattern)))
+                    elif recursive and entry.is_dir():
+                        stack.append(entry.path)
+        return sorted(found)
+
+    root = os.path.realpath(_glob_root(pattern))
+    skip_dirs = [path for path in exclude if _inside(path, root)]
+    found = []
+    for path in glob.glob(pattern, recursive=recursive):
+        real = os.path.realpath(path)
+        if real in exclude or any(_inside(real, folder) for folder in skip_dirs) or not os.path.isfile(path):
+            continue
+        found.append((path, os.path.basename(path)))
+    return sorted(found)
+
+
+def batch_outputs(args) -> tuple[str, str]:
+    """The output folder and report path of a batch (left out of its inputs)."""
+    return args.output_dir, args.report or os.path.join(args.output_dir, "batch_report.json")
+
+
+def catalog_inputs(catalog, args, src) -> tuple[list, dict]:
+    """
+    Rescan the input folder into the catalog and take the saves from it:
+    returns (path, relative_path) pairs and {path: catalogued SaveType}.
+    Saves under the batch's own output folder (inside the input) are left out.
+    """
+    scan_saves(catalog, args.input, src, args.recursive)
+    root = os.path.realpath(args.input)
+    output_dir, report_path = (os.path.realpath(path) for path in batch_outputs(args))
+    rows = [row for row in catalog.query(root=args.input) if row["save_type"]
+            and os.path.realpath(row["path"]) != report_path
+            and not (_inside(output_dir, root) and _inside(os.path.realpath(row["path"]), output_dir))]
+    inputs = sorted((row["path"], os.path.relpath(row["path"], os.path.abspath(args.input))) for row in rows)
+    return inputs, {row["path"]: SaveType[row["save_type"]] for row in rows}
+
+
+def _path_key(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+def plan_tasks(args, inputs, known_types=None, catalog=None):
+    """
+    Build BatchTasks for the inputs; returns (tasks, skipped report entries,
+    up-to-date count). known_types gives source types already detected (by
+    the catalog); with catalog and --changed, saves whose current content
+    was already converted to the same output are left out. Inputs whose
+    output would overwrite an input, or another input's output, are skipped.
+    """
+    src, tgt = parse_system(args.src), parse_system(args.tgt)
+    forced_src_type = parse_save_type(args.src_type) if args.src_type else None
+    forced_tgt_type = parse_save_type(args.tgt_type) if args.tgt_type else None
+    options = ConversionOptions(byteswap_option=BYTESWAP_CHOICES[args.byteswap], verify=args.verify)
+    cache = None if args.no_cache else ResultCache(args.cache_dir, args.cache_size * 1024 * 1024, args.cache_link)
+
+    if args.rom_dir and not os.path.isdir(args.rom_dir):
+        raise ValueError(f"not a folder: {args.rom_dir}")
+    roms = scan_rom_dir(args.rom_dir, args.recursive) if args.rom_dir else {}
+
+    known_types = known_types or {}
+    input_keys = {_path_key(path) for path, _ in inputs}
+    planned, skipped, up_to_date = [], [], 0
+    for path, rel_path in inputs:
+        src_type, tgt_type, error = resolve_types(path, src, tgt, forced_src_type or known_types.get(path),
+                                                  forced_tgt_type, roms)
+        if error:
+            skipped.append({"input": path, "status": "skipped", "error": error})
+            continue
+
+        out_path = os.path.join(args.output_dir, os.path.splitext(rel_path)[0] + SAVE_TYPE_EXT[tgt_type])
+        if _path_key(out_path) in input_keys:
+            skipped.append({"input": path, "status": "skipped", "output": out_path,
+                            "error": "output would overwrite an input; choose another output folder"})
+            continue
+        planned.append((path, out_path, src_type, tgt_type))
+
+    # Two inputs mapping to one output (game.sra + game.eep → game.srm, or
+    # a/x.sra + b/x.sra from a glob) would race; convert neither
+    claims = {}
+    for path, out_path, _, _ in planned:
+        claims.setdefault(_path_key(out_path), []).append(path)
+
+    tasks = []
+    for path, out_path, src_type, tgt_type in planned:
+        others = [other for other in claims[_path_key(out_path)] if other != path]
+        if others:
+            skipped.append({"input": path, "status": "skipped", "output": out_path,
+                            "error": f"output is also the output of {', '.join(others)}"})
+            continue
+        if catalog is not None and args.changed and catalog.is_converted(path, out_path):
+            up_to_date += 1
+            continue
+        tasks.append(BatchTask(convert_file, path, out_path, src, src_type, tgt, tgt_type, options, cache,
+                               args.link))
+    return tasks, skipped, up_to_date
+
+
+def run_batch_command(args) -> int:
+    """`usc batch`: convert every matching save and write a summary report."""
+    catalog = None
+    if args.catalog is not None and os.path.isdir(args.input):
+        catalog = open_catalog(args.catalog or None)
+    try:
+        return _run_batch(args, catalog)
+    finally:
+        if catalog is not None:
+            catalog.close()
+
+
+def _run_batch(args, catalog) -> int:
+    try:
+        if catalog is not None:
+            inputs, known_types = catalog_inputs(catalog, args, parse_system(args.src))
+        else:
+            inputs, known_types = collect_inputs(args.input, args.recursive, batch_outputs(args)), None
+        if not inputs:
+            print(f"usc: no input files match {args.input}", file=sys.stderr)
+            return 1
+        tasks, skipped, up_to_date = plan_tasks(args, inputs, known_types, catalog)
+    except ValueError as e:
+        print(f"usc: {e}", file=sys.stderr)
+        return 2
+    for out_dir in {os.path.dirname(task.out_path) for task in tasks}:
+        os.makedirs(out_dir, exist_ok=True)
+
+    def progress(entry):
+        if entry["status"] != "ok":
+            print(f"FAILED {entry['input']}: {entry['error']}", file=sys.stderr)
+
+    report = run_batch(tasks, workers=args.workers, use_threads=args.threads,
+                       chunksize=args.chunksize, on_result=progress)
+    report["skipped"] = len(skipped)
+    report["up_to_date"] = up_to_date
+    report["results"].extend(skipped)
+    if catalog is not None:
+        tasks_by_path = {task.path: task for task in tasks}
+        for entry in report["results"]:
+            if entry["status"] == "ok":
+                task = tasks_by_path[entry["input"]]
+                catalog.record_conversion(task.path, task.out_path, entry["plan"], task.tgt.name, task.tgt_type.name)
+
+    report_path = batch_outputs(args)[1]
+    os.makedirs(os.path.dirname(os.path.abspath(report_path)), exist_ok=True)
+    write_report(report, report_path)
+
+    fresh = f", {up_to_date} up to date" if up_to_date else ""
+    print(f"Converted {report['converted']}/{len(inputs)} files "
+          f"({report['cached']} cached, {report['copied']} copied as is, {report['failed']} failed, {len(skipped)} skipped{fresh}) in {report['seconds']}s → {report_path}")
+    return 0 if report["failed"] == 0 and not skipped else 2
@@ -0,0 +1,46 @@
+# cli/cli_catalog.py
+
+import json
+import os
+import sys
+from systems.n64.n64_catalog import open_catalog, scan_saves
+from systems.n64.n64_rom import scan_rom_dir
+from cli.cli_args import parse_save_type, parse_system
+
+
+def run_catalog_command(args) -> int:
+    """`usc catalog`: rescan folders into the save catalog, then print matching saves as JSON lines."""
+    try:
+        system = parse_system(args.system) if args.system else None
+        save_type = parse_save_type(args.type).name if args.type else None
+        section = parse_save_type(args.section).name if args.section else None
+        if args.folders and system is None:
+            raise ValueError("scanning a folder needs --system")
+        for folder in args.folders + ([args.rom_dir] if args.rom_dir else []):
+            if not os.path.isdir(folder):
+                raise ValueError(f"not a folder: {folder}")
+    except ValueError as e:
+        print(f"usc: {e}", file=sys.stderr)
+        return 2
+
+    catalog = open_catalog(args.db)
+    try:
+        roms = scan_rom_dir(args.rom_dir, args.recursive) if args.rom_dir else None
+        for folder in args.folders:
+            counts = scan_saves(catalog, folder, system, args.recursive, roms)
+            print(f"usc: {folder}: " + ", ".join(f"{n} {state}" for state, n in counts.items()), file=sys.stderr)
+
+        roots = args.folders or [None]
+        rows = [row for root in roots for row in catalog.query(
+            root=root, system=system.name if system else None, save_type=save_type, section=section,
+            no_rom=args.no_rom, unconverted=args.unconverted)]
+        rows = [row for row in rows if row["save_type"] or args.all]
+        if args.count:
+            print(len(rows))
+        else:
+            for row in rows:
+                row["last_conversion"] = catalog.last_conversion(row["path"])
+                print(json.dumps(row, ensure_ascii=False))
+    finally:
+        catalog.close()
+    return 0
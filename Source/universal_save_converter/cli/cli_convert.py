@@ -0,0 +1,108 @@
+# cli/cli_convert.py
+
+import json
+import os
+import sys
+from core.conversion_types import ConversionOptions
+from core.exceptions import ConversionError, InvalidInputError
+from systems.n64.n64_constants import SaveType, SAVE_TYPE_EXT
+from systems.n64.n64_detect import classify_save
+from systems.n64.n64_engine import convert_file
+from cli.cli_args import BYTESWAP_CHOICES, parse_save_type, parse_system, resolve_target_type
+
+# Request fields accepted from the command line flags or a JSON request
+REQUEST_FIELDS = ("input", "output", "src", "tgt", "src_type", "tgt_type", "byteswap", "verify")
+
+
+def load_requests(args) -> list[dict]:
+    """
+    Return conversion requests from --json (inline JSON, or '-' for stdin)
+    or from the command line flags. A JSON list runs several conversions.
+    """
+    if args.json:
+        payload = json.loads(sys.stdin.read() if args.json == "-" else args.json)
+        return payload if isinstance(payload, list) else [payload]
+    return [{field: getattr(args, field) for field in REQUEST_FIELDS}]
+
+
+def output_path_for(path: str, output: str | None, tgt_type: SaveType) -> str:
+    """Default output: next to the input (or inside output if it is a directory)."""
+    name = os.path.splitext(os.path.basename(path))[0] + SAVE_TYPE_EXT[tgt_type]
+    if not output:
+        return os.path.join(os.path.dirname(path), name)
+    if os.path.isdir(output):
+        return os.path.join(output, name)
+    return output
+
+
+def convert_request(request: dict) -> dict:
+    """Run one conversion request and return a machine-readable result."""
+    if not isinstance(request, dict):
+        return error_record(None, ValueError(f"each request must be a JSON object, not {type(request).__name__}"))
+    path = request.get("input")
+    try:
+        if not path or not request.get("src") or not request.get("tgt"):
+            raise ValueError("input, src and tgt are required")
+        if not os.path.isfile(path):
+            raise InvalidInputError(f"Invalid input path: {path}")
+        src, tgt = parse_system(request["src"]), parse_system(request["tgt"])
+        if request.get("src_type"):
+            src_type = parse_save_type(request["src_type"])
+        else:
+            src_type = classify_save(path)
+            if not src_type:
+                raise ValueError("cannot detect the source type; pass src_type")
+        tgt_type = resolve_target_type(
+            src, src_type, tgt, parse_save_type(request["tgt_type"]) if request.get("tgt_type") else None
+        )
+        if tgt_type is None:
+            raise ValueError("ambiguous target type; pass tgt_type")
+
+        out_path = output_path_for(path, request.get("output"), tgt_type)
+        if os.path.abspath(out_path) == os.path.abspath(path):
+            raise ValueError("output would overwrite the input; pass an output path")
+
+        options = ConversionOptions(byteswap_option=BYTESWAP_CHOICES[request.get("byteswap") or "default"],
+                                    verify=bool(request.get("verify")))
+        result = convert_file(path, out_path, src, src_type, tgt, tgt_type, options)
+    except (ConversionError, ValueError, KeyError) as e:
+        return error_record(path, e)
+    return result_record(path, result)
+
+
+def error_record(path, error: Exception) -> dict:
+    """JSON-ready record for a failed command."""
+    return {"status": "error", "input": path, "error": str(error), "error_type": type(error).__name__}
+
+
+def result_record(path, result) -> dict:
+    """JSON-ready record for a ConversionResult written to disk."""
+    return {
+        "status": "ok",
+        "input": path,
+        "output": result.out_path,
+        "plan": result.plan_key,
+        "size": result.tgt_size,
+        "offset": result.offset,
+        "swap_size": result.swap_size,
+        "swap_confidence": result.swap_confidence,
+        "copy_method": result.copy_method,
+        "verified": result.verified,
+        "messages": [{"level": level, "message": message} for level, message in result.messages],
+    }
+
+
+def run_convert_command(args) -> int:
+    """`usc convert`: convert one save (or a JSON list) and print JSON lines."""
+    try:
+        requests = load_requests(args)
+    except json.JSONDecodeError as e:
+        print(json.dumps({"status": "error", "error": f"invalid JSON: {e}", "error_type": "JSONDecodeError"}))
+        return 2
+
+    failed = 0
+    for request in requests:
+        outcome = convert_request(request)
+        failed += outcome["status"] != "ok"
+        print(json.dumps(outcome, ensure_ascii=False))
+    return 1 if failed else 0
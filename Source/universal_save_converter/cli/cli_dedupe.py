@@ -0,0 +1,42 @@
+# cli/cli_dedupe.py
+
+import json
+import os
+import sys
+import time
+from core.dedupe import find_duplicates, link_duplicates
+from cli.cli_batch import collect_inputs
+
+
+def run_dedupe_command(args) -> int:
+    """`usc dedupe`: report clusters of duplicate saves as JSON, optionally hard-linking exact copies."""
+    paths = []
+    for pattern in args.inputs:
+        paths.extend(path for path, _ in collect_inputs(pattern, args.recursive))
+    if not paths:
+        print("usc: no input files", file=sys.stderr)
+        return 1
+
+    started = time.perf_counter()
+    clusters, hashed = find_duplicates(paths, canonical=not args.exact, workers=args.workers,
+                                       min_size=args.min_size)
+    report = {"files": len(paths), "hashed": hashed, "clusters": [cluster.as_dict() for cluster in clusters]}
+    report["duplicate_bytes"] = sum(
+        cluster.size * (sum(map(len, cluster.groups.values())) - 1) for cluster in clusters)
+
+    if args.link:
+        report["links"] = [record for cluster in clusters for group in cluster.groups.values()
+                           if len(group) > 1 for record in link_duplicates(group)]
+    report["seconds"] = round(time.perf_counter() - started, 3)
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.report:
+        os.makedirs(os.path.dirname(os.path.abspath(args.report)), exist_ok=True)
+        with open(args.report, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+    variants = sum(1 for cluster in clusters if cluster.byte_order_variants)
+    print(f"usc: {len(paths)} files, {hashed} hashed, {len(clusters)} duplicate clusters "
+          f"({variants} with byte-order variants)", file=sys.stderr)
+    return 0
@@ -0,0 +1,40 @@
+# cli/cli_diff.py
+
+import json
+import sys
+from core.exceptions import ConversionError
+from systems.n64.n64_diff import diff_files, parse_order
+
+# Bytes of each side shown per run with --preview
+PREVIEW_BYTES = 16
+
+
+def run_diff_command(args) -> int:
+    """`usc diff`: compare two saves and print the differing byte ranges (exit 1 if they differ)."""
+    try:
+        normalize = args.normalize if args.normalize in (None, "auto") else parse_order(args.normalize)
+        diff = diff_files(args.a, args.b, normalize, srm=args.srm, merge_gap=args.gap)
+    except (ConversionError, ValueError) as e:
+        print(f"usc: {e}", file=sys.stderr)
+        return 2
+
+    report = diff.as_dict()
+    if args.limit is not None:
+        report["runs_total"] = len(report["runs"])
+        report["runs"] = report["runs"][:args.limit]
+    if args.preview:
+        for run in report["runs"]:
+            run["a"], run["b"] = diff.preview(run["start"], run["end"], PREVIEW_BYTES)
+
+    if args.text:
+        for run in report["runs"]:
+            line = f"{run['start']:#08x}-{run['end']:#08x}  {run['length']:>7} bytes  {run['region'] or ''}"
+            print(line.rstrip())
+            if args.preview:
+                print(f"    a: {run['a']}\n    b: {run['b']}")
+        orders = ", ".join(f"{region}: {order}" for region, order in report["byte_order"].items())
+        print(f"{report['differing_bytes']} differing bytes in {len(diff.runs)} runs"
+              + (f" (b swapped: {orders})" if orders else ""))
+    else:
+        print(json.dumps(report, ensure_ascii=False))
+    return 1 if diff.runs else 0
@@ -0,0 +1,182 @@
+# cli/cli_main.py
+
+import argparse
+import importlib
+from cli.cli_args import BYTESWAP_CHOICES
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the `usc` argument parser. Command modules are imported lazily."""
+    parser = argparse.ArgumentParser(prog="usc", description="Universal Save Converter command line.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    # --- usc convert ---
+    convert = commands.add_parser("convert", help="Convert one N64 save and print a JSON result.")
+    convert.add_argument("input", nargs="?", help="Save file to convert.")
+    convert.add_argument("-o", "--output", help="Output file or directory (default: next to the input).")
+    convert.add_argument("--src", help="Source system: native, pj64, ra, wii.")
+    convert.add_argument("--tgt", help="Target system: native, pj64, ra, wii.")
+    convert.add_argument("--src-type", help="Source type (default: detect from extension and content).")
+    convert.add_argument("--tgt-type", help="Target type; required when more than one is valid.")
+    convert.add_argument("--byteswap", choices=BYTESWAP_CHOICES, default="default", help="Byte swap: default (per table), auto (detect the input byte order), 2 or 4.")
+    convert.add_argument("--verify", action="store_true",
+                         help="Convert the output back in memory and fail unless the input comes back unchanged.")
+    convert.add_argument("--json", metavar="REQUEST",
+                         help="JSON request object or list using the flag names as keys; '-' reads stdin.")
+    convert.set_defaults(handler="cli.cli_convert:run_convert_command")
+
+    # --- usc batch ---
+    batch = commands.add_parser("batch", help="Convert a folder or glob of N64 saves in parallel.")
+    batch.add_argument("input", help="Input directory or glob pattern (quote globs).")
+    batch.add_argument("--src", required=True, help="Source system: native, pj64, ra, wii.")
+    batch.add_argument("--tgt", required=True, help="Target system: native, pj64, ra, wii.")
+    batch.add_argument("--src-type", help="Force the source type (eep, sra, fla, mpk, srm); default detects from extension and content.")
+    batch.add_argument("--tgt-type", help="Target type when more than one is valid (default for SRM sources: "
+                                          "the section holding data).")
+    batch.add_argument("-o", "--output-dir", required=True, help="Directory for converted saves.")
+    batch.add_argument("-r", "--recursive", action="store_true", help="Recurse into subdirectories.")
+    batch.add_argument("--byteswap", choices=BYTESWAP_CHOICES, default="default", help="Byte swap: default (per table), auto (detect the input byte order), 2 or 4.")
+    batch.add_argument("--rom-dir", help="ROM folder; saves named like a ROM take the save type its header resolves to.")
+    batch.add_argument("-j", "--workers", type=int, help="Worker count (default: CPU count).")
+    batch.add_argument("--threads", action="store_true", help="Use a thread pool instead of processes.")
+    batch.add_argument("--chunksize", type=int, help="Tasks per worker submission (default: auto).")
+    batch.add_argument("--no-cache", action="store_true", help="Always convert; do not read or fill the result cache.")
+    batch.add_argument("--cache-dir", help="Result cache directory (default: per-user cache folder).")
+    batch.add_argument("--cache-size", type=int, default=256, metavar="MB", help="Result cache size limit (default: 256).")
+    batch.add_argument("--cache-link", action="store_true",
+                       help="Hard-link cached outputs instead of copying (do not edit outputs in place).")
+    batch.add_argument("--link", choices=("copy", "hardlink", "reflink"), default="copy",
+                       help="How to write saves already in the target format: copy (kernel copy), "
+                            "hardlink or reflink (copy-on-write clone); falls back to copy.")
+    batch.add_argument("--verify", action="store_true",
+                       help="Round-trip check every conversion in memory; saves that do not survive it fail.")
+    batch.add_argument("--report", help="Summary report path (default: <output-dir>/batch_report.json).")
+    batch.add_argument("--catalog", nargs="?", const="", metavar="DB",
+                       help="Take a folder's saves and types from the save catalog (rescanning only changed "
+                            "files) and record the conversions there; DB defaults to the per-user catalog.")
+    batch.add_argument("--changed", action="store_true",
+                       help="With --catalog, skip saves already converted to the same output since they last changed.")
+    batch.set_defaults(handler="cli.cli_batch:run_batch_command")
+
+    # --- usc watch ---
+    watch = commands.add_parser("watch", help="Watch folders and convert N64 saves as they are written.")
+    watch.add_argument("input", nargs="?", help="Folder to watch (or use --map).")
+    watch.add_argument("--src", help="Source system of the watched folder: native, pj64, ra, wii.")
+    watch.add_argument("--tgt", help="Target system: native, pj64, ra, wii.")
+    watch.add_argument("-o", "--output-dir", help="Folder converted saves are written to.")
+    watch.add_argument("--map", nargs=4, action="append", metavar=("SRC_DIR", "SRC", "TGT_DIR", "TGT"),
+                       help="Watch SRC_DIR (system SRC) and write to TGT_DIR for system TGT; repeatable. "
+                            "Reverse pairs keep two folders in sync.")
+    watch.add_argument("--tgt-type", help="Target type when more than one is valid (default for SRM sources: "
+                                          "the section holding data).")
+    watch.add_argument("-r", "--recursive", action="store_true", help="Watch subdirectories too.")
+    watch.add_argument("--byteswap", choices=BYTESWAP_CHOICES, default="default", help="Byte swap: default (per table), auto (detect the input byte order), 2 or 4.")
+    watch.add_argument("--debounce", type=float, default=0.75, metavar="SECONDS",
+                       help="Wait until a file is unchanged this long before converting (default: 0.75).")
+    watch.add_argument("--interval", type=float, default=1.0, metavar="SECONDS",
+                       help="Polling interval (default: 1.0).")
+    watch.add_argument("--poll", action="store_true", help="Poll even if the watchdog package is installed.")
+    watch.add_argument("--initial", action="store_true", help="Also convert the saves already in the folders.")
+    watch.add_argument("-j", "--workers", type=int, default=2, help="Conversion threads (default: 2).")
+    watch.add_argument("--catalog", nargs="?", const="", metavar="DB",
+                       help="Keep the save catalog up to date and take source types from it; with --initial, "
+                            "only saves changed since their last conversion are converted.")
+    watch.set_defaults(handler="cli.cli_watch:run_watch_command")
+
+    # --- usc sync ---
+    sync = commands.add_parser("sync", help="Keep two N64 save folders in step, converting whichever side changed.")
+    sync.add_argument("a_dir", help="First save folder (side a).")
+    sync.add_argument("a_system", help="System of side a: native, pj64, ra, wii.")
+    sync.add_argument("b_dir", help="Second save folder (side b).")
+    sync.add_argument("b_system", help="System of side b: native, pj64, ra, wii.")
+    sync.add_argument("--prefer", choices=("none", "newer", "a", "b"), default="none",
+                      help="Settle saves changed on both sides: newer, a or b (default: report a conflict).")
+    sync.add_argument("--dry-run", action="store_true", help="Print the planned actions without writing anything.")
+    sync.add_argument("--manifest", help="Sync manifest path (default: per-user cache folder, one per folder pair).")
+    sync.add_argument("--flat", action="store_true", help="Do not descend into subdirectories.")
+    sync.add_argument("--byteswap", choices=BYTESWAP_CHOICES, default="default", help="Byte swap: default (per table), auto (detect the input byte order), 2 or 4.")
+    sync.set_defaults(handler="cli.cli_sync:run_sync_command")
+
+    # --- usc catalog ---
+    catalog = commands.add_parser("catalog", help="Index save folders in a SQLite catalog and query it.")
+    catalog.add_argument("folders", nargs="*", help="Folders to (re)scan first; only changed files are read.")
+    catalog.add_argument("--system", help="System of the scanned folders (native, pj64, ra, wii); also a filter.")
+    catalog.add_argument("-r", "--recursive", action="store_true", help="Scan subdirectories too.")
+    catalog.add_argument("--rom-dir", help="ROM folder to match saves against (for --no-rom).")
+    catalog.add_argument("--type", help="Only saves of this type (eep, sra, fla, mpk, srm).")
+    catalog.add_argument("--section", help="Only saves holding data of this type, e.g. --type srm --section fla.")
+    catalog.add_argument("--no-rom", action="store_true",
+                         help="Only saves checked against a --rom-dir (in this or an earlier scan) "
+                              "that have no matching ROM.")
+    catalog.add_argument("--unconverted", action="store_true",
+                         help="Only saves not converted since their content last changed.")
+    catalog.add_argument("--all", action="store_true", help="Include files that are not saves.")
+    catalog.add_argument("--count", action="store_true", help="Print only the number of matches.")
+    catalog.add_argument("--db", help="Catalog database path (default: per-user cache folder).")
+    catalog.set_defaults(handler="cli.cli_catalog:run_catalog_command")
+
+    # --- usc dedupe ---
+    dedupe = commands.add_parser("dedupe", help="Find duplicate saves, including copies in another byte order.")
+    dedupe.add_argument("inputs", nargs="+", help="Folders or glob patterns (quote globs).")
+    dedupe.add_argument("-r", "--recursive", action="store_true", help="Recurse into subdirectories.")
+    dedupe.add_argument("--exact", action="store_true",
+                        help="Only byte-identical copies (skip the byte-order normalised hash).")
+    dedupe.add_argument("--link", action="store_true",
+                        help="Replace byte-identical copies with hard links to the first (by path). Linked saves "
+                             "share storage, so an emulator writing one changes all of them.")
+    dedupe.add_argument("--min-size", type=int, default=1, metavar="BYTES", help="Ignore smaller files (default: 1).")
+    dedupe.add_argument("-j", "--workers", type=int, help="Hashing threads (default: CPU count + 4, at most 32).")
+    dedupe.add_argument("--report", help="Write the JSON report here instead of stdout.")
+    dedupe.set_defaults(handler="cli.cli_dedupe:run_dedupe_command")
+
+    # --- usc selftest ---
+    selftest = commands.add_parser("selftest", help="Round-trip every N64 conversion plan in memory.")
+    selftest.add_argument("--byteswap", action="append", choices=BYTESWAP_CHOICES,
+                          help="Only check this swap choice: default, auto, 2 or 4 (repeatable; default: all).")
+    selftest.add_argument("--seed", type=int, default=0, help="Seed for the generated test saves (default: 0).")
+    selftest.set_defaults(handler="cli.cli_selftest:run_selftest_command")
+
+    # --- usc diff ---
+    diff = commands.add_parser("diff", help="Compare two saves and list the differing byte ranges.")
+    diff.add_argument("a", help="First save.")
+    diff.add_argument("b", help="Second save.")
+    diff.add_argument("--normalize", metavar="ORDER",
+                      help="Swap the second save before comparing: 2, 4, 2+4, or auto (per SRM section, the "
+                           "byte order that matches best).")
+    diff.add_argument("--srm", action=argparse.BooleanOptionalAction, default=None,
+                      help="Label runs with their SRM section (default: when both files are SRM sized).")
+    diff.add_argument("--gap", type=int, default=0, metavar="BYTES",
+                      help="Merge runs separated by at most this many equal bytes (default: 0).")
+    diff.add_argument("--limit", type=int, help="List at most this many runs.")
+    diff.add_argument("--preview", action="store_true", help="Show the first bytes of each run from both files.")
+    diff.add_argument("--text", action="store_true", help="Print a readable table instead of JSON.")
+    diff.set_defaults(handler="cli.cli_diff:run_diff_command")
+
+    # --- usc explode ---
+    explode = commands.add_parser("explode", help="Split a RetroArch SRM into its EEP/MPK/SRA/FLA saves.")
+    explode.add_argument("input", help="RetroArch .srm file.")
+    explode.add_argument("--tgt", required=True, help="Target system for the parts: native, pj64, ra, wii.")
+    explode.add_argument("-o", "--output-dir", help="Directory for the parts (default: next to the input).")
+    explode.add_argument("--all", action="store_true", help="Also write blank (unused) sections.")
+    explode.add_argument("--byteswap", choices=BYTESWAP_CHOICES, default="default", help="Byte swap: default (per table), auto (detect the input byte order), 2 or 4.")
+    explode.add_argument("--strict", action="store_true", help="Reject inputs that are not exactly SRM sized.")
+    explode.set_defaults(handler="cli.cli_srm:run_explode_command")
+
+    # --- usc pack ---
+    pack = commands.add_parser("pack", help="Merge EEP/MPK/SRA/FLA saves into one RetroArch SRM.")
+    pack.add_argument("inputs", nargs="+", help="Save files, one per type (detected from extension and content).")
+    pack.add_argument("--src", required=True, help="System the inputs were saved by: native, pj64, ra, wii.")
+    pack.add_argument("-o", "--output", required=True, help="Output .srm file.")
+    pack.add_argument("--byteswap", choices=BYTESWAP_CHOICES, default="default", help="Byte swap: default (per table), auto (detect the input byte order), 2 or 4.")
+    pack.add_argument("--strict", action="store_true", help="Reject inputs of unexpected size.")
+    pack.set_defaults(handler="cli.cli_srm:run_pack_command")
+
+    return parser
+
+
+def run_cli(argv=None) -> int:
+    """Parse argv, run the selected command and return its exit code."""
+    args = build_parser().parse_args(argv)
+    module_name, func_name = args.handler.split(":")
+    module = importlib.import_module(module_name)
+    return getattr(module, func_name)(args)
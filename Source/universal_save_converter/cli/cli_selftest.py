@@ -0,0 +1,18 @@
+# cli/cli_selftest.py
+
+import json
+import sys
+from systems.n64.n64_verify import SELFTEST_SWAPS, selftest
+from cli.cli_args import BYTESWAP_CHOICES
+
+
+def run_selftest_command(args) -> int:
+    """`usc selftest`: round-trip every conversion plan in memory and print the failures as JSON lines."""
+    wanted = {BYTESWAP_CHOICES[choice] for choice in args.byteswap or BYTESWAP_CHOICES}
+    swaps = [choice for choice in SELFTEST_SWAPS if choice in wanted]
+    report = selftest(swaps, seed=args.seed)
+    for failure in report["failures"]:
+        print(json.dumps(failure, ensure_ascii=False))
+    print(f"usc: {report['checked']} round trips, {report['failed']} failed in {report['seconds']}s",
+          file=sys.stderr)
+    return 1 if report["failed"] else 0
@@ -0,0 +1,43 @@
+# cli/cli_srm.py
+
+import json
+import os
+import sys
+from core.conversion_types import ConversionOptions
+from core.exceptions import ConversionError
+from systems.n64.n64_srm import explode_srm, pack_srm
+from cli.cli_args import BYTESWAP_CHOICES, parse_system
+from cli.cli_convert import error_record, result_record
+
+
+def run_explode_command(args) -> int:
+    """`usc explode`: split a RetroArch SRM into its populated saves, printing JSON lines."""
+    out_dir = args.output_dir or os.path.dirname(os.path.abspath(args.input))
+    try:
+        tgt = parse_system(args.tgt)
+        os.makedirs(out_dir, exist_ok=True)
+        options = ConversionOptions(byteswap_option=BYTESWAP_CHOICES[args.byteswap], strict_size=args.strict)
+        results = explode_srm(args.input, out_dir, tgt, options, include_blank=args.all)
+    except (ConversionError, ValueError, OSError) as e:
+        print(json.dumps(error_record(args.input, e), ensure_ascii=False))
+        return 1
+
+    if not results:
+        print(f"usc: {args.input} has no populated sections", file=sys.stderr)
+    for result in results:
+        print(json.dumps(result_record(args.input, result), ensure_ascii=False))
+    return 0
+
+
+def run_pack_command(args) -> int:
+    """`usc pack`: merge EEP/MPK/SRA/FLA saves into one RetroArch SRM, printing a JSON line."""
+    try:
+        src = parse_system(args.src)
+        options = ConversionOptions(byteswap_option=BYTESWAP_CHOICES[args.byteswap], strict_size=args.strict)
+        result = pack_srm(args.inputs, args.output, src, options)
+    except (ConversionError, ValueError) as e:
+        print(json.dumps(error_record(args.inputs, e), ensure_ascii=False))
+        return 1
+
+    print(json.dumps(result_record(args.inputs, result), ensure_ascii=False))
+    return 0
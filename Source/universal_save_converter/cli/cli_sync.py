@@ -0,0 +1,35 @@
+# cli/cli_sync.py
+
+import json
+import os
+import sys
+from core.conversion_types import ConversionOptions
+from systems.n64.n64_sync import SyncEngine
+from cli.cli_args import BYTESWAP_CHOICES, parse_system
+
+
+def run_sync_command(args) -> int:
+    """`usc sync`: bring two save folders level, printing a JSON line per action and a summary."""
+    try:
+        for folder in (args.a_dir, args.b_dir):
+            if not os.path.isdir(folder):
+                raise ValueError(f"not a folder: {folder}")
+        a_system, b_system = parse_system(args.a_system), parse_system(args.b_system)
+    except ValueError as e:
+        print(f"usc: {e}", file=sys.stderr)
+        return 2
+
+    engine = SyncEngine(
+        args.a_dir, a_system, args.b_dir, b_system, manifest_path=args.manifest,
+        options=ConversionOptions(byteswap_option=BYTESWAP_CHOICES[args.byteswap]),
+        prefer=args.prefer, recursive=not args.flat
+    )
+    records = engine.sync(dry_run=args.dry_run)
+
+    summary = {}
+    for record in records:
+        print(json.dumps(record, ensure_ascii=False))
+        key = record["action"] if record["status"] in ("ok", "planned") else record["status"]
+        summary[key] = summary.get(key, 0) + 1
+    print(json.dumps({"summary": summary, "dry_run": args.dry_run, "manifest": engine.manifest.path}))
+    return 1 if summary.get("error") or summary.get("conflict") else 0
@@ -0,0 +1,155 @@
+# cli/cli_watch.py
+
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from core.conversion_types import ConversionOptions
+from core.exceptions import ConversionError
+from core.folder_watcher import FolderWatcher
+from systems.n64.n64_catalog import open_catalog
+from systems.n64.n64_constants import SAVE_TYPE_EXT, SaveType
+from systems.n64.n64_engine import convert_file
+from systems.n64.n64_resolve import resolve_types
+from cli.cli_args import BYTESWAP_CHOICES, parse_save_type, parse_system
+from cli.cli_convert import error_record, result_record
+
+
+class WatchMapping:
+    """One watched folder pair: saves from src_dir (system src) go to tgt_dir for system tgt."""
+    __slots__ = ("src_dir", "src", "tgt_dir", "tgt")
+
+    def __init__(self, src_dir, src, tgt_dir, tgt):
+        self.src_dir = os.path.abspath(src_dir)
+        self.src = src
+        self.tgt_dir = os.path.abspath(tgt_dir)
+        self.tgt = tgt
+
+    def __repr__(self):
+        return f"WatchMapping({self.src_dir} [{self.src.name}] → {self.tgt_dir} [{self.tgt.name}])"
+
+    def covers(self, path, recursive=False) -> bool:
+        parent = os.path.dirname(path)
+        if recursive:
+            return os.path.commonpath((parent, self.src_dir)) == self.src_dir
+        return parent == self.src_dir
+
+
+def parse_mappings(args) -> list[WatchMapping]:
+    """Mappings from --map SRC_DIR SRC TGT_DIR TGT (repeatable) or the positional shorthand."""
+    specs = list(args.map or [])
+    if args.input:
+        if not (args.src and args.tgt and args.output_dir):
+            raise ValueError("a watched folder needs --src, --tgt and -o")
+        specs.append((args.input, args.src, args.output_dir, args.tgt))
+    if not specs:
+        raise ValueError("nothing to watch; pass a folder or --map")
+    mappings = []
+    for src_dir, src, tgt_dir, tgt in specs:
+        if not os.path.isdir(src_dir):
+            raise ValueError(f"not a folder: {src_dir}")
+        mappings.append(WatchMapping(src_dir, parse_system(src), tgt_dir, parse_system(tgt)))
+    return mappings
+
+
+def emit(record):
+    print(json.dumps(record, ensure_ascii=False), flush=True)
+
+
+def run_watch_command(args) -> int:
+    """`usc watch`: convert saves as they appear or change, printing a JSON line per conversion."""
+    try:
+        mappings = parse_mappings(args)
+        forced_tgt_type = parse_save_type(args.tgt_type) if args.tgt_type else None
+    except ValueError as e:
+        print(f"usc: {e}", file=sys.stderr)
+        return 2
+    options = ConversionOptions(byteswap_option=BYTESWAP_CHOICES[args.byteswap])
+    for mapping in mappings:
+        os.makedirs(mapping.tgt_dir, exist_ok=True)
+
+    catalog = open_catalog(args.catalog or None) if args.catalog is not None else None
+    executor = ThreadPoolExecutor(max_workers=max(1, args.workers))
+    in_flight = set()
+    pending = {}  # out_path → (path, mapping) that settled again while out_path was being converted
+    in_flight_lock = threading.Lock()
+
+    def target_path(path, mapping):
+        """Output path for path, or None if it is not a save to convert (now)."""
+        known_type = None
+        if catalog is not None:
+            row = catalog.update(path, mapping.src.name)
+            if row is None or row["save_type"] is None:
+                return None
+            known_type = SaveType[row["save_type"]]
+        src_type, tgt_type, error = resolve_types(path, mapping.src, mapping.tgt, known_type, forced_tgt_type)
+        if error:
+            if src_type is not None:
+                emit({"input": path, "status": "skipped", "error": error})
+            return None
+        stem = os.path.splitext(os.path.basename(path))[0]
+        out_path = os.path.join(mapping.tgt_dir, stem + SAVE_TYPE_EXT[tgt_type])
+        if catalog is not None and catalog.is_converted(path, out_path):
+            return None  # same content as last time (touched, or --initial over converted saves)
+        return out_path, src_type, tgt_type
+
+    def convert(path, mapping, watcher):
+        try:
+            target = target_path(path, mapping)
+        except (ConversionError, OSError) as e:  # e.g. deleted between settling and now
+            emit(error_record(path, e))
+            return
+        if target is None:
+            return
+        out_path, src_type, tgt_type = target
+        with in_flight_lock:
+            if out_path in in_flight:
+                # Convert the newer content once the running conversion is done
+                pending[out_path] = (path, mapping)
+                return
+            in_flight.add(out_path)
+        try:
+            result = convert_file(path, out_path, mapping.src, src_type, mapping.tgt, tgt_type, options)
+            # Our own output must not be converted back by a reverse mapping
+            watcher.mark_handled(out_path)
+            if catalog is not None:
+                catalog.record_conversion(path, out_path, result.plan_key, mapping.tgt.name, tgt_type.name)
+                catalog.update(out_path, mapping.tgt.name)
+            emit(result_record(path, result))
+        except (ConversionError, OSError) as e:
+            emit(error_record(path, e))
+        finally:
+            with in_flight_lock:
+                in_flight.discard(out_path)
+                rerun = pending.pop(out_path, None)
+            if rerun is not None:
+                try:
+                    executor.submit(convert, *rerun, watcher)
+                except RuntimeError:
+                    pass  # shutting down
+
+    def on_ready(path):
+        for mapping in mappings:
+            if mapping.covers(path, args.recursive):
+                executor.submit(convert, path, mapping, watcher)
+
+    watcher = FolderWatcher(
+        sorted({mapping.src_dir for mapping in mappings}), on_ready,
+        debounce=args.debounce, interval=args.interval, recursive=args.recursive,
+        backend="poll" if args.poll else None
+    )
+    if not args.initial:
+        watcher.snapshot()
+    print(f"usc: watching {len(mappings)} folder mapping(s) with {watcher.backend}; Ctrl+C to stop",
+          file=sys.stderr)
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.stop()
+        executor.shutdown(wait=True)
+        if catalog is not None:
+            catalog.close()
+    return 0
@@ -0,0 +1,108 @@
+# core/batch_runner.py
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from core.conversion_types import ConversionOptions
+from core.exceptions import ConversionError
+
+
+class BatchTask:
+    """
+    One file conversion for the batch runner.
+    convert must be a module-level function (picklable for process pools)
+    with the signature of n64_engine.convert_file. cache and link_mode, if
+    set, are passed through to convert as keyword arguments.
+    """
+    __slots__ = ("convert", "path", "out_path", "src", "src_type", "tgt", "tgt_type", "options", "cache",
+                 "link_mode")
+
+    def __init__(self, convert, path, out_path, src, src_type, tgt, tgt_type, options=None, cache=None,
+                 link_mode=None):
+        self.convert = convert
+        self.path = path
+        self.out_path = out_path
+        self.src = src
+        self.src_type = src_type
+        self.tgt = tgt
+        self.tgt_type = tgt_type
+        self.options = options or ConversionOptions()
+        self.cache = cache
+        self.link_mode = link_mode
+
+
+def run_task(task: BatchTask) -> dict:
+    """Run a single BatchTask and return its report entry. Never raises ConversionError."""
+    started = time.perf_counter()
+    entry = {"input": task.path, "output": task.out_path}
+    try:
+        extra = {"cache": task.cache} if task.cache is not None else {}
+        if task.link_mode is not None:
+            extra["link_mode"] = task.link_mode
+        result = task.convert(task.path, task.out_path, task.src, task.src_type,
+                              task.tgt, task.tgt_type, task.options, **extra)
+    except (ConversionError, OSError) as e:
+        entry.update(status="error", error=str(e))
+    else:
+        entry.update(
+            status="ok",
+            plan=result.plan_key,
+            size=result.tgt_size,
+            swap_size=result.swap_size,
+            swap_confidence=result.swap_confidence,
+            cached=result.cached,
+            copy_method=result.copy_method,
+            verified=result.verified,
+            warnings=[message for level, message in result.messages if level == "WARN"]
+        )
+    entry["seconds"] = round(time.perf_counter() - started, 6)
+    return entry
+
+
+def run_batch(tasks, workers=None, use_threads=False, chunksize=None, on_result=None) -> dict:
+    """
+    Run tasks across a process (or thread) pool and return a summary report.
+
+    Tasks are submitted in chunks of chunksize to keep inter-process overhead
+    low; on_result, if given, is called with each report entry as it completes.
+    """
+    tasks = list(tasks)
+    workers = max(1, workers or os.cpu_count() or 1)
+    if chunksize is None:
+        chunksize = max(1, len(tasks) // (workers * 4))
+
+    started = time.perf_counter()
+    results = []
+
+    def collect(entries):
+        for entry in entries:
+            results.append(entry)
+            if on_result:
+                on_result(entry)
+
+    if workers == 1 or len(tasks) <= 1:
+        collect(map(run_task, tasks))
+    else:
+        executor_cls = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+        with executor_cls(max_workers=workers) as executor:
+            collect(executor.map(run_task, tasks, chunksize=chunksize))
+
+    failed = sum(1 for entry in results if entry["status"] != "ok")
+    return {
+        "total": len(results),
+        "converted": len(results) - failed,
+        "failed": failed,
+        "cached": sum(1 for entry in results if entry.get("cached")),
+        "copied": sum(1 for entry in results if entry.get("copy_method")),
+        "workers": workers,
+        "executor": "thread" if use_threads else "process",
+        "seconds": round(time.perf_counter() - started, 3),
+        "results": results,
+    }
+
+
+def write_report(report: dict, path: str) -> None:
+    """Write a batch summary report as JSON."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
@@ -0,0 +1,110 @@
+# core/byte_compare.py
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; chunked memoryview compares are used instead
+    np = None
+
+# Block size for the pure-Python scan: equal blocks are skipped with one memcmp each
+COMPARE_BLOCK = 4096
+
+
+def first_difference(a, b) -> int | None:
+    """
+    Offset of the first byte where a and b differ, or None if they are
+    equal. A length mismatch counts as a difference at the shorter length.
+    """
+    a = memoryview(a).cast("B")
+    b = memoryview(b).cast("B")
+    length = min(len(a), len(b))
+    # memoryview == compares element by element; bytes.startswith is one memcmp
+    head = a[:length].tobytes()
+    if head.startswith(b[:length]):
+        return None if len(a) == len(b) else length
+    if np is not None:
+        return int(np.flatnonzero(np.frombuffer(head, np.uint8) != np.frombuffer(b[:length], np.uint8))[0])
+    for start in range(0, length, COMPARE_BLOCK):
+        end = min(start + COMPARE_BLOCK, length)
+        if not head.startswith(b[start:end], start):
+            return next(i for i in range(start, end) if head[i] != b[i])
+    return length
+
+
+# Maps every byte to a 0/1 "differs" flag (used on XORed data)
+_NONZERO = bytes(1) + bytes([1]) * 255
+
+
+def difference_flags(a, b) -> bytes:
+    """
+    One byte per position of the common length: 1 where a and b differ,
+    0 where they match. NumPy compares directly; otherwise both buffers are
+    XORed as big integers and the result mapped to flags with translate().
+    """
+    a = memoryview(a).cast("B")
+    b = memoryview(b).cast("B")
+    length = min(len(a), len(b))
+    if np is not None:
+        return (np.frombuffer(a[:length], np.uint8) != np.frombuffer(b[:length], np.uint8)).view(np.uint8).tobytes()
+    xor = int.from_bytes(a[:length], "big") ^ int.from_bytes(b[:length], "big")
+    return xor.to_bytes(length, "big").translate(_NONZERO)
+
+
+def runs_from_flags(flags: bytes, merge_gap: int = 0) -> list[tuple[int, int]]:
+    """
+    [(start, end)] half-open runs of 1 flags, found with C-level find()
+    calls (one pair per run). Runs separated by merge_gap or fewer
+    matching bytes are joined.
+    """
+    runs = []
+    start = flags.find(1)
+    while start != -1:
+        end = flags.find(0, start)
+        if end == -1:
+            end = len(flags)
+        if runs and start - runs[-1][1] <= merge_gap:
+            runs[-1] = (runs[-1][0], end)
+        else:
+            runs.append((start, end))
+        start = flags.find(1, end)
+    return runs
+
+
+def diff_runs(a, b, merge_gap: int = 0) -> list[tuple[int, int]]:
+    """
+    Differing regions of a and b as [(start, end)] runs. Bytes past the
+    end of the shorter buffer count as one differing run.
+    """
+    length = min(len(a), len(b))
+    if first_difference(memoryview(a)[:length], memoryview(b)[:length]) is None:
+        runs = []
+    else:
+        runs = runs_from_flags(difference_flags(a, b), merge_gap)
+    if len(a) != len(b):
+        if runs and length - runs[-1][1] <= merge_gap:
+            runs[-1] = (runs[-1][0], max(len(a), len(b)))
+        else:
+            runs.append((length, max(len(a), len(b))))
+    return runs
+
+
+def split_runs(runs, regions) -> list[tuple[int, int, str | None]]:
+    """
+    Cut runs at region boundaries: regions is [(name, start, end)] sorted
+    by start; returns [(start, end, region name or None)].
+    """
+    pieces = []
+    for start, end in runs:
+        position = start
+        for name, region_start, region_end in regions:
+            if region_end <= position or region_start >= end:
+                continue
+            if region_start > position:
+                pieces.append((position, region_start, None))
+            piece_end = min(end, region_end)
+            pieces.append((max(position, region_start), piece_end, name))
+            position = piece_end
+            if position >= end:
+                break
+        if position < end:
+            pieces.append((position, end, None))
+    return pieces
@@ -0,0 +1,33 @@
+# core/byte_stats.py
+
+import math
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the sampled estimate is used instead
+    np = None
+
+# Bytes sampled for the pure-Python entropy estimate
+ENTROPY_SAMPLE = 4096
+
+
+def byte_entropy(data, start: int = 0, end: int | None = None) -> float:
+    """
+    Shannon entropy of data[start:end] in bits per byte (0.0 to 8.0).
+    Exact with NumPy; otherwise estimated from an evenly strided sample
+    of at most ENTROPY_SAMPLE bytes.
+    """
+    view = memoryview(data).cast("B")[start:end]
+    length = len(view)
+    if not length:
+        return 0.0
+
+    if np is not None:
+        counts = np.bincount(np.frombuffer(view, dtype=np.uint8), minlength=256)
+        p = counts[counts > 0] / length
+        return float(-(p * np.log2(p)).sum())
+
+    sample = view[::max(1, length // ENTROPY_SAMPLE)].tobytes()
+    total = len(sample)
+    return -sum(count / total * math.log2(count / total) for count in Counter(sample).values())
@@ -0,0 +1,89 @@
+# core/conversion_types.py
+
+
+class ConversionOptions:
+    """
+    User-selectable conversion settings.
+    Mirrors the GUI controls so batch jobs and the GUI share one code path.
+    fill_byte overrides the padding byte (None keeps the blank 0x00 default).
+    strict_size rejects inputs whose size the conversion plan does not expect.
+    verify converts every output back in memory and raises VerificationError
+    unless the source bytes it used come back unchanged.
+    Immutable and compared by value, like the frozen dataclass it replaces
+    (a plain class keeps dataclasses out of the CLI's start-up imports).
+    """
+    __slots__ = ("byteswap_option", "trim_pad_option", "allow_raw_copy", "fill_byte", "strict_size", "verify")
+
+    def __init__(self, byteswap_option: str = "Default", trim_pad_option: bool = False,
+                 allow_raw_copy: bool = True, fill_byte: int | None = None, strict_size: bool = False,
+                 verify: bool = False):
+        values = (byteswap_option, trim_pad_option, allow_raw_copy, fill_byte, strict_size, verify)
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"ConversionOptions is immutable; cannot set {name}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"ConversionOptions is immutable; cannot delete {name}")
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other):
+        if type(other) is not ConversionOptions:
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self):
+        return hash(self._values())
+
+    def __reduce__(self):
+        # Rebuild through __init__ (process pools pickle options)
+        return ConversionOptions, self._values()
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"ConversionOptions({fields})"
+
+
+class ConversionResult:
+    """
+    Outcome of a headless conversion.
+
+    messages holds (level, message) pairs in the order the engine produced
+    them, so a front end can replay them through its own logger.
+    cached is True when out_path was filled from a ResultCache; data is
+    then None because the output was never loaded into memory.
+    swap_confidence is set when the byte order was detected ("Auto" swap).
+    copy_method names how an identity conversion was written (e.g.
+    "copy_file_range", "hardlink"); data is None for those too.
+    verified is True once the output has passed a round-trip check.
+    """
+    __slots__ = ("data", "extension", "tgt_size", "offset", "swap_size", "plan_key", "out_path", "messages",
+                 "cached", "swap_confidence", "copy_method", "verified")
+
+    def __init__(self, data: bytearray, extension: str, tgt_size: int, offset: int, swap_size: int,
+                 plan_key: str | None = None, out_path: str | None = None,
+                 messages: list[tuple[str, str]] | None = None, cached: bool = False,
+                 swap_confidence: float | None = None, copy_method: str | None = None, verified: bool = False):
+        self.data = data
+        self.extension = extension
+        self.tgt_size = tgt_size
+        self.offset = offset
+        self.swap_size = swap_size
+        self.plan_key = plan_key
+        self.out_path = out_path
+        self.messages = messages if messages is not None else []
+        self.cached = cached
+        self.swap_confidence = swap_confidence
+        self.copy_method = copy_method
+        self.verified = verified
+
+    def __repr__(self):
+        return (f"ConversionResult(plan_key={self.plan_key!r}, tgt_size={self.tgt_size}, "
+                f"offset={self.offset}, swap_size={self.swap_size}, out_path={self.out_path!r})")
+
+    def note(self, message: str, level: str = "INFO"):
+        """Record a log message for the caller to display."""
+        self.messages.append((level, message))
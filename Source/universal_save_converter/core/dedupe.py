@@ -0,0 +1,127 @@
+# core/dedupe.py
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from core.byte_order import canonical_digest, combine, order_digest
+
+
+def _order_name(order) -> str:
+    return "+".join(f"{width}-byte swap" for width in order) or "as is"
+
+
+def size_buckets(paths, min_size: int = 1) -> dict[int, list[str]]:
+    """
+    Group paths by file size, keeping only sizes shared by two or more
+    distinct files (hard links to one inode count once): a file with a
+    unique size cannot have a duplicate and is never read.
+    """
+    buckets, inodes = {}, set()
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        if stat.st_size < min_size or (stat.st_dev, stat.st_ino) in inodes:
+            continue
+        inodes.add((stat.st_dev, stat.st_ino))
+        buckets.setdefault(stat.st_size, []).append(path)
+    return {size: group for size, group in buckets.items() if len(group) > 1}
+
+
+def hash_file(path: str, canonical: bool = True) -> tuple:
+    """(path, exact digest, canonical digest, order to canonical form); digests None if unreadable."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return path, None, None, ()
+    exact = order_digest(data)
+    if not canonical:
+        return path, exact, exact, ()
+    digest, order = canonical_digest(data)
+    return path, exact, digest, order
+
+
+class DuplicateCluster:
+    """
+    Saves with the same canonical hash: groups holds
+    {exact hash: [paths]}, orders {exact hash: order to canonical form}.
+    """
+    __slots__ = ("size", "canonical", "groups", "orders")
+
+    def __init__(self, size, canonical):
+        self.size = size
+        self.canonical = canonical
+        self.groups = {}
+        self.orders = {}
+
+    def __repr__(self):
+        return f"DuplicateCluster({self.size} bytes, {sum(map(len, self.groups.values()))} files)"
+
+    @property
+    def byte_order_variants(self) -> bool:
+        """True if the cluster holds the same save in more than one byte order."""
+        return len(self.groups) > 1
+
+    def as_dict(self) -> dict:
+        reference = self.orders[next(iter(self.groups))]
+        return {
+            "size": self.size,
+            "canonical": self.canonical,
+            "groups": [{"hash": digest, "byte_order": _order_name(combine(reference, self.orders[digest])),
+                        "paths": paths} for digest, paths in self.groups.items()],
+        }
+
+
+def find_duplicates(paths, canonical: bool = True, workers=None, min_size: int = 1) -> tuple[list, int]:
+    """
+    Cluster byte-identical (and, with canonical, byte-order equivalent)
+    files. Only files sharing a size are read; those are hashed on a
+    thread pool (hashing and NumPy swaps release the GIL). Returns
+    (clusters with two or more files, number of files hashed).
+    """
+    buckets = size_buckets(paths, min_size)
+    candidates = [path for group in buckets.values() for path in group]
+    workers = max(1, workers or min(32, (os.cpu_count() or 1) + 4))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        hashed = list(executor.map(lambda path: hash_file(path, canonical), candidates))
+
+    sizes = {path: size for size, group in buckets.items() for path in group}
+    clusters = {}
+    for path, exact, digest, order in hashed:
+        if exact is None:
+            continue
+        key = (sizes[path], digest)
+        cluster = clusters.get(key)
+        if cluster is None:
+            cluster = clusters[key] = DuplicateCluster(*key)
+        cluster.groups.setdefault(exact, []).append(path)
+        cluster.orders[exact] = order
+    found = [cluster for cluster in clusters.values() if sum(map(len, cluster.groups.values())) > 1]
+    for cluster in found:
+        for group in cluster.groups.values():
+            group.sort()
+    found.sort(key=lambda cluster: (-cluster.size, min(min(group) for group in cluster.groups.values())))
+    return found, len(candidates)
+
+
+def link_duplicates(paths) -> list[dict]:
+    """
+    Replace paths[1:] (byte-identical copies of paths[0]) with hard links
+    to paths[0]. Each swap is atomic: link beside the target, then replace.
+    Returns one record per path: linked, or the error (e.g. across devices).
+    """
+    keep, records = paths[0], []
+    for path in paths[1:]:
+        tmp_path = f"{path}.{os.getpid()}.link"
+        try:
+            os.link(keep, tmp_path)
+            os.replace(tmp_path, path)
+            records.append({"path": path, "linked_to": keep, "status": "linked"})
+        except OSError as e:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            records.append({"path": path, "linked_to": keep, "status": "error", "error": str(e)})
+    return records
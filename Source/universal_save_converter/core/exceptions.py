@@ -0,0 +1,28 @@
+# core/exceptions.py
+
+class ConversionError(Exception):
+    """Base class for every error raised by the headless conversion engine."""
+
+
+class InvalidInputError(ConversionError):
+    """Raised when the input path or save data is missing or unusable."""
+
+
+class SaveSizeError(InvalidInputError):
+    """Raised in strict mode when the input size does not match the conversion plan."""
+
+
+class UnsupportedConversionError(ConversionError):
+    """Raised when no conversion exists for the requested source/target pair."""
+
+
+class SaveReadError(ConversionError):
+    """Raised when a save file cannot be read from disk."""
+
+
+class SaveWriteError(ConversionError):
+    """Raised when a converted save cannot be written to disk."""
+
+
+class VerificationError(ConversionError):
+    """Raised when a conversion does not survive the round trip back to its source format."""
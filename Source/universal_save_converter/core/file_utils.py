@@ -1,9 +1,14 @@
 # core/file_utils.py
 import os
+import shutil
+import sys
+import threading
 from datetime import datetime
-from tkinter import messagebox
+from core.exceptions import SaveReadError, SaveWriteError
+from core.transform_utils import TransformPlan, transform
 from systems.n64.n64_constants import (
     EEP_EXT, SRA_EXT, FLA_EXT, MPK_EXT, SRM_EXT,
+    FILL_BLANK,
     SIZE_EEP, SIZE_SRA, SIZE_FLA, SIZE_MPK, SIZE_SRM,
     EEP_LABEL, SRA_LABEL, FLA_LABEL, MPK_LABEL, SRM_LABEL,
     NATIVE_LABEL, PJ64_LABEL, RA_LABEL, WII_LABEL,
@@ -22,44 +27,180 @@ def detect_file_type(filename: str) -> str | None:
     }.get(ext, None)
 
 
-def read_bytes(path: str) -> bytes | None:
-    """Read binary data from a file, return None if error occurs."""
+def read_bytes(path: str) -> bytes:
+    """Read binary data from a file, raise SaveReadError if it cannot be read."""
     try:
         with open(path, "rb") as f:
             return f.read()
-    except Exception:
-        messagebox.showerror("Error", f"Could not read file: {path}")
-        return None
+    except OSError as e:
+        raise SaveReadError(f"Could not read file: {path}") from e
 
 
-def write_bytes(data: bytes, path: str) -> bool:
-    """Write binary data to a file, return True on success, False on failure."""
+_read_pool = threading.local()
+
+
+def pooled_buffer(size: int) -> memoryview:
+    """
+    Writable view of size bytes from this thread's reusable read buffer.
+    The contents are only valid until the thread's next pooled read.
+    """
+    buffer = getattr(_read_pool, "buffer", None)
+    if buffer is None or len(buffer) < size:
+        # Replace rather than resize: older views may still be exported
+        buffer = _read_pool.buffer = bytearray(max(size, 4096))
+    return memoryview(buffer)[:size]
+
+
+def read_range(path: str, start: int = 0, length: int | None = None) -> tuple[memoryview, int]:
+    """
+    Read length bytes from offset start (default: to the end) with one seek
+    and readinto() into the thread's pooled buffer. Returns (view of the
+    bytes read, file size); the view is only valid until the next
+    read_range() on the same thread. Raises SaveReadError.
+    """
+    try:
+        with open(path, "rb") as f:
+            file_size = os.fstat(f.fileno()).st_size
+            start = min(start, file_size)
+            length = file_size - start if length is None else max(0, min(length, file_size - start))
+            view = pooled_buffer(length)
+            if start:
+                f.seek(start)
+            read = f.readinto(view) if length else 0
+            while read < length:
+                chunk = f.readinto(view[read:])
+                if not chunk:
+                    break
+                read += chunk
+    except OSError as e:
+        raise SaveReadError(f"Could not read file: {path}") from e
+    return view[:read], file_size
+
+
+def write_bytes(data: bytes, path: str) -> None:
+    """
+    Write binary data to a file, raise SaveWriteError if it cannot be written.
+    The data goes to a temporary file beside path, which then replaces it: an
+    existing path that is a hard link (e.g. to the source save) is never
+    written through, and readers never see a half-written save.
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
     try:
-        with open(path, "wb") as f:
+        with open(tmp_path, "wb") as f:
             f.write(data)
-        return True
-    except Exception:
-        messagebox.showerror("Error", f"Could not write file: {path}")
-        return False
+        os.replace(tmp_path, path)
+    except OSError as e:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise SaveWriteError(f"Could not write file: {path}") from e
+
+
+# Output modes for byte-identical copies: a new file, a hard link, or a
+# copy-on-write clone (falls back to a copy where unsupported)
+LINK_MODES = ("copy", "hardlink", "reflink")
+
+# Linux FICLONE ioctl (_IOW(0x94, 9, int)): share extents on Btrfs/XFS/OCFS2
+_FICLONE = 0x40049409
+
+
+def _reflink(src_fd: int, dst_fd: int) -> None:
+    if not sys.platform.startswith("linux"):
+        raise OSError("reflink is only available on Linux")
+    import fcntl
+    fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+
+
+def _kernel_copy(src_fd: int, dst_fd: int, size: int) -> str:
+    """Copy size bytes between descriptors in the kernel; returns the syscall used."""
+    for name in ("copy_file_range", "sendfile"):
+        copy = getattr(os, name, None)
+        if copy is None:
+            continue
+        try:
+            copied = 0
+            while copied < size:
+                if name == "copy_file_range":
+                    sent = copy(src_fd, dst_fd, size - copied)
+                else:
+                    sent = copy(dst_fd, src_fd, copied, size - copied)
+                if sent == 0:
+                    break
+                copied += sent
+        except OSError:
+            if copied:
+                raise
+            continue  # unsupported for this pair of files; try the next syscall
+        if copied == size:
+            return name
+        raise OSError(f"short copy: {copied} of {size} bytes")
+    raise OSError("no kernel copy available")
+
+
+def clone_file(src: str, dst: str, mode: str = "copy") -> str:
+    """
+    Place a byte-identical copy of src at dst without passing the data
+    through Python. mode is one of LINK_MODES; hard links and reflinks fall
+    back to a copy when the filesystem refuses them. Copies use
+    copy_file_range()/sendfile(), else shutil.copyfile (which has its own
+    platform fast paths). Like write_bytes, the copy is made beside dst and
+    then replaces it, so a failed copy leaves the previous dst intact.
+    Returns the method used; raises SaveWriteError.
+    """
+    tmp_path = f"{dst}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        if os.path.lexists(tmp_path):
+            os.remove(tmp_path)
+        method = _clone_to(src, tmp_path, mode)
+        os.replace(tmp_path, dst)
+        if os.path.lexists(tmp_path):
+            os.remove(tmp_path)  # dst was already a link to the same file: rename() was a no-op
+        return method
+    except OSError as e:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise SaveWriteError(f"Could not write file: {dst}") from e
+
+
+def _clone_to(src: str, dst: str, mode: str) -> str:
+    """clone_file's copy step, into a dst that does not exist yet."""
+    if mode == "hardlink":
+        try:
+            os.link(src, dst)
+            return "hardlink"
+        except OSError:
+            pass
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        if mode == "reflink":
+            try:
+                _reflink(fsrc.fileno(), fdst.fileno())
+                return "reflink"
+            except OSError:
+                pass
+        try:
+            return _kernel_copy(fsrc.fileno(), fdst.fileno(), os.fstat(fsrc.fileno()).st_size)
+        except OSError:
+            fdst.seek(0)
+            fdst.truncate()
+    shutil.copyfile(src, dst)
+    return "copyfile"
 
 
-def resize_bytes(data: bytes, new_size: int, offset: int = 0) -> bytes:
+def resize_bytes(data, new_size: int, offset: int = 0, fill: int = FILL_BLANK, out=None):
     """
-    Resize data to new_size bytes.
+    Resize data to new_size bytes with a single slice move (no byte swap).
 
     Positive offset: copy data starting at offset in new array.
     Negative offset: trim data from the start.
+    Bytes not covered by data are set to fill (FILL_BLANK for SRAM/EEPROM/MPK,
+    FILL_ERASED for erased FlashRAM).
+    If out is given it must be a writable buffer of new_size bytes; it is
+    filled in place and returned. Otherwise a new bytearray is returned.
     """
-    if offset < 0:
-        data = data[abs(offset):]
-        offset = 0
-
-    result = bytearray(new_size)
-    for i in range(len(data)):
-        dest_index = i + offset
-        if 0 <= dest_index < new_size:
-            result[dest_index] = data[i]
-    return bytes(result)
+    return transform(data, TransformPlan(new_size, offset, 1, fill), out=out)
 
 
 def new_filename(filename: str, extension: str, prefix: str = "Converted_") -> str:
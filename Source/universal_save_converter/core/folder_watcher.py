@@ -0,0 +1,164 @@
+# core/folder_watcher.py
+
+import os
+import threading
+import time
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:  # watchdog is optional; polling with os.scandir covers every platform
+    Observer = FileSystemEventHandler = None
+
+# Seconds a file must stay unchanged before it is handed on (write bursts coalesce)
+DEFAULT_DEBOUNCE = 0.75
+# Seconds between polling scans (and between debounce checks with watchdog)
+DEFAULT_INTERVAL = 1.0
+
+
+def _stat_key(path):
+    """(size, mtime_ns) of path, or None if it is gone or not a file."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns) if os.path.isfile(path) else None
+
+
+def _scan(folder, recursive):
+    """{path: (size, mtime_ns)} for the files in folder."""
+    found = {}
+    stack = [folder]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        found[entry.path] = (stat.st_size, stat.st_mtime_ns)
+                    elif recursive and entry.is_dir():
+                        stack.append(entry.path)
+                except OSError:
+                    continue
+    return found
+
+
+class FolderWatcher:
+    """
+    Reports new or changed files in a set of folders.
+
+    Changes come from watchdog (inotify, FSEvents, ReadDirectoryChangesW)
+    when it is installed, else from polling scans. A changed file is
+    handed to on_ready(path) only once its size and mtime have been stable
+    for debounce seconds. An in-memory (size, mtime) index of handled files
+    drops repeats; call mark_handled() on files you write into watched
+    folders so your own outputs do not trigger conversions back.
+    """
+
+    def __init__(self, folders, on_ready, debounce=DEFAULT_DEBOUNCE, interval=DEFAULT_INTERVAL,
+                 recursive=False, backend=None):
+        self.folders = [os.path.abspath(folder) for folder in folders]
+        self.on_ready = on_ready
+        self.debounce = debounce
+        self.interval = interval
+        self.recursive = recursive
+        self.backend = backend or ("watchdog" if Observer is not None else "poll")
+        self._seen = {}
+        self._handled = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._observer = None
+
+    def snapshot(self):
+        """Record the folders' current files as handled (existing saves are not converted)."""
+        for folder in self.folders:
+            found = _scan(folder, self.recursive)
+            self._seen.update(found)
+            with self._lock:
+                self._handled.update(found)
+
+    def mark_handled(self, path):
+        """Record path's current size and mtime as already handled (e.g. a file we just wrote)."""
+        key = _stat_key(path)
+        if key is not None:
+            with self._lock:
+                self._handled[os.path.abspath(path)] = key
+
+    def notify(self, path):
+        """Note a possible change to path (called by the backend); starts its debounce."""
+        path = os.path.abspath(path)
+        key = _stat_key(path)
+        if key is None:
+            return
+        with self._lock:
+            self._pending[path] = (time.monotonic() + self.debounce, key)
+
+    def poll(self):
+        """Scan the folders once and notify every file whose size or mtime changed."""
+        for folder in self.folders:
+            for path, key in _scan(folder, self.recursive).items():
+                if self._seen.get(path) != key:
+                    self._seen[path] = key
+                    self.notify(path)
+
+    def flush(self, now=None) -> list[str]:
+        """Hand settled files to on_ready; returns the paths handed on."""
+        now = time.monotonic() if now is None else now
+        ready = []
+        with self._lock:
+            due = [(path, key) for path, (deadline, key) in self._pending.items() if deadline <= now]
+            for path, key in due:
+                current = _stat_key(path)
+                if current is None:
+                    del self._pending[path]
+                elif current != key:
+                    # Still being written: wait another debounce period
+                    self._pending[path] = (now + self.debounce, current)
+                else:
+                    del self._pending[path]
+                    if self._handled.get(path) != current:
+                        self._handled[path] = current
+                        ready.append(path)
+        for path in ready:
+            self.on_ready(path)
+        return ready
+
+    def _start_observer(self):
+        watcher = self
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory:
+                    return
+                watcher.notify(getattr(event, "dest_path", None) or event.src_path)
+
+        self._observer = Observer()
+        for folder in self.folders:
+            self._observer.schedule(Handler(), folder, recursive=self.recursive)
+        self._observer.start()
+
+    def run(self):
+        """Watch until stop() is called (or KeyboardInterrupt)."""
+        if self.backend == "watchdog":
+            self._start_observer()
+        next_poll = 0.0
+        try:
+            while not self._stop.is_set():
+                if self.backend == "poll" and time.monotonic() >= next_poll:
+                    self.poll()
+                    next_poll = time.monotonic() + self.interval
+                self.flush()
+                self._stop.wait(min(self.interval, self.debounce) / 2)
+        finally:
+            if self._observer is not None:
+                self._observer.stop()
+                self._observer.join()
+                self._observer = None
+
+    def stop(self):
+        self._stop.set()
@@ -1,5 +1,6 @@
 from datetime import datetime
 from core.log_utils import gui_log, PASTEL_GUI_COLORS
+from core.logger import attach_gui
 from core.theme_utils import current_mode
 
 # Global reference to the active Text widget
@@ -17,6 +18,9 @@ def set_log_widget(widget):
     for tag, color in PASTEL_GUI_COLORS.items():
         log_widget.tag_config(tag, foreground=color)
 
+    # Route core.logger.log output into this widget
+    attach_gui(log_widget)
+
 def update_log_bg():
     """Update logger background based on current theme."""
     if not log_widget:
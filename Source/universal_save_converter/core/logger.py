@@ -1,58 +1,204 @@
 # core/logger.py
 
+import atexit
 import os
+import sys
+import threading
+import time
+from collections import deque
 from datetime import datetime
-from core.log_utils import TermColors, gui_log
-from core.gui_logger import log_widget as global_log_widget, PASTEL_GUI_COLORS
+from queue import Empty, SimpleQueue
+from core.log_utils import TermColors
 
 LOG_FILE = "conversion_log.txt"
 
+# Seconds before a log file that could not be opened or written is tried again
+FILE_RETRY_SECONDS = 30.0
+
+# Milliseconds between GUI log flushes
+GUI_FLUSH_INTERVAL = 50
+
+TERM_COLORS = {
+    "INFO": TermColors.WHITE,
+    "WARN": TermColors.YELLOW,
+    "ERROR": TermColors.RED,
+    "SUCCESS": TermColors.GREEN,
+    "CONVERSION": TermColors.CYAN
+}
+
+GUI_LEVEL_TAGS = {
+    "INFO": "level_info",
+    "WARN": "level_warn",
+    "ERROR": "level_error",
+    "SUCCESS": "level_success",
+    "CONVERSION": "level_conversion"
+}
+
+# Terminal/file records: (timestamp, level, message), or (None, Event, None) flush markers
+_records = SimpleQueue()
+_writer = None
+_writer_lock = threading.Lock()
+
+# GUI records: (log_box, timestamp, level, message), drained on the Tk main loop
+_gui_records = deque()
+_gui_widget = None
+
+
 def setup_logging():
     """Ensure the log file exists."""
     if not os.path.exists(LOG_FILE):
         with open(LOG_FILE, "w", encoding="utf-8") as f:
             f.write("=== Conversion Log Initialized ===\n")
 
+
 def log(message, *, level="INFO", log_box=None):
     """
     Logs a message to:
     1. Terminal (with color)
     2. GUI Text widget (if provided or global)
     3. File
-    Supports custom levels for future expandability.
+    Never blocks: records are queued and written by a background thread,
+    and the GUI widget is updated in batches from the Tk main loop.
     """
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    full_message = f"[{timestamp}] [{level}] {message}"
-
-    # --- Terminal logging ---
-    term_colors = {
-        "INFO": TermColors.WHITE,
-        "WARN": TermColors.YELLOW,
-        "ERROR": TermColors.RED,
-        "SUCCESS": TermColors.GREEN,
-        "CONVERSION": TermColors.CYAN
-    }
-    color = term_colors.get(level, TermColors.WHITE)
-    print(f"{TermColors.ORANGE}[{timestamp}]{TermColors.RESET} {color}{message}{TermColors.RESET}", flush=True)
-
-    # --- GUI logging ---
-    active_log_box = log_box or global_log_widget
+    _ensure_writer()
+    _records.put((timestamp, level, message))
+
+    active_log_box = log_box or _gui_widget
     if active_log_box:
-        # Insert timestamp separately (always orange)
-        active_log_box.insert("end", f"[{timestamp}] ", "timestamp")
-        # Insert message with level tag
-        level_map = {
-            "INFO": "level_info",
-            "WARN": "level_warn",
-            "ERROR": "level_error",
-            "SUCCESS": "level_success",
-            "CONVERSION": "level_conversion"
-        }
-        gui_level = level_map.get(level, "level_info")
-        active_log_box.insert("end", f"{message}\n", gui_level)
-        active_log_box.see("end")
-        active_log_box.update_idletasks()
-
-    # --- File logging ---
-    with open(LOG_FILE, "a", encoding="utf-8") as f:
-        f.write(full_message + "\n")
\ No newline at end of file
+        _gui_records.append((active_log_box, timestamp, level, message))
+
+
+def flush(timeout=None):
+    """Block until every queued record has reached the terminal and log file."""
+    if _writer is None or not _writer.is_alive():
+        return
+    done = threading.Event()
+    _records.put((None, done, None))
+    done.wait(timeout)
+
+
+# --- Background terminal/file writer ---
+
+def _ensure_writer():
+    global _writer
+    if _writer is not None:
+        return
+    with _writer_lock:
+        if _writer is None:
+            _writer = threading.Thread(target=_write_records, name="usc-log-writer", daemon=True)
+            _writer.start()
+
+
+def _write_records():
+    log_file, retry_at = None, 0.0
+    while True:
+        batch = [_records.get()]
+        try:
+            while len(batch) < 1024:
+                batch.append(_records.get_nowait())
+        except Empty:
+            pass
+
+        term_lines, file_lines, waiters = [], [], []
+        for timestamp, level, message in batch:
+            if timestamp is None:
+                waiters.append(level)
+                continue
+            color = TERM_COLORS.get(level, TermColors.WHITE)
+            term_lines.append(f"{TermColors.ORANGE}[{timestamp}]{TermColors.RESET} {color}{message}{TermColors.RESET}\n")
+            file_lines.append(f"[{timestamp}] [{level}] {message}\n")
+
+        if term_lines:
+            try:
+                sys.stdout.write("".join(term_lines))
+                sys.stdout.flush()
+            except (OSError, ValueError, AttributeError):
+                pass  # no usable stdout (e.g. windowed build)
+            log_file, retry_at = _write_file(log_file, retry_at, file_lines)
+
+        for done in waiters:
+            done.set()
+
+
+def _write_file(log_file, retry_at, lines):
+    """
+    Append lines to LOG_FILE, (re)opening it as needed. When the file cannot
+    be opened or written, the lines are dropped (the terminal still has them),
+    one warning goes to stderr and the file is retried after FILE_RETRY_SECONDS.
+    Returns the (log_file, retry_at) state for the next batch.
+    """
+    if log_file is None:
+        if time.monotonic() < retry_at:
+            return None, retry_at
+        try:
+            log_file = open(LOG_FILE, "a", encoding="utf-8")
+        except OSError as e:
+            return None, _file_failed(e, retry_at)
+    try:
+        log_file.write("".join(lines))
+        log_file.flush()
+    except (OSError, ValueError) as e:
+        try:
+            log_file.close()
+        except OSError:
+            pass
+        return None, _file_failed(e, retry_at)
+    return log_file, 0.0
+
+
+def _file_failed(error, retry_at) -> float:
+    if not retry_at:  # warn once per outage, not on every retry
+        try:
+            sys.stderr.write(f"usc: cannot write {LOG_FILE} ({error}); logging to the terminal only\n")
+        except (OSError, ValueError, AttributeError):
+            pass
+    return time.monotonic() + FILE_RETRY_SECONDS
+
+
+def _reset_after_fork():
+    """Forked workers start with a fresh queue and no writer thread."""
+    global _records, _writer, _writer_lock, _gui_widget
+    _records = SimpleQueue()
+    _writer = None
+    _writer_lock = threading.Lock()
+    _gui_records.clear()
+    _gui_widget = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+atexit.register(flush, 2.0)
+
+
+# --- GUI sink ---
+
+def attach_gui(widget):
+    """
+    Make widget the default GUI log target and start flushing queued
+    records into it. Must be called from the Tk main thread.
+    """
+    global _gui_widget
+    _gui_widget = widget
+    widget.after(GUI_FLUSH_INTERVAL, _pump_gui, widget)
+
+
+def _pump_gui(widget):
+    """Insert all queued GUI records in one pass, then reschedule."""
+    if widget is not _gui_widget or not widget.winfo_exists():
+        return  # replaced or destroyed; a newer pump owns the queue
+
+    pending = {}
+    while _gui_records:
+        log_box, timestamp, level, message = _gui_records.popleft()
+        pending.setdefault(log_box, []).extend((
+            f"[{timestamp}] ", "timestamp",
+            f"{message}\n", GUI_LEVEL_TAGS.get(level, "level_info")
+        ))
+
+    for log_box, chunks in pending.items():
+        if log_box is widget or log_box.winfo_exists():
+            log_box.insert("end", *chunks)
+            log_box.see("end")
+
+    widget.after(GUI_FLUSH_INTERVAL, _pump_gui, widget)
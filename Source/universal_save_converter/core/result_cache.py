@@ -0,0 +1,141 @@
+# core/result_cache.py
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+
+# Bump when the on-disk entry layout changes
+CACHE_FORMAT = 1
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def default_cache_dir(name: str = "results") -> str:
+    """Per-user cache directory (LOCALAPPDATA on Windows, XDG_CACHE_HOME elsewhere)."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "universal_save_converter", name)
+
+
+class ResultCache:
+    """
+    Content-addressed store of converted saves.
+
+    Entries are keyed by the input bytes plus a recipe string describing the
+    compiled plan, options and engine version, so any change to either
+    produces a new key. Each entry is <key>.bin (output) and <key>.json
+    (result metadata). Least recently used entries are evicted once the
+    cache grows past max_bytes. Safe to share between worker processes:
+    entries are written atomically and a lost race only wastes a write.
+    """
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES, link=False):
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+        # Hard links share storage with the cache; only safe if outputs are never edited in place
+        self.link = link
+        self._size = None
+
+    @staticmethod
+    def key(data, recipe: str) -> str:
+        """Return the cache key for converting data with recipe."""
+        digest = hashlib.sha256(f"{CACHE_FORMAT}|{recipe}\0".encode())
+        digest.update(data)
+        return digest.hexdigest()
+
+    def _paths(self, key):
+        stem = os.path.join(self.directory, key[:2], key)
+        return stem + ".bin", stem + ".json"
+
+    def fetch(self, key, out_path):
+        """
+        Place the cached output for key at out_path and return its metadata,
+        or None on a miss. A hit marks the entry as recently used.
+        """
+        bin_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if os.path.exists(out_path):
+                os.remove(out_path)
+            if self.link:
+                try:
+                    os.link(bin_path, out_path)
+                except OSError:
+                    shutil.copyfile(bin_path, out_path)
+            else:
+                shutil.copyfile(bin_path, out_path)
+            os.utime(meta_path)
+        except (OSError, ValueError):
+            return None
+        return meta
+
+    def put(self, key, data, meta: dict):
+        """Store data and its metadata under key, then evict if over budget."""
+        bin_path, meta_path = self._paths(key)
+        os.makedirs(os.path.dirname(bin_path), exist_ok=True)
+        suffix = f".{os.getpid()}.tmp"
+        try:
+            with open(bin_path + suffix, "wb") as f:
+                f.write(data)
+            os.replace(bin_path + suffix, bin_path)
+            with open(meta_path + suffix, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(meta_path + suffix, meta_path)
+        except OSError:
+            return  # caching is best effort
+
+        if self._size is None:
+            self._size = self.size()
+        else:
+            self._size += len(data)
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def _entries(self):
+        """Return (last_used, size, bin_path, meta_path) for every complete entry."""
+        entries = []
+        if not os.path.isdir(self.directory):
+            return entries
+        with os.scandir(self.directory) as shards:
+            for shard in shards:
+                if not shard.is_dir():
+                    continue
+                with os.scandir(shard.path) as files:
+                    for entry in files:
+                        if not entry.name.endswith(".json"):
+                            continue
+                        bin_path = entry.path[:-5] + ".bin"
+                        try:
+                            size = os.stat(bin_path).st_size
+                            entries.append((entry.stat().st_mtime, size, bin_path, entry.path))
+                        except OSError:
+                            continue
+        return entries
+
+    def size(self) -> int:
+        """Total bytes of cached outputs."""
+        return sum(entry[1] for entry in self._entries())
+
+    def evict(self, target=None):
+        """Remove least recently used entries until the cache is at most target bytes."""
+        target = self.max_bytes * 3 // 4 if target is None else target
+        entries = sorted(self._entries())
+        total = sum(entry[1] for entry in entries)
+        for _, size, bin_path, meta_path in entries:
+            if total <= target:
+                break
+            for path in (meta_path, bin_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+        self._size = total
+
+    def clear(self):
+        """Remove every cache entry."""
+        self.evict(target=0)
@@ -0,0 +1,201 @@
+# core/rom_scanner.py
+
+import json
+import mmap
+import os
+import struct
+from core.result_cache import default_cache_dir
+
+# Bump when RomInfo fields or resolution rules change, invalidating cached scans
+SCAN_FORMAT = 1
+
+N64_ROM_EXTS = (".z64", ".v64", ".n64")
+GBA_ROM_EXTS = (".gba",)
+
+# First word of an N64 ROM in each dump byte order → swap width back to big-endian (.z64)
+N64_MAGIC = {b"\x80\x37\x12\x40": 1, b"\x37\x80\x40\x12": 2, b"\x40\x12\x37\x80": 4}
+N64_HEADER_SIZE = 0x40
+
+# GBA save library version strings → save chip; longer names first so FLASH1M_V wins over FLASH_V
+GBA_SAVE_LIBRARIES = (
+    (b"FLASH1M_V", "FLASH1M"),
+    (b"FLASH512_V", "FLASH"),
+    (b"FLASH_V", "FLASH"),
+    (b"EEPROM_V", "EEPROM"),
+    (b"SRAM_F_V", "SRAM"),
+    (b"SRAM_V", "SRAM"),
+)
+GBA_HEADER_SIZE = 0xC0
+GBA_FIXED_OFFSET, GBA_FIXED_VALUE = 0xB2, 0x96
+
+
+class RomInfo:
+    """Identity of one ROM and the save types resolved for it (names, e.g. ["EEP"])."""
+    __slots__ = ("path", "system", "title", "game_code", "crc", "save_types")
+
+    def __init__(self, path, system, title="", game_code="", crc="", save_types=()):
+        self.path = path
+        self.system = system
+        self.title = title
+        self.game_code = game_code
+        self.crc = crc
+        self.save_types = list(save_types)
+
+    def __repr__(self):
+        return f"RomInfo({self.system}, {self.title!r}, {self.game_code}, {self.save_types})"
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _unswap_header(header: bytes, swap_size: int) -> bytes:
+    if swap_size == 1:
+        return header
+    return b"".join(header[i:i + swap_size][::-1] for i in range(0, len(header), swap_size))
+
+
+def _ascii(raw: bytes) -> str:
+    return raw.split(b"\x00")[0].decode("ascii", "replace").strip()
+
+
+def read_n64_header(data, path) -> RomInfo | None:
+    """Parse the 64-byte N64 header (any dump byte order): internal name, game code and CRCs."""
+    swap_size = N64_MAGIC.get(bytes(data[:4]))
+    if swap_size is None or len(data) < N64_HEADER_SIZE:
+        return None
+    header = _unswap_header(bytes(data[:N64_HEADER_SIZE]), swap_size)
+    crc1, crc2 = struct.unpack_from(">II", header, 0x10)
+    return RomInfo(path, "n64", title=_ascii(header[0x20:0x34]),
+                   game_code=_ascii(header[0x3B:0x3F]), crc=f"{crc1:08X}-{crc2:08X}")
+
+
+def read_gba_rom(data, path) -> RomInfo | None:
+    """Parse a GBA header and find the save chip from the embedded save library string."""
+    if len(data) < GBA_HEADER_SIZE or data[GBA_FIXED_OFFSET] != GBA_FIXED_VALUE:
+        return None
+    info = RomInfo(path, "gba", title=_ascii(data[0xA0:0xAC]), game_code=_ascii(data[0xAC:0xB0]))
+    for marker, chip in GBA_SAVE_LIBRARIES:
+        if data.find(marker) != -1:
+            info.save_types = [chip]
+            break
+    return info
+
+
+def scan_rom(path: str) -> RomInfo | None:
+    """
+    Identify a ROM by memory-mapping it: N64 ROMs only touch the header page,
+    GBA ROMs are searched for their save library string with mmap.find().
+    Returns None for files that are not recognised ROMs.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                if ext in N64_ROM_EXTS:
+                    return read_n64_header(data, path)
+                if ext in GBA_ROM_EXTS:
+                    return read_gba_rom(data, path)
+    except (OSError, ValueError):
+        return None
+    return None
+
+
+class RomIndex:
+    """
+    ROM folder scanner with a persistent index.
+
+    Each ROM's RomInfo (including the save types resolved for it) is cached
+    under its path and reused while the ROM's size and mtime are unchanged,
+    so rescanning a collection only opens new or modified ROMs. resolvers
+    maps a system name to fn(RomInfo) -> save type names, for systems whose
+    header does not name the save chip.
+    """
+
+    def __init__(self, cache_path=None, resolvers=None):
+        self.cache_path = cache_path or os.path.join(default_cache_dir("roms"), "rom_index.json")
+        self.resolvers = resolvers or {}
+        self._entries = None
+        self._dirty = False
+
+    def _load(self):
+        if self._entries is not None:
+            return
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            self._entries = payload["entries"] if payload.get("format") == SCAN_FORMAT else {}
+        except (OSError, ValueError, KeyError, AttributeError):
+            self._entries = {}
+
+    def save(self):
+        """Write the index if anything changed (atomic replace)."""
+        if not self._dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"format": SCAN_FORMAT, "entries": self._entries}, f)
+            os.replace(tmp_path, self.cache_path)
+            self._dirty = False
+        except OSError:
+            pass  # the index only saves rescans
+
+    def info(self, path: str) -> RomInfo | None:
+        """RomInfo for one ROM, from the index when its size and mtime still match."""
+        self._load()
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        key = os.path.abspath(path)
+        stamp = [stat.st_size, stat.st_mtime_ns]
+        cached = self._entries.get(key)
+        if cached and cached[0] == stamp:
+            return RomInfo(**cached[1]) if cached[1] else None
+
+        info = scan_rom(path)
+        if info is not None and info.system in self.resolvers:
+            info.save_types = list(self.resolvers[info.system](info))
+        self._entries[key] = [stamp, info.as_dict() if info else None]
+        self._dirty = True
+        return info
+
+    def scan(self, directory: str, recursive: bool = False) -> dict[str, RomInfo]:
+        """
+        Identify every ROM under directory and save the index.
+        Returns {lower-case basename without extension: RomInfo}, the key
+        saves are matched on. Folders that cannot be read are skipped.
+        """
+        roms = {}
+        stack = [directory]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        continue
+                    if is_dir:
+                        if recursive:
+                            stack.append(entry.path)
+                        continue
+                    stem, ext = os.path.splitext(entry.name)
+                    if ext.lower() not in N64_ROM_EXTS + GBA_ROM_EXTS:
+                        continue
+                    info = self.info(entry.path)
+                    if info is not None:
+                        roms.setdefault(stem.lower(), info)
+        self.save()
+        return roms
+
+
+def rom_for_save(roms: dict, path: str) -> RomInfo | None:
+    """The scanned ROM sharing a save's basename, or None."""
+    return roms.get(os.path.splitext(os.path.basename(path))[0].lower())
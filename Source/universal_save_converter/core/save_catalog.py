@@ -0,0 +1,252 @@
+# core/save_catalog.py
+
+import os
+import sqlite3
+import threading
+import time
+from core.result_cache import default_cache_dir
+from core.sync_manifest import file_digest
+
+# Bump when the schema changes (an older catalog is then rebuilt)
+CATALOG_FORMAT = 2
+
+SCHEMA = """
+CREATE TABLE files (
+    path      TEXT PRIMARY KEY,
+    root      TEXT NOT NULL,
+    size      INTEGER NOT NULL,
+    mtime_ns  INTEGER NOT NULL,
+    system    TEXT,
+    ext_type  TEXT,
+    save_type TEXT,
+    hash      TEXT,
+    game      TEXT,
+    rom       TEXT,
+    rom_checked INTEGER NOT NULL DEFAULT 0,
+    scanned   REAL NOT NULL
+);
+CREATE INDEX files_root ON files(root);
+CREATE INDEX files_type ON files(save_type, system);
+CREATE INDEX files_hash ON files(hash);
+CREATE TABLE sections (
+    path       TEXT NOT NULL REFERENCES files(path) ON DELETE CASCADE,
+    save_type  TEXT NOT NULL,
+    state      TEXT NOT NULL,
+    used_bytes INTEGER NOT NULL,
+    PRIMARY KEY (path, save_type)
+);
+CREATE INDEX sections_type ON sections(save_type, state);
+CREATE TABLE conversions (
+    path       TEXT NOT NULL REFERENCES files(path) ON DELETE CASCADE,
+    out_path   TEXT NOT NULL,
+    hash       TEXT NOT NULL,
+    plan       TEXT,
+    tgt_system TEXT,
+    tgt_type   TEXT,
+    converted  REAL NOT NULL,
+    PRIMARY KEY (path, out_path)
+);
+"""
+
+FILE_COLUMNS = ("path", "root", "size", "mtime_ns", "system", "ext_type", "save_type", "hash", "game", "rom",
+                "scanned")
+
+
+def _path_range(root: str) -> tuple[str, str]:
+    """(low, high) bounds of the paths under root, for a primary key range scan."""
+    prefix = os.path.join(os.path.abspath(root), "")
+    return prefix, prefix + "\U0010ffff"
+
+
+def default_catalog_path() -> str:
+    return os.path.join(default_cache_dir("catalog"), "catalog.sqlite3")
+
+
+class SaveCatalog:
+    """
+    SQLite catalog of the saves in a set of folders.
+
+    Each file row holds its stat data, the system it was scanned as, its
+    extension and detected save types, content hash, matched game and ROM;
+    the sections table holds occupancy (one row per SRM section, or one for
+    a plain save) and the conversions table the last conversion of each
+    file to each output. probe(path) -> dict supplies the system-specific
+    fields: ext_type, save_type, game and sections [(type, state, used_bytes)].
+
+    scan() walks a folder with os.scandir and re-probes and re-hashes only
+    files whose size or mtime changed, so rescans of a large, mostly
+    unchanged collection read no save data, whichever folder (parent or
+    child) a file was first scanned from. One connection is shared
+    between threads behind a lock.
+    """
+
+    def __init__(self, db_path=None, probe=None):
+        self.db_path = db_path or default_catalog_path()
+        self.probe = probe
+        self._lock = threading.Lock()
+        if self.db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA foreign_keys = ON")
+        self._db.execute("PRAGMA journal_mode = WAL")
+        if self._db.execute("PRAGMA user_version").fetchone()[0] != CATALOG_FORMAT:
+            self._rebuild()
+
+    def _rebuild(self):
+        with self._db:
+            for table in ("conversions", "sections", "files"):
+                self._db.execute(f"DROP TABLE IF EXISTS {table}")
+            self._db.executescript(SCHEMA)
+            self._db.execute(f"PRAGMA user_version = {CATALOG_FORMAT}")
+
+    def close(self):
+        self._db.close()
+
+    def _store(self, path, root, stat, system):
+        """Probe and hash one file and replace its rows (caller holds the lock)."""
+        fields = self.probe(path) if self.probe else {}
+        try:
+            digest = file_digest(path)
+        except OSError:
+            digest = None
+        self._db.execute("DELETE FROM sections WHERE path = ?", (path,))
+        self._db.execute(
+            "INSERT INTO files (path, root, size, mtime_ns, system, ext_type, save_type, hash, game, rom, scanned) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, NULL, ?) "
+            "ON CONFLICT(path) DO UPDATE SET root = excluded.root, size = excluded.size, "
+            "mtime_ns = excluded.mtime_ns, system = excluded.system, ext_type = excluded.ext_type, "
+            "save_type = excluded.save_type, hash = excluded.hash, game = excluded.game, "
+            "scanned = excluded.scanned",
+            (path, root, stat.st_size, stat.st_mtime_ns, system, fields.get("ext_type"),
+             fields.get("save_type"), digest, fields.get("game"), time.time())
+        )
+        self._db.executemany(
+            "INSERT INTO sections (path, save_type, state, used_bytes) VALUES (?, ?, ?, ?)",
+            [(path, *section) for section in fields.get("sections", ())]
+        )
+
+    def scan(self, root: str, system=None, recursive: bool = False) -> dict:
+        """
+        Bring the catalog up to date with the files under root.
+        Returns counts of added, updated, unchanged and removed files.
+        """
+        root = os.path.abspath(root)
+        counts = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0}
+        with self._lock, self._db:
+            # Every catalogued file under root, even if first scanned from a parent or child folder
+            known = {row["path"]: (row["size"], row["mtime_ns"], row["system"]) for row in self._db.execute(
+                "SELECT path, size, mtime_ns, system FROM files WHERE path >= ? AND path < ?", _path_range(root))
+                if recursive or os.path.dirname(row["path"]) == root}
+            stack = [root]
+            while stack:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            if recursive:
+                                stack.append(entry.path)
+                            continue
+                        if not entry.is_file():
+                            continue
+                        stat = entry.stat()
+                        previous = known.pop(entry.path, None)
+                        if previous == (stat.st_size, stat.st_mtime_ns, system):
+                            counts["unchanged"] += 1
+                            continue
+                        self._store(entry.path, root, stat, system)
+                        counts["added" if previous is None else "updated"] += 1
+            # Whatever was not seen is gone
+            self._db.executemany("DELETE FROM files WHERE path = ?", [(path,) for path in known])
+            counts["removed"] = len(known)
+        return counts
+
+    def update(self, path: str, system=None) -> dict | None:
+        """Catalog one file (e.g. one a watcher reported) and return its row; None if it is gone."""
+        path = os.path.abspath(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            with self._lock, self._db:
+                self._db.execute("DELETE FROM files WHERE path = ?", (path,))
+            return None
+        with self._lock, self._db:
+            row = self._db.execute("SELECT size, mtime_ns, system, root FROM files WHERE path = ?",
+                                   (path,)).fetchone()
+            if row is None or tuple(row)[:3] != (stat.st_size, stat.st_mtime_ns, system):
+                self._store(path, row["root"] if row else os.path.dirname(path), stat, system)
+        return self.get(path)
+
+    def get(self, path: str) -> dict | None:
+        """The catalog row for path, with its sections, or None."""
+        rows = self.query(path=os.path.abspath(path))
+        return rows[0] if rows else None
+
+    def query(self, path=None, root=None, system=None, save_type=None, section=None, no_rom=False,
+              unconverted=False) -> list[dict]:
+        """
+        Catalogued saves matching every given filter, in path order:
+        section=type name keeps files with that section (or plain save) in
+        use; no_rom keeps files that were matched against a ROM folder
+        (see set_roms) without finding their ROM; unconverted keeps
+        files never converted since their content last changed.
+        """
+        where, params = [], []
+        for column, value in (("path", path), ("system", system), ("save_type", save_type)):
+            if value is not None:
+                where.append(f"f.{column} = ?")
+                params.append(value)
+        if root is not None:
+            # Everything under root: a primary key range, whichever scan root it came from
+            where.append("f.path >= ? AND f.path < ?")
+            params += _path_range(root)
+        if section is not None:
+            where.append("EXISTS (SELECT 1 FROM sections s WHERE s.path = f.path "
+                         "AND s.save_type = ? AND s.state = 'used')")
+            params.append(section)
+        if no_rom:
+            where.append("f.save_type IS NOT NULL AND f.rom_checked AND f.rom IS NULL")
+        if unconverted:
+            where.append("f.save_type IS NOT NULL AND NOT EXISTS (SELECT 1 FROM conversions c "
+                         "WHERE c.path = f.path AND c.hash = f.hash)")
+        sql = f"SELECT {', '.join('f.' + c for c in FILE_COLUMNS)} FROM files f"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        with self._lock:
+            rows = [dict(row) for row in self._db.execute(sql + " ORDER BY f.path", params)]
+            for row in rows:
+                row["sections"] = [dict(s) for s in self._db.execute(
+                    "SELECT save_type, state, used_bytes FROM sections WHERE path = ? ORDER BY rowid",
+                    (row["path"],))]
+        return rows
+
+    def set_roms(self, matches: dict):
+        """Store {save path: matched ROM path or None} (ROM matching needs no save data)."""
+        with self._lock, self._db:
+            self._db.executemany("UPDATE files SET rom = ?, rom_checked = 1 WHERE path = ?",
+                                 [(rom, path) for path, rom in matches.items()])
+
+    def record_conversion(self, path, out_path, plan=None, tgt_system=None, tgt_type=None):
+        """Remember that path's current content was converted to out_path."""
+        path = os.path.abspath(path)
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO conversions (path, out_path, hash, plan, tgt_system, tgt_type, converted) "
+                "SELECT path, ?, hash, ?, ?, ?, ? FROM files WHERE path = ? AND hash IS NOT NULL",
+                (os.path.abspath(out_path), plan, tgt_system, tgt_type, time.time(), path)
+            )
+
+    def is_converted(self, path, out_path) -> bool:
+        """True if path's current content was already converted to out_path and that output still exists."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT 1 FROM conversions c JOIN files f ON f.path = c.path "
+                "WHERE c.path = ? AND c.out_path = ? AND c.hash = f.hash",
+                (os.path.abspath(path), os.path.abspath(out_path))
+            ).fetchone()
+        return row is not None and os.path.exists(out_path)
+
+    def last_conversion(self, path) -> dict | None:
+        with self._lock:
+            row = self._db.execute("SELECT * FROM conversions WHERE path = ? ORDER BY converted DESC LIMIT 1",
+                                   (os.path.abspath(path),)).fetchone()
+        return dict(row) if row else None
@@ -1,15 +1,76 @@
 # core/swap_utils.py
 
-def byteswap(data: bytes, swap_size: int) -> bytes:
-    """Swap the byte order of data in chunks of the given size."""
+import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; array.array covers the fast path
+    np = None
+
+# array.array typecode for each machine word width (2 → "H", 4 → "I", 8 → "Q"/"L")
+_ARRAY_TYPECODES = {array.array(code).itemsize: code for code in "QLIH"}
+
+
+def byteswap_into(dst, src, swap_size: int) -> None:
+    """
+    Write src into dst (equal lengths) with every swap_size chunk reversed.
+
+    Whole chunks are moved and swapped in a single vectorised pass (NumPy
+    when installed, otherwise array.array); a trailing partial chunk is
+    reversed on its own. dst must be writable and may be the same buffer as src.
+    """
+    dst = memoryview(dst).cast("B")
+    src = memoryview(src).cast("B")
+    if len(dst) != len(src):
+        raise ValueError(f"Buffer length mismatch: {len(dst)} != {len(src)}.")
+    if swap_size <= 1:
+        dst[:] = src
+        return
+
+    body = len(src) - len(src) % swap_size
+    tail = bytes(src[body:])[::-1]
+
+    if body and np is not None and swap_size in (2, 4, 8):
+        # Casting big- to little-endian swaps while copying (overlap-safe)
+        np.copyto(np.frombuffer(dst[:body], dtype=f"<u{swap_size}"),
+                  np.frombuffer(src[:body], dtype=f">u{swap_size}"))
+    elif body and swap_size in _ARRAY_TYPECODES:
+        words = array.array(_ARRAY_TYPECODES[swap_size])
+        words.frombytes(src[:body])
+        words.byteswap()
+        dst[:body] = memoryview(words).cast("B")
+    elif body:
+        # Odd widths: one strided slice move per byte lane
+        chunk = bytes(src[:body])
+        for lane in range(swap_size):
+            dst[lane:body:swap_size] = chunk[swap_size - 1 - lane::swap_size]
+
+    dst[body:] = tail
+
+
+def byteswap(data, swap_size: int, *, in_place: bool = False):
+    """
+    Swap the byte order of data in chunks of the given size.
+
+    data may be any buffer-protocol object; see byteswap_into for the kernel.
+    With in_place=True data must be writable; it is modified and returned.
+    Otherwise a new bytearray is returned and data is left untouched.
+    """
     if swap_size <= 1:
+        return data if in_place else bytearray(data)
+
+    if in_place:
+        if memoryview(data).readonly:
+            raise TypeError("In-place byteswap requires a writable buffer.")
+        byteswap_into(data, data, swap_size)
         return data
 
-    swapped = bytearray(len(data))
-    for i in range(0, len(data), swap_size):
-        chunk = data[i:i + swap_size]
-        swapped[i:i + len(chunk)] = chunk[::-1]
-    return bytes(swapped)
+    result = bytearray(memoryview(data).nbytes)
+    byteswap_into(result, data, swap_size)
+    return result
+
+# User choice that asks the engine to detect the input byte order (see core.byte_order)
+AUTO_SWAP = "Auto"
 
 def determine_swap_size(swap_required_from_table: bool = False, user_choice: str = "Default") -> int:
     """
@@ -17,7 +78,8 @@ def determine_swap_size(swap_required_from_table: bool = False, user_choice: str
     
     Parameters:
         swap_required_from_table: Whether the conversion table suggests a swap.
-        user_choice: User override ("Default", "2 bytes", "4 bytes").
+        user_choice: User override ("Default", "2 bytes", "4 bytes"). "Auto" is
+            resolved by the engine and falls back to the table here.
         
     Returns:
         int: Number of bytes to swap (1, 2, or 4).
@@ -0,0 +1,92 @@
+# core/sync_manifest.py
+
+import hashlib
+import json
+import os
+import time
+from core.result_cache import default_cache_dir
+
+# Bump when the manifest layout changes (older manifests are then ignored)
+MANIFEST_FORMAT = 1
+SIDES = ("a", "b")
+
+
+def file_digest(path: str) -> str:
+    """BLAKE2b content hash of a file, read in 1 MiB blocks."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def scan_tree(root: str, recursive: bool = True) -> dict[str, tuple[int, int]]:
+    """{relative path: (size, mtime_ns)} for the files under root, from os.scandir stat data only."""
+    found = {}
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    stat = entry.stat()
+                    found[os.path.relpath(entry.path, root)] = (stat.st_size, stat.st_mtime_ns)
+                elif recursive and entry.is_dir():
+                    stack.append(entry.path)
+    return found
+
+
+def default_manifest_path(a_dir: str, b_dir: str) -> str:
+    """Per-user manifest location for one folder pair (kept out of the synced folders)."""
+    pair = f"{os.path.abspath(a_dir)}\0{os.path.abspath(b_dir)}".encode()
+    return os.path.join(default_cache_dir("sync"), hashlib.sha1(pair).hexdigest() + ".json")
+
+
+class SyncManifest:
+    """
+    Persistent state of a two-folder sync.
+
+    Each pair links a save on side "a" to its converted counterpart on side
+    "b". Both sides record path (relative to their folder), save type name,
+    size, mtime_ns and content hash as of the last sync, so a rescan only
+    has to compare stat data and hashes only the files whose stat changed.
+    Several pairs may share one file (e.g. the EEP and MPK of a game both
+    live in one RetroArch SRM).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.pairs = []
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            if payload.get("format") == MANIFEST_FORMAT:
+                self.pairs = payload["pairs"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+    def by_path(self, side: str) -> dict[str, list[dict]]:
+        """{relative path on side: [pairs referencing it]}."""
+        index = {}
+        for pair in self.pairs:
+            index.setdefault(pair[side]["path"], []).append(pair)
+        return index
+
+    def add(self, a: dict, b: dict) -> dict:
+        pair = {"a": a, "b": b, "synced": time.time()}
+        self.pairs.append(pair)
+        return pair
+
+    def record(self, side: str, rel_path: str, size: int, mtime_ns: int, digest: str):
+        """Store the synced state of a file in every pair that references it."""
+        for pair in self.pairs:
+            if pair[side]["path"] == rel_path:
+                pair[side].update(size=size, mtime_ns=mtime_ns, hash=digest)
+                pair["synced"] = time.time()
+
+    def save(self):
+        """Write the manifest atomically."""
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"format": MANIFEST_FORMAT, "pairs": self.pairs}, f)
+        os.replace(tmp_path, self.path)
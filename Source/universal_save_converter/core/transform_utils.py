@@ -0,0 +1,79 @@
+# core/transform_utils.py
+
+from core.swap_utils import byteswap, byteswap_into
+
+
+class TransformPlan:
+    """
+    Compiled byte transform for one conversion.
+
+    target_size: size of the output buffer in bytes.
+    offset: positive shifts the source forward, negative trims its start.
+    swap_size: byte-swap chunk width (1 = no swap).
+    fill: byte used for padding not covered by the source.
+    """
+    __slots__ = ("target_size", "offset", "swap_size", "fill")
+
+    def __init__(self, target_size: int, offset: int = 0, swap_size: int = 1, fill: int = 0x00):
+        self.target_size = target_size
+        self.offset = offset
+        self.swap_size = swap_size
+        self.fill = fill
+
+    def __repr__(self):
+        return (f"TransformPlan(target_size={self.target_size}, offset={self.offset}, "
+                f"swap_size={self.swap_size}, fill=0x{self.fill:02X})")
+
+    def is_identity(self, src_len: int) -> bool:
+        """True if the output is the src_len-byte input unchanged (same size, no offset, no swap)."""
+        return self.target_size == src_len and self.offset == 0 and self.swap_size <= 1
+
+    def window(self, src_len: int) -> tuple[int, int, int]:
+        """
+        Return (src_start, dst_start, length) of the source bytes that land
+        in the output buffer.
+        """
+        src_start = max(0, -self.offset)
+        dst_start = max(0, self.offset)
+        length = max(0, min(src_len - src_start, self.target_size - dst_start))
+        return src_start, dst_start, length
+
+
+def transform(data, plan: TransformPlan, out=None):
+    """
+    Resize, offset and byte-swap data in a single pass.
+
+    The swapped source window is written straight into one preallocated
+    buffer; only the padding around it is filled. If out is given it must be
+    a writable buffer of plan.target_size bytes and is reused, otherwise a new
+    bytearray is returned.
+    """
+    size = plan.target_size
+    src = memoryview(data).cast("B")
+    src_start, dst_start, length = plan.window(len(src))
+    dst_end = dst_start + length
+    fill = plan.fill
+
+    if out is None:
+        out = bytearray(size) if fill == 0 else bytearray(bytes((fill,)) * size)
+        dst = memoryview(out)
+    else:
+        dst = memoryview(out).cast("B")
+        if len(dst) != size:
+            raise ValueError(f"Output buffer is {len(dst)} bytes, expected {size}.")
+        head_end = min(dst_start, size)
+        dst[:head_end] = bytes((fill,)) * head_end
+        dst[dst_end:] = bytes((fill,)) * (size - dst_end)
+
+    window = src[src_start:src_start + length]
+    swap_size = plan.swap_size
+    if swap_size <= 1:
+        dst[dst_start:dst_end] = window
+    elif dst_start % swap_size == 0 and (dst_end % swap_size == 0 or dst_end == size):
+        # Swap chunks line up with the window, so padding chunks stay untouched
+        byteswap_into(dst[dst_start:dst_end], window, swap_size)
+    else:
+        # Chunks straddle padding and data: copy first, then swap the whole buffer
+        dst[dst_start:dst_end] = window
+        byteswap(dst, swap_size, in_place=True)
+    return out
@@ -0,0 +1,114 @@
+# gui/gui_dispatcher.py
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from queue import Empty, SimpleQueue
+from core.logger import log
+
+# Milliseconds between drains of the worker event queue
+POLL_INTERVAL = 30
+
+
+class GUIDispatcher:
+    """
+    Marshals work between background conversion threads and the Tk main loop.
+
+    Workers never touch Tk directly: they post callables onto a queue that
+    the main loop drains with after(). call() blocks the worker until the
+    main thread has run the callable (dialogs), post() does not (updates).
+    """
+
+    def __init__(self, root, max_workers=2, interval=POLL_INTERVAL, on_progress=None):
+        self.root = root
+        self.interval = interval
+        self.on_progress = on_progress
+        self._events = SimpleQueue()
+        self._main_thread = threading.get_ident()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="usc-convert")
+        self._closed = False
+        self._close_lock = threading.Lock()  # makes "closed?" + enqueue atomic against close()
+        root.after(interval, self._drain)
+
+    # --- Worker side (any thread) ---
+
+    def submit(self, fn, *args, on_done=None, **kwargs) -> Future:
+        """
+        Run fn(*args, **kwargs) on the worker pool.
+        on_done(future) is called on the main thread when it finishes.
+        """
+        future = self._pool.submit(fn, *args, **kwargs)
+        if on_done:
+            future.add_done_callback(lambda f: self.post(on_done, f))
+        return future
+
+    def post(self, fn, *args, **kwargs):
+        """Queue fn(*args, **kwargs) to run on the main thread; returns immediately."""
+        self._events.put((fn, args, kwargs, None))
+
+    def call(self, fn, *args, **kwargs):
+        """
+        Run fn(*args, **kwargs) on the main thread and return its result.
+        Raises RuntimeError once the window is closed, rather than waiting
+        for a main loop that no longer drains the queue.
+        """
+        if threading.get_ident() == self._main_thread:
+            return fn(*args, **kwargs)
+        reply = Future()
+        with self._close_lock:
+            if self._closed:
+                raise RuntimeError("GUI closed")
+            self._events.put((fn, args, kwargs, reply))
+        return reply.result()
+
+    def log(self, message, level="INFO", log_box=None):
+        """Log a line; core.logger already hands GUI output to the main loop."""
+        log(message, level=level, log_box=log_box)
+
+    def progress(self, value, text=""):
+        """Report progress (0.0–1.0) to on_progress on the main thread."""
+        if self.on_progress:
+            self.post(self.on_progress, value, text)
+
+    def ask_save_path(self, **options):
+        """Show the save-as dialog on the main thread and return the chosen path."""
+        from tkinter import filedialog
+        return self.call(filedialog.asksaveasfilename, **options)
+
+    def close(self):
+        """
+        Stop draining events, drop conversions not yet started and let running
+        ones finish in the background; their GUI calls fail from now on.
+        """
+        with self._close_lock:
+            self._closed = True
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        # Release workers still waiting on a dialog (no new ones can queue now)
+        while True:
+            try:
+                _, _, _, reply = self._events.get_nowait()
+            except Empty:
+                break
+            if reply is not None:
+                reply.set_exception(RuntimeError("GUI closed"))
+
+    # --- Main thread ---
+
+    def _drain(self):
+        if self._closed:
+            return
+        while True:
+            try:
+                fn, args, kwargs, reply = self._events.get_nowait()
+            except Empty:
+                break
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                if reply is None:
+                    log(f"GUI update failed: {e}", level="ERROR")
+                else:
+                    reply.set_exception(e)
+            else:
+                if reply is not None:
+                    reply.set_result(result)
+        self.root.after(self.interval, self._drain)
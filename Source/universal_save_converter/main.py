@@ -1,9 +1,15 @@
 # main.py
 
-from gui.main_gui import TopLevelGUI
+import sys
 
 def main():
+    if len(sys.argv) > 1:
+        # Command-line mode (`usc batch ...`): never loads the GUI
+        from cli.cli_main import run_cli
+        sys.exit(run_cli(sys.argv[1:]))
+
+    from gui.main_gui import TopLevelGUI
     TopLevelGUI()  # Launch the top-level console selection GUI
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -21,6 +21,10 @@ SIZE_SRA_SRM_OFFSET: int = 133120
 SIZE_FLA_SRM_OFFSET: int = SIZE_SRM - SIZE_FLA
 SIZE_MPK_SRM_OFFSET: int = 2048
 
+# Padding fill bytes
+FILL_BLANK: int = 0x00   # SRAM / EEPROM / Controller Pak
+FILL_ERASED: int = 0xFF  # erased FlashRAM
+
 # File Type Labels
 EEP_LABEL: str = " EEPROM (.eep) "
 SRA_LABEL: str = " SRAM (.sra) "
@@ -0,0 +1,139 @@
+# systems/gba/gba_engine.py
+
+import os
+from core.conversion_types import ConversionOptions, ConversionResult
+from core.exceptions import InvalidInputError, UnsupportedConversionError
+from core.file_utils import read_bytes, write_bytes
+from core.swap_utils import determine_swap_size
+from core.transform_utils import TransformPlan, transform
+from .gba_conversion_table import conversion_table
+from .gba_constants import *
+
+# Output extension for each target type
+EXT_MAP = {
+    EEP_LABEL: EEP_EXT,
+    SRA_LABEL: SRA_EXT,
+    FLA_LABEL: FLA_EXT,
+    MPK_LABEL: MPK_EXT,
+    SRM_LABEL: SRM_EXT
+}
+
+
+def convert_bytes(data, src, src_type, tgt, tgt_type, options=None, source_ext="", out=None):
+    """
+    Headless gba save conversion.
+    Transforms data in memory and returns a ConversionResult.
+    Never touches the GUI; raises ConversionError subclasses on failure.
+    out may be a reusable buffer of the target size (see transform).
+    """
+    options = options or ConversionOptions()
+    if not data:
+        raise InvalidInputError("Input save data is empty.")
+
+    key = f"{src}-{src_type}-{tgt}-{tgt_type}"
+    messages = []
+
+    # Default conversion parameters
+    tgt_size = len(data)
+    offset = 0
+    swap_required = False
+    extension = source_ext
+
+    # --- Conversion table lookup ---
+    conv = conversion_table.get(key)
+    if conv:
+        src_size, tgt_size, offset, swap_required, extension = conv
+        messages.append(("CONVERSION", f"Using conversion table entry: {key}"))
+    elif options.allow_raw_copy:
+        messages.append(("WARN", "No matching conversion found; using raw copy."))
+    else:
+        raise UnsupportedConversionError(f"No conversion available for: {key}")
+
+    # Native target adjustments
+    if tgt == NATIVE_LABEL:
+        tgt_size = len(data)
+        offset = 0
+        swap_required = False
+        extension = source_ext
+        messages.append(("CONVERSION", "Target is Native — using direct copy."))
+
+    # SRM-specific offsets
+    if src_type == SRA_LABEL and tgt_type == SRM_LABEL:
+        tgt_size = SIZE_SRM
+        offset = SIZE_SRA_SRM_OFFSET
+        swap_required = True
+        extension = SRM_EXT
+    elif src_type == FLA_LABEL and tgt_type == SRM_LABEL:
+        tgt_size = SIZE_SRM
+        offset = SIZE_FLA_SRM_OFFSET
+        swap_required = True
+        extension = SRM_EXT
+    elif src_type == MPK_LABEL and tgt_type == SRM_LABEL:
+        tgt_size = SIZE_SRM
+        offset = SIZE_MPK_SRM_OFFSET
+        swap_required = False
+        extension = SRM_EXT
+    elif src_type == SRM_LABEL:
+        if tgt_type == SRA_LABEL:
+            tgt_size = SIZE_SRA
+            offset = -SIZE_SRA_SRM_OFFSET
+            swap_required = True
+            extension = SRA_EXT
+        elif tgt_type == FLA_LABEL:
+            tgt_size = SIZE_FLA
+            offset = -SIZE_FLA_SRM_OFFSET
+            swap_required = True
+            extension = FLA_EXT
+        elif tgt_type == MPK_LABEL:
+            tgt_size = SIZE_MPK
+            offset = -SIZE_MPK_SRM_OFFSET
+            swap_required = False
+            extension = MPK_EXT
+        elif tgt_type == EEP_LABEL:
+            tgt_size = SIZE_EEP
+            offset = 0
+            swap_required = False
+            extension = EEP_EXT
+    elif src_type == EEP_LABEL and tgt_type == SRM_LABEL:
+        tgt_size = SIZE_SRM
+        offset = 0
+        swap_required = False
+        extension = SRM_EXT
+
+    # --- Fused resize + offset + byte swap ---
+    swap_size = determine_swap_size(swap_required_from_table=swap_required,
+                                    user_choice=options.byteswap_option)
+    fill = FILL_BLANK if options.fill_byte is None else options.fill_byte
+    messages.append(("CONVERSION", f"Resizing data to {tgt_size} bytes (offset {offset})"))
+    if swap_size > 1:
+        messages.append(("CONVERSION", f"Applying {swap_size}-byte swap..."))
+    else:
+        messages.append(("CONVERSION", "No byte swap applied."))
+    data = transform(data, TransformPlan(tgt_size, offset, swap_size, fill), out=out)
+
+    return ConversionResult(
+        data=data,
+        extension=EXT_MAP.get(tgt_type, extension),
+        tgt_size=tgt_size,
+        offset=offset,
+        swap_size=swap_size,
+        plan_key=key if conv else None,
+        messages=messages
+    )
+
+
+def convert_file(path, out_path, src, src_type, tgt, tgt_type, options=None):
+    """
+    Headless file-to-file gba save conversion.
+    Reads path, converts it and writes the result to out_path.
+    """
+    if not path or not os.path.exists(path):
+        raise InvalidInputError(f"Invalid input path: {path}")
+
+    data = read_bytes(path)
+    result = convert_bytes(data, src, src_type, tgt, tgt_type, options,
+                           source_ext=os.path.splitext(path)[1])
+    write_bytes(result.data, out_path)
+    result.out_path = out_path
+    result.note(f"File written successfully → {out_path}", level="SUCCESS")
+    return result
@@ -21,25 +21,40 @@ EXT_TO_LABEL = {
 
 def convert_save_gba(input_path, source_var, source_type_var,
                      target_var, target_type_var, byteswap_var,
-                     trim_pad_var, log_box):
+                     trim_pad_var, log_box, dispatcher=None, on_done=None):
     """
     Thin wrapper for GUI button. Pulls variables and passes to system convert.
     Logs success if conversion completes without exceptions.
+    Must be called on the Tk main thread; with a dispatcher the conversion
+    runs on its worker pool and on_done(future) is called when it finishes.
     """
+    # Tk variables are only read here, on the main thread
+    request = dict(
+        path=input_path.get(),
+        src=source_var.get(),
+        src_type=source_type_var.get(),
+        tgt=target_var.get(),
+        tgt_type=target_type_var.get(),
+        byteswap_option=byteswap_var.get(),
+        trim_pad_option=trim_pad_var.get(),
+        log_box=log_box,
+        dispatcher=dispatcher
+    )
+    if dispatcher:
+        return dispatcher.submit(_run_conversion, request, on_done=on_done)
+    return _run_conversion(request)
+
+
+def _run_conversion(request):
+    """Worker body: never touches Tk except through the request's dispatcher."""
+    log_box = request["log_box"]
     try:
-        convert_save(
-            path=input_path.get(),
-            src=source_var.get(),
-            src_type=source_type_var.get(),
-            tgt=target_var.get(),
-            tgt_type=target_type_var.get(),
-            byteswap_option=byteswap_var.get(),
-            trim_pad_option=trim_pad_var.get(),
-            log_box=log_box
-        )
+        out_path = convert_save(**request)
         log("Conversion completed successfully!", log_box=log_box, level="SUCCESS")
+        return out_path
     except Exception as e:
         log(f"Conversion failed: {e}", log_box=log_box, level="ERROR")
+        return None
 
 
 def browse_file(filetypes, path_var, type_var):
@@ -1,7 +1,6 @@
 # systems/gba/gui/gba_gui_main.py
 
 import os
-import threading
 from tkinter import PhotoImage, Label, Button, Frame, Text, Scrollbar, LEFT, RIGHT, BOTH, Y
 from tkinter import ttk
 
@@ -14,6 +13,7 @@ from core.theme_utils import apply_theme, start_polling
 from systems.gba.gba_utils import determine_valid_target_types, is_byteswap_allowed
 from systems.gba.gui import gba_gui_vars as gui_vars
 from gui.gui_utils import GUIResetManager
+from gui.gui_dispatcher import GUIDispatcher
 
 # --- Callbacks ---
 from systems.gba.gui import gba_callbacks
@@ -158,23 +158,33 @@ def setup_gba_gui(parent):
     gui_vars.byteswap_var.set("default")
 
     # --------------------------
-    # Start Conversion (Threaded)
+    # Start Conversion (Worker Pool)
     # --------------------------
+    dispatcher = GUIDispatcher(parent)
+    parent.bind("<Destroy>", lambda e: dispatcher.close() if e.widget is parent else None, add="+")
+    running = 0
+
+    def on_conversion_done(_future):
+        nonlocal running
+        running -= 1
+        convert_btn.config(text=f"Convert ({running} running)" if running else "Convert")
+
     def start_conversion():
-        threading.Thread(
-            target=gba_callbacks.convert_save_gba,
-            kwargs={
-                "input_path": gui_vars.input_path,
-                "source_var": gui_vars.source_var,
-                "source_type_var": gui_vars.source_type_var,
-                "target_var": gui_vars.target_var,
-                "target_type_var": gui_vars.target_type_var,
-                "byteswap_var": gui_vars.byteswap_var,
-                "trim_pad_var": gui_vars.trim_pad_var,
-                "log_box": log_box
-            },
-            daemon=True
-        ).start()
+        nonlocal running
+        running += 1
+        convert_btn.config(text=f"Convert ({running} running)")
+        gba_callbacks.convert_save_gba(
+            input_path=gui_vars.input_path,
+            source_var=gui_vars.source_var,
+            source_type_var=gui_vars.source_type_var,
+            target_var=gui_vars.target_var,
+            target_type_var=gui_vars.target_type_var,
+            byteswap_var=gui_vars.byteswap_var,
+            trim_pad_var=gui_vars.trim_pad_var,
+            log_box=log_box,
+            dispatcher=dispatcher,
+            on_done=on_conversion_done
+        )
 
     convert_btn = Button(parent, text="Convert", width=20, command=start_conversion, state="disabled")
     convert_btn.grid(row=7, column=1, pady=15)
@@ -4,6 +4,8 @@ import os
 from tkinter import filedialog
 from systems.n64.n64_conversion_core import convert_save
 from core.logger import log
+from systems.n64.n64_detect import classify_save
+from systems.n64.n64_game_db import game_for_file
 from systems.n64.n64_constants import (
     EEP_EXT, SRA_EXT, FLA_EXT, MPK_EXT, SRM_EXT,
     EEP_LABEL, SRA_LABEL, FLA_LABEL, MPK_LABEL, SRM_LABEL
@@ -21,30 +23,47 @@ EXT_TO_LABEL = {
 
 def convert_save_n64(input_path, source_var, source_type_var,
                      target_var, target_type_var, byteswap_var,
-                     trim_pad_var, log_box):
+                     trim_pad_var, log_box, dispatcher=None, on_done=None):
     """
     Thin wrapper for GUI button. Pulls variables and passes to system convert.
     Logs success if conversion completes without exceptions.
+    Must be called on the Tk main thread; with a dispatcher the conversion
+    runs on its worker pool and on_done(future) is called when it finishes.
     """
+    # Tk variables are only read here, on the main thread
+    request = dict(
+        path=input_path.get(),
+        src=source_var.get(),
+        src_type=source_type_var.get(),
+        tgt=target_var.get(),
+        tgt_type=target_type_var.get(),
+        byteswap_option=byteswap_var.get(),
+        trim_pad_option=trim_pad_var.get(),
+        log_box=log_box,
+        dispatcher=dispatcher
+    )
+    if dispatcher:
+        return dispatcher.submit(_run_conversion, request, on_done=on_done)
+    return _run_conversion(request)
+
+
+def _run_conversion(request):
+    """Worker body: never touches Tk except through the request's dispatcher."""
+    log_box = request["log_box"]
     try:
-        convert_save(
-            path=input_path.get(),
-            src=source_var.get(),
-            src_type=source_type_var.get(),
-            tgt=target_var.get(),
-            tgt_type=target_type_var.get(),
-            byteswap_option=byteswap_var.get(),
-            trim_pad_option=trim_pad_var.get(),
-            log_box=log_box
-        )
+        out_path = convert_save(**request)
         log("Conversion completed successfully!", log_box=log_box, level="SUCCESS")
+        return out_path
     except Exception as e:
         log(f"Conversion failed: {e}", log_box=log_box, level="ERROR")
+        return None
 
 
 def browse_file(filetypes, path_var, type_var):
     """
     GUI file browser for N64 save files. Updates path and sets human-readable source type.
+    The type comes from the extension, checked against the file's size and content,
+    so misnamed saves (.sav/.bin from flash carts) are classified too.
     """
     filepath = filedialog.askopenfilename(filetypes=filetypes)
     if not filepath:
@@ -52,6 +71,14 @@ def browse_file(filetypes, path_var, type_var):
 
     path_var.set(filepath)
 
-    # Determine type based on extension and set label
+    # Determine type from extension and content, and set label
     ext = os.path.splitext(filepath)[1].lower()
-    type_var.set(EXT_TO_LABEL.get(ext, "Unknown"))
\ No newline at end of file
+    save_type = classify_save(filepath)
+    label = save_type.value if save_type else "Unknown"
+    if label != EXT_TO_LABEL.get(ext, "Unknown"):
+        log(f"Detected {label.strip()} from file contents ({ext or 'no extension'}).", level="INFO")
+    game = game_for_file(filepath)
+    if game is not None:
+        uses = ", ".join(save_type.value.strip() for save_type in game.save_types) or "no save"
+        log(f"Game: {game.title} (uses {uses}).", level="INFO")
+    type_var.set(label)
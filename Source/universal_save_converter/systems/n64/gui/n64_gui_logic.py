@@ -1,14 +1,34 @@
 # systems/n64/gui/n64_gui_logic.py
 
+import os
+
 def setup_target_type_trace(
     source_var, source_type_var, target_var, target_type_var, target_type_menu,
-    determine_valid_target_types, input_path_var=None, convert_button=None
+    determine_valid_target_types, input_path_var=None, convert_button=None,
+    suggest_srm_target=None
 ):
     """
     Updates target_type_menu based on current source and target selections.
     Auto-selects first valid target type for all sources except RetroArch SRM files.
+    For SRMs, suggest_srm_target(path) may return the label of the section that
+    holds data; it is selected if valid (the scan is cached per file version).
     Optionally disables convert_button until a valid selection is made.
     """
+    suggestion_cache = {}
+
+    def suggested_label(path):
+        if not suggest_srm_target or not path.lower().endswith(".srm"):
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        key = (path, stat.st_size, stat.st_mtime_ns)
+        if key not in suggestion_cache:
+            suggestion_cache.clear()
+            suggestion_cache[key] = suggest_srm_target(path)
+        return suggestion_cache[key]
+
     def update_target_type_menu(*args):
         valid_output_types = determine_valid_target_types(
             source_var.get(), source_type_var.get(), target_var.get()
@@ -23,7 +43,8 @@ def setup_target_type_trace(
 
         if is_retroarch_srm:
             if target_type_var.get() not in valid_output_types:
-                target_type_var.set("")
+                suggested = suggested_label(input_path_var.get() if input_path_var else "")
+                target_type_var.set(suggested if suggested in valid_output_types else "")
         else:
             if target_type_var.get() not in valid_output_types:
                 target_type_var.set(valid_output_types[0] if valid_output_types else "")
@@ -1,7 +1,6 @@
 # systems/n64/gui/n64_gui_main.py
 
 import os
-import threading
 from tkinter import Frame, Label, Button, Text, Scrollbar, LEFT, RIGHT, BOTH, Y, Tk, PhotoImage
 
 # --- N64 Constants ---
@@ -11,8 +10,12 @@ from systems.n64.n64_constants import SOURCE_LIST, TARGET_LIST
 from core.gui_logger import set_log_widget
 from core.theme_utils import apply_theme, start_polling
 from systems.n64.n64_utils import determine_valid_target_types, is_byteswap_allowed
+from systems.n64.n64_conversion_table import srm_sections
+from systems.n64.n64_game_db import guess_save_type
+from systems.n64.n64_srm import suggest_srm_target
 from systems.n64.gui import n64_gui_vars as gui_vars
 from gui.gui_utils import GUIResetManager
+from gui.gui_dispatcher import GUIDispatcher
 
 # --- Callbacks ---
 from systems.n64.gui import n64_callbacks
@@ -33,6 +36,12 @@ VERTICAL_OFFSET = 35
 HEIGHT = 380
 
 
+def suggest_srm_label(path):
+    """GUI label of the SRM section holding save data (or the game's save type), or None."""
+    save_type = suggest_srm_target(path) or guess_save_type(path, srm_sections)
+    return save_type.value if save_type else None
+
+
 def setup_n64_gui(parent):
     """Set up the N64 GUI inside the given parent frame."""
     gui_vars.init_vars(parent)
@@ -135,23 +144,33 @@ def setup_n64_gui(parent):
     gui_vars.byteswap_var.set("default")
 
     # --------------------------
-    # Start Conversion (Threaded)
+    # Start Conversion (Worker Pool)
     # --------------------------
+    dispatcher = GUIDispatcher(parent)
+    parent.bind("<Destroy>", lambda e: dispatcher.close() if e.widget is parent else None, add="+")
+    running = 0
+
+    def on_conversion_done(_future):
+        nonlocal running
+        running -= 1
+        convert_btn.config(text=f"Convert ({running} running)" if running else "Convert")
+
     def start_conversion():
-        threading.Thread(
-            target=n64_callbacks.convert_save_n64,
-            kwargs={
-                "input_path": gui_vars.input_path,
-                "source_var": gui_vars.source_var,
-                "source_type_var": gui_vars.source_type_var,
-                "target_var": gui_vars.target_var,
-                "target_type_var": gui_vars.target_type_var,
-                "byteswap_var": gui_vars.byteswap_var,
-                "trim_pad_var": gui_vars.trim_pad_var,
-                "log_box": log_box
-            },
-            daemon=True
-        ).start()
+        nonlocal running
+        running += 1
+        convert_btn.config(text=f"Convert ({running} running)")
+        n64_callbacks.convert_save_n64(
+            input_path=gui_vars.input_path,
+            source_var=gui_vars.source_var,
+            source_type_var=gui_vars.source_type_var,
+            target_var=gui_vars.target_var,
+            target_type_var=gui_vars.target_type_var,
+            byteswap_var=gui_vars.byteswap_var,
+            trim_pad_var=gui_vars.trim_pad_var,
+            log_box=log_box,
+            dispatcher=dispatcher,
+            on_done=on_conversion_done
+        )
 
     convert_btn = Button(parent, text="Convert", width=20, command=start_conversion, state="disabled")
     convert_btn.grid(row=7, column=1, pady=15)
@@ -200,7 +219,8 @@ def setup_n64_gui(parent):
         target_type_menu,
         determine_valid_target_types,
         input_path_var=gui_vars.input_path,
-        convert_button=convert_btn
+        convert_button=convert_btn,
+        suggest_srm_target=suggest_srm_label
     )
 
     setup_byteswap_trace(
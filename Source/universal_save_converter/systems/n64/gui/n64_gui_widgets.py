@@ -13,7 +13,7 @@ def create_file_selection(root, input_path, source_type_var, browse_callback):
     Button(
         root, text="Browse", 
         command=lambda: browse_callback(
-            filetypes=[("N64 Saves", "*.eep *.sra *.fla *.mpk *.srm")],
+            filetypes=[("N64 Saves", "*.eep *.sra *.fla *.mpk *.srm"), ("Other saves", "*.sav *.bin *.dat *.ram")],
             path_var=input_path,
             type_var=source_type_var
         )
@@ -55,6 +55,6 @@ def create_pad_trim_checkbox(root, trim_pad_var):
 
 def create_byteswap_menu(root, byteswap_var):
     Label(root, text="Force Byte Swap:").grid(row=6, column=0, sticky=W, padx=10, pady=5)
-    byteswap_menu = ttk.Combobox(root, textvariable=byteswap_var, values=["Default", "2 bytes", "4 bytes"], state="readonly")
+    byteswap_menu = ttk.Combobox(root, textvariable=byteswap_var, values=["Default", "Auto", "2 bytes", "4 bytes"], state="readonly")
     byteswap_menu.grid(row=6, column=1, padx=10, pady=5)
     return byteswap_menu
\ No newline at end of file
@@ -0,0 +1,66 @@
+# systems/n64/n64_catalog.py
+
+from core.exceptions import SaveReadError
+from core.file_utils import detect_file_type, read_bytes
+from core.rom_scanner import rom_for_save
+from core.save_catalog import SaveCatalog
+from .n64_constants import FILL_BLANK, FILL_ERASED, SaveType
+from .n64_detect import classify_save
+from .n64_game_db import game_for_file
+from .n64_srm import (
+    SECTION_BLANK, SECTION_EMPTY_PAK, SECTION_USED, _pak_has_notes, analyze_srm, is_blank, read_srm
+)
+
+
+def save_occupancy(data, save_type) -> list[tuple]:
+    """[(type name, state, used bytes)]: one row per SRM section, or one for a plain save."""
+    if save_type is SaveType.SRM:
+        return [(usage.save_type.name, usage.state, usage.used_bytes)
+                for usage in analyze_srm(data).values()]
+    if is_blank(data):
+        return [(save_type.name, SECTION_BLANK, 0)]
+    if save_type is SaveType.MPK and not _pak_has_notes(data, 0, len(data)):
+        state = SECTION_EMPTY_PAK
+    else:
+        state = SECTION_USED
+    used_bytes = len(data) - max(data.count(FILL_BLANK), data.count(FILL_ERASED))
+    return [(save_type.name, state, used_bytes)]
+
+
+def probe_save(path: str) -> dict:
+    """Catalog fields for one file: extension label, detected type, game and occupancy."""
+    label = detect_file_type(path)
+    fields = {"ext_type": label.strip() if label else None}
+    save_type = classify_save(path)
+    if save_type is None:
+        return fields
+    fields["save_type"] = save_type.name
+    game = game_for_file(path)
+    fields["game"] = game.title if game else None
+    try:
+        data = read_srm(path)[0] if save_type is SaveType.SRM else read_bytes(path)
+    except SaveReadError:
+        return fields
+    fields["sections"] = save_occupancy(data, save_type)
+    return fields
+
+
+def open_catalog(db_path=None) -> SaveCatalog:
+    """The N64 save catalog (default: per-user cache folder)."""
+    return SaveCatalog(db_path, probe=probe_save)
+
+
+def scan_saves(catalog, root, system, recursive=False, roms=None) -> dict:
+    """
+    Rescan root as saves of system; with roms (from scan_rom_dir) also
+    re-match every save under root to its ROM, which needs no save data.
+    """
+    counts = catalog.scan(root, system.name, recursive)
+    if roms is not None:
+        rows = catalog.query(root=root)
+        matches = {}
+        for row in rows:
+            info = rom_for_save(roms, row["path"]) if row["save_type"] else None
+            matches[row["path"]] = info.path if info else None
+        catalog.set_roms(matches)
+    return counts
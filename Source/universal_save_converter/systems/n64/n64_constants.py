@@ -1,6 +1,7 @@
 # systems/n64/n64_constants.py
 
-from typing import List
+from enum import Enum
+from typing import Dict, List, Tuple
 
 # File Extensions
 EEP_EXT: str = ".eep"
@@ -16,11 +17,27 @@ SIZE_FLA: int = 131072
 SIZE_MPK: int = 131072
 SIZE_SRM: int = 296960
 
+# Other sizes seen in the wild
+SIZE_EEP_4K: int = 512      # 4Kbit EEPROM (padded to SIZE_EEP on conversion)
+SIZE_MPK_PAK: int = 32768   # single Controller Pak (SIZE_MPK holds four)
+
 # Offsets for SRM conversions
 SIZE_SRA_SRM_OFFSET: int = 133120
 SIZE_FLA_SRM_OFFSET: int = SIZE_SRM - SIZE_FLA
 SIZE_MPK_SRM_OFFSET: int = 2048
 
+# Controller Pak ID block (32 bytes, four copies) and its checksum seed
+MPK_ID_BLOCK_OFFSETS: Tuple[int, ...] = (0x20, 0x60, 0x80, 0xC0)
+MPK_ID_CHECKSUM_SEED: int = 0xFFF2
+
+# Controller Pak note table (16 entries of 32 bytes); all zero when the pak holds no saves
+MPK_NOTE_TABLE_OFFSET: int = 0x300
+MPK_NOTE_TABLE_SIZE: int = 0x200
+
+# Padding fill bytes
+FILL_BLANK: int = 0x00   # SRAM / EEPROM / Controller Pak
+FILL_ERASED: int = 0xFF  # erased FlashRAM
+
 # File Type Labels
 EEP_LABEL: str = " EEPROM (.eep) "
 SRA_LABEL: str = " SRAM (.sra) "
@@ -38,3 +55,54 @@ WII_LABEL: str = " Wii/WiiU/Everdrive64 "
 FILE_TYPES: List[str] = [EEP_LABEL, SRA_LABEL, FLA_LABEL, MPK_LABEL, SRM_LABEL]
 SOURCE_LIST: List[str] = [NATIVE_LABEL, PJ64_LABEL, RA_LABEL, WII_LABEL]
 TARGET_LIST: List[str] = [NATIVE_LABEL, PJ64_LABEL, RA_LABEL, WII_LABEL]
+
+
+# Enum views of the labels above (used as compiled conversion plan keys)
+class SaveType(Enum):
+    """N64 save file types, valued by their UI label."""
+    EEP = EEP_LABEL
+    SRA = SRA_LABEL
+    FLA = FLA_LABEL
+    MPK = MPK_LABEL
+    SRM = SRM_LABEL
+
+
+class SaveSystem(Enum):
+    """N64 save sources / targets, valued by their UI label."""
+    NATIVE = NATIVE_LABEL
+    PJ64 = PJ64_LABEL
+    RA = RA_LABEL
+    WII = WII_LABEL
+
+
+SAVE_TYPE_EXT: Dict[SaveType, str] = {
+    SaveType.EEP: EEP_EXT,
+    SaveType.SRA: SRA_EXT,
+    SaveType.FLA: FLA_EXT,
+    SaveType.MPK: MPK_EXT,
+    SaveType.SRM: SRM_EXT,
+}
+
+# Every input size accepted for each save type
+SAVE_TYPE_SIZES: Dict[SaveType, Tuple[int, ...]] = {
+    SaveType.EEP: (SIZE_EEP_4K, SIZE_EEP),
+    SaveType.SRA: (SIZE_SRA,),
+    SaveType.FLA: (SIZE_FLA,),
+    SaveType.MPK: (SIZE_MPK_PAK, SIZE_MPK),
+    SaveType.SRM: (SIZE_SRM,),
+}
+
+# Byte order each system's SRAM/FlashRAM saves arrive in, as the swaps from
+# cartridge (big-endian) order: the PC emulators (PJ64, RetroArch) keep them
+# swapped, the Wii and real hardware do not. Auto only corrects inputs whose
+# detected order differs from their source system's; the table's swap does
+# the rest, so valid inputs convert exactly as with Default
+SYSTEM_BYTE_ORDER: Dict[SaveSystem, Tuple[int, ...]] = {
+    SaveSystem.NATIVE: (),
+    SaveSystem.WII: (),
+    SaveSystem.PJ64: (2,),
+    SaveSystem.RA: (2,),
+}
+
+# Save types whose byte order differs between systems
+BYTE_ORDER_TYPES: Tuple[SaveType, ...] = (SaveType.SRA, SaveType.FLA)
@@ -1,114 +1,63 @@
 import os
 from tkinter import filedialog, messagebox
-from core.file_utils import read_bytes, write_bytes, resize_bytes, new_filename
-from core.swap_utils import byteswap, determine_swap_size
+from core.conversion_types import ConversionOptions
+from core.exceptions import ConversionError, SaveReadError, SaveWriteError
+from core.file_utils import read_range, write_bytes, new_filename
 from core.logger import log
-from .n64_conversion_table import conversion_table
-from .n64_constants import *
+from .n64_engine import convert_bytes, source_range
 
-def convert_save(path, src, src_type, tgt, tgt_type, byteswap_option, trim_pad_option, log_box=None):
+
+def _show(dispatcher, box, title, message):
+    """Show a message box, via the main loop when a dispatcher is given."""
+    if dispatcher:
+        dispatcher.post(box, title, message)
+    else:
+        box(title, message)
+
+
+def convert_save(path, src, src_type, tgt, tgt_type, byteswap_option, trim_pad_option, log_box=None,
+                 dispatcher=None):
     """
     System-specific N64 save conversion.
+    GUI shell around n64_engine.convert_bytes: handles dialogs and logging.
     Returns path of saved file or None if cancelled/failed.
+    Pass a GUIDispatcher when running off the Tk main thread so dialogs are
+    shown by the main loop.
     """
     if not path or not os.path.exists(path):
         log("Invalid input path.", log_box=log_box, level="ERROR")
-        messagebox.showerror("Error", "Please select a valid input file.")
+        _show(dispatcher, messagebox.showerror, "Error", "Please select a valid input file.")
         return None
 
-    key = f"{src}-{src_type}-{tgt}-{tgt_type}"
     log(f"Starting conversion: {path}", log_box=log_box, level="INFO")
 
-    data = read_bytes(path)
-    if not data:
+    try:
+        start, length = source_range(os.path.getsize(path), src, src_type, tgt, tgt_type)
+        data, src_size = read_range(path, start, length)
+    except (SaveReadError, OSError) as e:
         log("Error reading input file.", log_box=log_box, level="ERROR")
+        _show(dispatcher, messagebox.showerror, "Error", str(e))
         return None
 
-    # Default conversion parameters
-    tgt_size = len(data)
-    offset = 0
-    swap_required = False
-    extension = os.path.splitext(path)[1]
-
-    # --- Conversion table lookup ---
-    conv = conversion_table.get(key)
-    if conv:
-        src_size, tgt_size, offset, swap_required, extension = conv
-        log(f"Using conversion table entry: {key}", log_box=log_box, level="CONVERSION")
-    else:
-        log("No matching conversion found; using raw copy.", log_box=log_box, level="WARN")
-
-    # Native target adjustments
-    if tgt == NATIVE_LABEL:
-        tgt_size = len(data)
-        offset = 0
-        swap_required = False
-        extension = os.path.splitext(path)[1]
-        log("Target is Native — using direct copy.", log_box=log_box, level="CONVERSION")
-
-    # SRM-specific offsets
-    if src_type == SRA_LABEL and tgt_type == SRM_LABEL:
-        tgt_size = SIZE_SRM
-        offset = SIZE_SRA_SRM_OFFSET
-        swap_required = True
-        extension = SRM_EXT
-    elif src_type == FLA_LABEL and tgt_type == SRM_LABEL:
-        tgt_size = SIZE_SRM
-        offset = SIZE_FLA_SRM_OFFSET
-        swap_required = True
-        extension = SRM_EXT
-    elif src_type == MPK_LABEL and tgt_type == SRM_LABEL:
-        tgt_size = SIZE_SRM
-        offset = SIZE_MPK_SRM_OFFSET
-        swap_required = False
-        extension = SRM_EXT
-    elif src_type == SRM_LABEL:
-        if tgt_type == SRA_LABEL:
-            tgt_size = SIZE_SRA
-            offset = -SIZE_SRA_SRM_OFFSET
-            swap_required = True
-            extension = SRA_EXT
-        elif tgt_type == FLA_LABEL:
-            tgt_size = SIZE_FLA
-            offset = -SIZE_FLA_SRM_OFFSET
-            swap_required = True
-            extension = FLA_EXT
-        elif tgt_type == MPK_LABEL:
-            tgt_size = SIZE_MPK
-            offset = -SIZE_MPK_SRM_OFFSET
-            swap_required = False
-            extension = MPK_EXT
-        elif tgt_type == EEP_LABEL:
-            tgt_size = SIZE_EEP
-            offset = 0
-            swap_required = False
-            extension = EEP_EXT
-    elif src_type == EEP_LABEL and tgt_type == SRM_LABEL:
-        tgt_size = SIZE_SRM
-        offset = 0
-        swap_required = False
-        extension = SRM_EXT
-
-    log(f"Resizing data to {tgt_size} bytes (offset {offset})", log_box=log_box, level="CONVERSION")
-    data = resize_bytes(data, tgt_size, offset)
+    # --- Headless conversion ---
+    options = ConversionOptions(byteswap_option=byteswap_option, trim_pad_option=trim_pad_option)
+    try:
+        result = convert_bytes(data, src, src_type, tgt, tgt_type, options,
+                               source_ext=os.path.splitext(path)[1], src_size=src_size)
+    except ConversionError as e:
+        log(f"Conversion failed: {e}", log_box=log_box, level="ERROR")
+        _show(dispatcher, messagebox.showerror, "Error", str(e))
+        return None
 
-    # --- Byte swap ---
-    swap_size = determine_swap_size(swap_required_from_table=swap_required,
-                                    user_choice=byteswap_option)
-    if swap_size > 1:
-        log(f"Applying {swap_size}-byte swap...", log_box=log_box, level="CONVERSION")
-        data = byteswap(data, swap_size)
-    else:
-        log("No byte swap applied.", log_box=log_box, level="CONVERSION")
+    for level, message in result.messages:
+        log(message, log_box=log_box, level=level)
 
-    # --- Determine output extension ---
-    ext_map = {EEP_LABEL: EEP_EXT, SRA_LABEL: SRA_EXT, FLA_LABEL: FLA_EXT,
-               MPK_LABEL: MPK_EXT, SRM_LABEL: SRM_EXT}
-    out_ext = ext_map.get(tgt_type, extension)
+    out_ext = result.extension
     new_name = new_filename(os.path.basename(path), out_ext)
 
     # --- Save file dialog ---
-    out_path = filedialog.asksaveasfilename(
+    ask_save_path = dispatcher.ask_save_path if dispatcher else filedialog.asksaveasfilename
+    out_path = ask_save_path(
         initialfile=new_name,
         defaultextension=out_ext,
         filetypes=[("N64 Save Files", f"*{out_ext}")]
@@ -117,11 +66,13 @@ def convert_save(path, src, src_type, tgt, tgt_type, byteswap_option, trim_pad_o
         log("Save operation cancelled by user.", log_box=log_box, level="WARN")
         return None
 
-    if write_bytes(data, out_path):
-        log(f"File written successfully → {out_path}", log_box=log_box, level="SUCCESS")
-        messagebox.showinfo("Success", f"File converted and saved as:\n{out_path}")
-        return out_path
-    else:
+    try:
+        write_bytes(result.data, out_path)
+    except SaveWriteError as e:
         log("Error writing file.", log_box=log_box, level="ERROR")
+        _show(dispatcher, messagebox.showerror, "Error", str(e))
         return None
-    
\ No newline at end of file
+
+    log(f"File written successfully → {out_path}", log_box=log_box, level="SUCCESS")
+    _show(dispatcher, messagebox.showinfo, "Success", f"File converted and saved as:\n{out_path}")
+    return out_path
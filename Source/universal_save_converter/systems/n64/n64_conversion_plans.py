@@ -0,0 +1,128 @@
+# systems/n64/n64_conversion_plans.py
+
+from core.transform_utils import TransformPlan
+from .n64_conversion_table import conversion_table, srm_sections
+from .n64_constants import (
+    FILL_BLANK, SIZE_SRM,
+    SaveSystem, SaveType, SAVE_TYPE_EXT, SAVE_TYPE_SIZES
+)
+
+
+class ConversionPlan:
+    """
+    Immutable, precompiled N64 conversion.
+
+    tgt_size is None when the output keeps the input size (Native targets).
+    src_sizes lists the input sizes the plan expects, for pre-validation.
+    """
+    __slots__ = (
+        "src", "src_type", "tgt", "tgt_type",
+        "src_sizes", "tgt_size", "offset", "swap_required", "extension", "fill",
+        "from_table", "native_copy"
+    )
+
+    def __init__(self, src, src_type, tgt, tgt_type, src_sizes, tgt_size, offset,
+                 swap_required, extension, fill=FILL_BLANK, from_table=False, native_copy=False):
+        for name, value in zip(self.__slots__, (
+            src, src_type, tgt, tgt_type, src_sizes, tgt_size, offset,
+            swap_required, extension, fill, from_table, native_copy
+        )):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ConversionPlan is immutable")
+
+    def __repr__(self):
+        return f"ConversionPlan({self.key})"
+
+    @property
+    def key(self) -> str:
+        """Short readable identifier, e.g. 'PJ64:SRA->RA:SRM'."""
+        return f"{self.src.name}:{self.src_type.name}->{self.tgt.name}:{self.tgt_type.name}"
+
+    def accepts_size(self, size: int) -> bool:
+        """Return True if size is an expected input size for this plan."""
+        return size in self.src_sizes
+
+    def transform_plan(self, src_len: int, swap_size: int, fill: int | None = None) -> TransformPlan:
+        """Build the byte transform for an input of src_len bytes."""
+        return TransformPlan(
+            self.tgt_size if self.tgt_size is not None else src_len,
+            self.offset,
+            swap_size,
+            self.fill if fill is None else fill
+        )
+
+
+def _compile_plan(src, src_type, tgt, tgt_type):
+    """
+    Resolve one selection into a ConversionPlan, or None if nothing applies.
+    Precedence: table row, then Native direct copy, then the SRM section layout.
+    """
+    row = conversion_table.get((src, src_type, tgt, tgt_type))
+    if row:
+        src_size, tgt_size, offset, swap_required, _ = row
+        src_sizes = tuple(dict.fromkeys((src_size, *SAVE_TYPE_SIZES[src_type])))
+    else:
+        src_sizes, tgt_size, offset, swap_required = SAVE_TYPE_SIZES[src_type], None, 0, False
+
+    native_copy = tgt is SaveSystem.NATIVE
+    if native_copy:
+        tgt_size, offset, swap_required = None, 0, False
+
+    srm_rule = False
+    if tgt_type is SaveType.SRM and src_type in srm_sections:
+        _, offset, swap_required = srm_sections[src_type]
+        tgt_size = SIZE_SRM
+        srm_rule = True
+    elif src_type is SaveType.SRM and tgt_type in srm_sections:
+        tgt_size, srm_offset, swap_required = srm_sections[tgt_type]
+        offset = -srm_offset
+        srm_rule = True
+
+    if not (row or native_copy or srm_rule):
+        return None
+
+    return ConversionPlan(
+        src, src_type, tgt, tgt_type,
+        src_sizes=src_sizes,
+        tgt_size=tgt_size,
+        offset=offset,
+        swap_required=swap_required,
+        extension=SAVE_TYPE_EXT[tgt_type],
+        from_table=bool(row),
+        native_copy=native_copy
+    )
+
+
+def _compile_all():
+    plans = {}
+    for src in SaveSystem:
+        for src_type in SaveType:
+            for tgt in SaveSystem:
+                for tgt_type in SaveType:
+                    plan = _compile_plan(src, src_type, tgt, tgt_type)
+                    if plan:
+                        plans[(src, src_type, tgt, tgt_type)] = plan
+    return plans
+
+
+# Compiled once at import: (SaveSystem, SaveType, SaveSystem, SaveType) → ConversionPlan
+PLANS = _compile_all()
+
+
+def get_plan(src, src_type, tgt, tgt_type):
+    """
+    Return the ConversionPlan for a selection, or None if there is none.
+    Accepts SaveSystem/SaveType members or their UI labels.
+    """
+    plan = PLANS.get((src, src_type, tgt, tgt_type))
+    if plan is not None:
+        return plan
+
+    # UI labels: map onto the enum members first
+    try:
+        key = (SaveSystem(src), SaveType(src_type), SaveSystem(tgt), SaveType(tgt_type))
+    except ValueError:
+        return None
+    return PLANS.get(key)
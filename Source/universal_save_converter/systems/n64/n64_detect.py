@@ -0,0 +1,162 @@
+# systems/n64/n64_detect.py
+
+import os
+import struct
+from core.swap_utils import byteswap
+from .n64_game_db import game_for_file
+from .n64_constants import (
+    MPK_ID_BLOCK_OFFSETS, MPK_ID_CHECKSUM_SEED, MPK_NOTE_TABLE_OFFSET, MPK_NOTE_TABLE_SIZE,
+    SaveType, SAVE_TYPE_EXT, SAVE_TYPE_SIZES
+)
+
+# Bytes read from each file: Controller Pak ID area, index and note tables
+PROBE_SIZE = MPK_NOTE_TABLE_OFFSET + MPK_NOTE_TABLE_SIZE
+
+# Extensions flash carts and emulators commonly use for any save type
+GENERIC_SAVE_EXTS = (".sav", ".bin", ".dat", ".ram", "")
+
+# A candidate at or above this confidence may override the file extension
+OVERRIDE_CONFIDENCE = 0.9
+
+# Weight for save types the game database lists for the file's game
+GAME_DB_WEIGHT = 3.0
+
+# size → save types of that size, built once from SAVE_TYPE_SIZES
+SIZE_INDEX = {}
+for _save_type, _sizes in SAVE_TYPE_SIZES.items():
+    for _size in _sizes:
+        SIZE_INDEX.setdefault(_size, []).append(_save_type)
+
+EXT_INDEX = {ext: save_type for save_type, ext in SAVE_TYPE_EXT.items()}
+
+
+class TypeCandidate:
+    """One possible save type with a confidence (0–1) and the evidence for it."""
+    __slots__ = ("save_type", "confidence", "reasons", "swap_size")
+
+    def __init__(self, save_type, confidence, reasons, swap_size=1):
+        self.save_type = save_type
+        self.confidence = confidence
+        self.reasons = reasons
+        self.swap_size = swap_size
+
+    def __repr__(self):
+        return f"TypeCandidate({self.save_type.name}, {self.confidence:.2f})"
+
+    def as_dict(self) -> dict:
+        return {"type": self.save_type.name, "confidence": round(self.confidence, 3),
+                "reasons": self.reasons, "swap_size": self.swap_size}
+
+
+def _id_block_valid(data, offset) -> bool:
+    """Controller Pak ID block checksum: sum of 14 BE words, and 0xFFF2 minus that sum."""
+    if len(data) < offset + 32:
+        return False
+    words = struct.unpack_from(">16H", data, offset)
+    checksum = sum(words[:14]) & 0xFFFF
+    return words[14] == checksum and words[15] == (MPK_ID_CHECKSUM_SEED - checksum) & 0xFFFF
+
+
+def probe_controller_pak(head) -> int | None:
+    """
+    Look for a valid Controller Pak ID block in the first bytes of a file.
+    Returns the swap width it was found at (1 = stored as-is, 2 or 4 =
+    byte swapped), 0 if the ID area is blank, or None if there is no pak header.
+    """
+    id_area = bytes(head[:0x100])
+    if not id_area.strip(b"\x00") or not id_area.strip(b"\xff"):
+        return 0
+    for swap_size in (1, 4, 2):
+        area = id_area if swap_size == 1 else byteswap(id_area, swap_size)
+        if any(_id_block_valid(area, offset) for offset in MPK_ID_BLOCK_OFFSETS):
+            return swap_size
+    return None
+
+
+def rank_candidates(size: int, head, ext: str = "", game=None) -> list[TypeCandidate]:
+    """
+    Rank save types for a file of size bytes whose first bytes are head.
+    Exact size matches come from SIZE_INDEX; content probes, the extension
+    and the game's entry in the game database then reweight them. Sizes
+    with no match get low-confidence guesses from the nearest known sizes.
+    """
+    exact = size in SIZE_INDEX
+    if exact:
+        types = SIZE_INDEX[size]
+        reasons = {save_type: [f"size {size} matches"] for save_type in types}
+    else:
+        above = min((known for known in SIZE_INDEX if known > size), default=None)
+        below = max((known for known in SIZE_INDEX if known < size), default=None)
+        types = list(dict.fromkeys(t for known in (below, above) if known for t in SIZE_INDEX[known]))
+        reasons = {save_type: [f"no save type is {size} bytes; nearest sizes {below}/{above}"] for save_type in types}
+    scores = dict.fromkeys(types, 1.0)
+    swap_sizes = dict.fromkeys(types, 1)
+
+    if SaveType.MPK in scores:
+        pak = probe_controller_pak(head)
+        if pak:
+            scores[SaveType.MPK] *= 20
+            swap_sizes[SaveType.MPK] = pak
+            reasons[SaveType.MPK].append("Controller Pak ID block checksum valid"
+                                         + (f" ({pak}-byte swapped)" if pak > 1 else ""))
+        elif pak is None:
+            scores[SaveType.MPK] *= 0.25
+            reasons[SaveType.MPK].append("no Controller Pak ID block")
+
+    ext_type = EXT_INDEX.get(ext.lower())
+    if ext_type in scores:
+        scores[ext_type] *= 1.5
+        reasons[ext_type].append(f"extension {ext.lower()} matches")
+
+    if game is not None:
+        for save_type in game.save_types:
+            if save_type in scores:
+                scores[save_type] *= GAME_DB_WEIGHT
+                reasons[save_type].append(f"game database lists it for {game.title}")
+
+    total = sum(scores.values()) or 1.0
+    scale = 1.0 if exact else 0.5
+    candidates = [TypeCandidate(save_type, scores[save_type] / total * scale, reasons[save_type], swap_sizes[save_type])
+                  for save_type in types]
+    return sorted(candidates, key=lambda candidate: candidate.confidence, reverse=True)
+
+
+def detect_save_type(path: str) -> list[TypeCandidate]:
+    """
+    Rank save types for a file from its size and first PROBE_SIZE bytes.
+    The filename is matched against the game database only when the size
+    alone leaves more than one type.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        head = f.read(PROBE_SIZE)
+    game = game_for_file(path) if len(SIZE_INDEX.get(size, ())) != 1 else None
+    return rank_candidates(size, head, os.path.splitext(path)[1], game)
+
+
+def classify_save(path: str, min_confidence: float = 0.5) -> SaveType | None:
+    """
+    Best save type for path, or None.
+    Known N64 extensions are trusted unless the size rules them out or the
+    content strongly disagrees (e.g. a .sra holding a Controller Pak).
+    Generic extensions such as .sav/.bin are classified by content;
+    anything else is not a save.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    ext_type = EXT_INDEX.get(ext)
+    if ext_type is None and ext not in GENERIC_SAVE_EXTS:
+        return None
+    try:
+        candidates = detect_save_type(path)
+    except OSError:
+        return ext_type
+    best = candidates[0] if candidates else None
+
+    if ext_type is not None:
+        if not best or best.save_type is ext_type:
+            return ext_type
+        size_rules_out_ext = all(candidate.save_type is not ext_type for candidate in candidates)
+        if best.confidence >= (min_confidence if size_rules_out_ext else OVERRIDE_CONFIDENCE):
+            return best.save_type
+        return ext_type
+    return best.save_type if best and best.confidence >= min_confidence else None
@@ -0,0 +1,118 @@
+# systems/n64/n64_diff.py
+
+from core.byte_compare import difference_flags, diff_runs, split_runs
+from core.byte_order import BYTE_ORDERS, apply_order
+from core.file_utils import read_bytes
+from .n64_constants import BYTE_ORDER_TYPES, SIZE_SRM
+from .n64_conversion_table import srm_sections
+
+# SRM sections as (name, start, end), in file order
+SRM_REGIONS = sorted(((save_type.name, offset, offset + size) for save_type, (size, offset, _) in srm_sections.items()),
+                     key=lambda region: region[1])
+
+
+def _order_label(order) -> str:
+    return "+".join(str(width) for width in order) or "none"
+
+
+def parse_order(text: str) -> tuple:
+    """Byte order from "none", "2", "4" or "2+4"."""
+    if text in ("", "none"):
+        return ()
+    try:
+        order = tuple(sorted({int(width) for width in text.split("+")}))
+    except ValueError:
+        order = None
+    if order not in BYTE_ORDERS:
+        raise ValueError(f"unknown byte order '{text}' (choose from: none, 2, 4, 2+4)")
+    return order
+
+
+def best_order(a, b) -> tuple:
+    """The swap order that makes b differ from a in the fewest bytes (ties keep b as is)."""
+    if len(b) % 4:
+        return ()
+    return min(BYTE_ORDERS, key=lambda order: (difference_flags(a, apply_order(b, order) if order else b).count(1),
+                                               len(order)))
+
+
+class SaveDiff:
+    """
+    Differences between two saves: runs [(start, end, region)] (half-open,
+    region is the SRM section name or None), the byte orders applied to the
+    second save before comparing ({region or "file": order}), and the two
+    buffers as compared (b after normalising).
+    """
+    __slots__ = ("size_a", "size_b", "runs", "orders", "a", "b")
+
+    def __init__(self, size_a, size_b, runs, orders, a=b"", b=b""):
+        self.size_a = size_a
+        self.size_b = size_b
+        self.runs = runs
+        self.orders = orders
+        self.a = a
+        self.b = b
+
+    def __repr__(self):
+        return f"SaveDiff({len(self.runs)} runs, {self.differing_bytes} bytes)"
+
+    @property
+    def differing_bytes(self) -> int:
+        return sum(end - start for start, end, _ in self.runs)
+
+    def by_region(self) -> dict:
+        """{region name: differing bytes} for regions with differences."""
+        totals = {}
+        for start, end, region in self.runs:
+            totals[region or "file"] = totals.get(region or "file", 0) + end - start
+        return totals
+
+    def preview(self, start: int, end: int, limit: int = 16) -> tuple[str, str]:
+        """Hex of the first bytes (at most limit) of a run on each side, as compared."""
+        end = min(end, start + limit)
+        return bytes(self.a[start:end]).hex(" "), bytes(self.b[start:end]).hex(" ")
+
+    def as_dict(self) -> dict:
+        return {
+            "size_a": self.size_a,
+            "size_b": self.size_b,
+            "identical": not self.runs,
+            "differing_bytes": self.differing_bytes,
+            "byte_order": {region: _order_label(order) for region, order in self.orders.items()},
+            "regions": self.by_region(),
+            "runs": [{"start": start, "end": end, "length": end - start, "region": region}
+                     for start, end, region in self.runs],
+        }
+
+
+def diff_bytes(a, b, normalize=None, srm=None, merge_gap: int = 0) -> SaveDiff:
+    """
+    Compare two saves. normalize: None (as is), a byte order applied to b,
+    or "auto" (per SRM SRAM/FlashRAM section, or for the whole save, the
+    order matching a best). srm (default: both SRM sized) reports which
+    section each run falls in.
+    """
+    if srm is None:
+        srm = len(a) == SIZE_SRM and len(b) == SIZE_SRM
+    orders = {}
+    if normalize == "auto" and srm:
+        b = bytearray(b)
+        for save_type in BYTE_ORDER_TYPES:
+            size, offset, _ = srm_sections[save_type]
+            order = best_order(memoryview(a)[offset:offset + size], memoryview(b)[offset:offset + size])
+            if order:
+                b[offset:offset + size] = apply_order(memoryview(b)[offset:offset + size], order)
+            orders[save_type.name] = order
+    elif normalize:
+        order = best_order(a, b) if normalize == "auto" else normalize
+        b = apply_order(b, order) if order else b
+        orders["file"] = order
+
+    runs = diff_runs(a, b, merge_gap)
+    pieces = split_runs(runs, SRM_REGIONS) if srm else [(start, end, None) for start, end in runs]
+    return SaveDiff(len(a), len(b), pieces, orders, a, b)
+
+
+def diff_files(path_a, path_b, normalize=None, srm=None, merge_gap: int = 0) -> SaveDiff:
+    """diff_bytes for two files."""
+    return diff_bytes(read_bytes(path_a), read_bytes(path_b), normalize, srm, merge_gap)
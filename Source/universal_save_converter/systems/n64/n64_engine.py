@@ -0,0 +1,310 @@
+# systems/n64/n64_engine.py
+
+import os
+from core.conversion_types import ConversionOptions, ConversionResult
+from core.exceptions import InvalidInputError, SaveSizeError, UnsupportedConversionError, VerificationError
+from core.file_utils import clone_file, read_range, write_bytes
+from core.byte_compare import first_difference
+from core.byte_order import combine, detect_byte_order
+from core.swap_utils import AUTO_SWAP, byteswap, determine_swap_size
+from core.transform_utils import TransformPlan, transform
+from .n64_conversion_plans import get_plan
+from .n64_constants import *
+
+# Bump whenever conversion output changes for the same plan and options (invalidates cached results)
+ENGINE_VERSION = 2
+
+# Below this confidence Auto byte order falls back to the table's swap
+AUTO_SWAP_MIN_CONFIDENCE = 0.6
+
+# Output extension for each target type label (raw copy fallback)
+EXT_MAP = {
+    EEP_LABEL: EEP_EXT,
+    SRA_LABEL: SRA_EXT,
+    FLA_LABEL: FLA_EXT,
+    MPK_LABEL: MPK_EXT,
+    SRM_LABEL: SRM_EXT
+}
+
+
+def detect_swaps(data, plan):
+    """
+    Auto byte order: return (swap widths for data under plan, confidence),
+    or (None, confidence) if the order cannot be told. The widths bring data
+    into plan.src's byte order, then apply the table's swap, so an input
+    already in its system's order gets exactly the default swap.
+    """
+    order, confidence = detect_byte_order(data)
+    if order is None or confidence < AUTO_SWAP_MIN_CONFIDENCE:
+        return None, confidence
+    default = determine_swap_size(swap_required_from_table=plan.swap_required)
+    return combine(order, SYSTEM_BYTE_ORDER[plan.src], (default,) if default > 1 else ()), confidence
+
+
+def source_range(src_size, src, src_type, tgt, tgt_type) -> tuple[int, int]:
+    """
+    (start, length) of the input bytes a conversion of a src_size-byte
+    input actually uses, e.g. the 2048-byte EEPROM window of an SRM.
+    """
+    plan = get_plan(src, src_type, tgt, tgt_type)
+    if plan is None:
+        return 0, src_size
+    start, _, length = plan.transform_plan(src_size, 1).window(src_size)
+    return start, length
+
+
+def round_trip(data, output, window, src, src_type, tgt, tgt_type, options, swaps=(), data_start=0,
+               src_size=None) -> str:
+    """
+    Convert output back to the source format in memory and check that the
+    source bytes the conversion used (window = (src_start, dst_start,
+    length) of the whole input; data starts data_start bytes into it) come
+    back unchanged. swaps are the widths the conversion applied and
+    src_size the whole input's size (default: len(data)). Uses the inverse
+    plan (e.g. RA→PJ64 SRA after PJ64→RA) only when it is an exact inverse
+    for this input: the input has a size the plan expects, the inverse swaps
+    the same way and puts the output bytes back where they came from.
+    Otherwise (Auto, odd or oversized inputs, or a table row that is no
+    exact inverse, e.g. PJ64→Native copies while Native→PJ64 swaps) it
+    undoes the offset and swaps directly. Returns how the inverse was made;
+    raises VerificationError with the first differing input offset.
+    """
+    src_start, dst_start, length = window
+    src_size = len(data) if src_size is None else src_size
+    forward = get_plan(src, src_type, tgt, tgt_type)
+    inverse = get_plan(tgt, tgt_type, src, src_type)
+    if inverse is not None:
+        inverse_swap = determine_swap_size(swap_required_from_table=inverse.swap_required,
+                                           user_choice=options.byteswap_option)
+        inv_src_start, inv_dst_start, inv_length = inverse.transform_plan(len(output), 1).window(len(output))
+        exact = (options.byteswap_option != AUTO_SWAP
+                 and forward is not None and forward.accepts_size(src_size)
+                 and ((inverse_swap,) if inverse_swap > 1 else ()) == tuple(swaps)
+                 # restored[src_start + i] must be output[dst_start + i] for the whole window
+                 and inv_dst_start - inv_src_start == src_start - dst_start
+                 and inv_dst_start <= src_start and src_start + length <= inv_dst_start + inv_length)
+        if not exact:
+            inverse = None
+    if inverse is not None:
+        inverse_options = ConversionOptions(byteswap_option=options.byteswap_option, fill_byte=options.fill_byte)
+        restored = memoryview(convert_bytes(output, tgt, tgt_type, src, src_type, inverse_options).data)
+        restored = restored[src_start:src_start + length]
+        method = inverse.key
+    else:
+        restored = memoryview(output)[dst_start:dst_start + length]
+        if swaps:
+            # Swaps are involutions: swapping the whole output again, in reverse
+            # order (they do not commute on a partial trailing chunk), undoes them
+            buffer = bytearray(output)
+            for width in reversed(swaps):
+                byteswap(buffer, width, in_place=True)
+            restored = memoryview(buffer)[dst_start:dst_start + length]
+        method = "inverse transform"
+    original = memoryview(data)[src_start - data_start:src_start - data_start + length]
+    offset = first_difference(original, restored)
+    if offset is not None:
+        found = f"{restored[offset]:02X}" if offset < len(restored) else "end of data"
+        raise VerificationError(f"Round trip via {method} differs at input offset {src_start + offset} "
+                                f"(expected {original[offset]:02X}, got {found}).")
+    return method
+
+
+def convert_bytes(data, src, src_type, tgt, tgt_type, options=None, source_ext="", out=None, src_size=None):
+    """
+    Headless N64 save conversion.
+    Transforms data in memory and returns a ConversionResult.
+    Never touches the GUI; raises ConversionError subclasses on failure.
+    out may be a reusable buffer of the target size (see transform).
+    With src_size, data holds only the source_range() window of a
+    src_size-byte input; the output is the same as for the whole input.
+    options.verify adds a round_trip() check of the output.
+    """
+    options = options or ConversionOptions()
+    if not data and not src_size:
+        raise InvalidInputError("Input save data is empty.")
+    data_start = 0 if src_size is None else source_range(src_size, src, src_type, tgt, tgt_type)[0]
+    src_size = len(data) if src_size is None else src_size
+
+    messages = []
+    plan = get_plan(src, src_type, tgt, tgt_type)
+
+    if plan:
+        messages.append(("CONVERSION", f"Using conversion plan: {plan.key}"))
+        if plan.native_copy:
+            messages.append(("CONVERSION", "Target is Native — using direct copy."))
+        if not plan.accepts_size(src_size):
+            expected = ", ".join(str(size) for size in plan.src_sizes)
+            if options.strict_size:
+                raise SaveSizeError(f"Input is {src_size} bytes; {plan.key} expects {expected}.")
+            messages.append(("WARN", f"Unexpected input size {src_size} bytes (expected {expected})."))
+        swap_required = plan.swap_required
+        extension = plan.extension
+    elif options.allow_raw_copy:
+        messages.append(("WARN", "No matching conversion found; using raw copy."))
+        swap_required = False
+        extension = EXT_MAP.get(tgt_type, source_ext)
+    else:
+        raise UnsupportedConversionError(f"No conversion available for: {src}/{src_type} → {tgt}/{tgt_type}")
+
+    # --- Fused resize + offset + byte swap ---
+    swap_size = determine_swap_size(swap_required_from_table=swap_required,
+                                    user_choice=options.byteswap_option)
+    fill = FILL_BLANK if options.fill_byte is None else options.fill_byte
+    if plan:
+        transform_plan = plan.transform_plan(src_size, swap_size, fill)
+    else:
+        transform_plan = TransformPlan(src_size, 0, swap_size, fill)
+    tgt_size, offset = transform_plan.target_size, transform_plan.offset
+
+    # --- Auto byte order: correct the input's detected order, then apply the table's swap ---
+    swap_confidence = None
+    extra_swaps = ()
+    if (plan and options.byteswap_option == AUTO_SWAP
+            and (plan.src_type in BYTE_ORDER_TYPES or plan.tgt_type in BYTE_ORDER_TYPES)):
+        src_start, _, length = transform_plan.window(src_size)
+        src_start -= data_start
+        swaps, swap_confidence = detect_swaps(memoryview(data)[src_start:src_start + length], plan)
+        if swaps is None:
+            messages.append(("WARN", f"Could not detect the byte order (confidence {swap_confidence:.0%}); "
+                                     f"using the default swap."))
+        else:
+            swap_size, extra_swaps = (swaps[0], swaps[1:]) if swaps else (1, ())
+            transform_plan = plan.transform_plan(src_size, swap_size, fill)
+            messages.append(("CONVERSION", f"Detected the input byte order (confidence {swap_confidence:.0%})."))
+
+    messages.append(("CONVERSION", f"Resizing data to {tgt_size} bytes (offset {offset})"))
+    if swap_size > 1:
+        for width in (swap_size, *extra_swaps):
+            messages.append(("CONVERSION", f"Applying {width}-byte swap..."))
+    else:
+        messages.append(("CONVERSION", "No byte swap applied."))
+    window = transform_plan.window(src_size)
+    if data_start:
+        # data starts data_start bytes into the input: shift the plan to match
+        transform_plan = TransformPlan(tgt_size, offset + data_start, transform_plan.swap_size, fill)
+    output = transform(data, transform_plan, out=out)
+    for width in extra_swaps:
+        byteswap(output, width, in_place=True)
+
+    verified = False
+    if options.verify:
+        swaps = (transform_plan.swap_size, *extra_swaps) if transform_plan.swap_size > 1 else extra_swaps
+        method = round_trip(data, output, window, src, src_type, tgt, tgt_type, options, swaps, data_start,
+                            src_size)
+        messages.append(("CONVERSION", f"Round trip verified via {method}."))
+        verified = True
+
+    return ConversionResult(
+        data=output,
+        extension=extension,
+        tgt_size=tgt_size,
+        offset=offset,
+        swap_size=swap_size,
+        plan_key=plan.key if plan else None,
+        messages=messages,
+        swap_confidence=swap_confidence,
+        verified=verified
+    )
+
+
+def cache_recipe(src, src_type, tgt, tgt_type, options=None):
+    """Describe a conversion for ResultCache keys: engine version, plan and options."""
+    plan = get_plan(src, src_type, tgt, tgt_type)
+    selection = plan.key if plan else f"raw:{src}/{src_type}->{tgt}/{tgt_type}"
+    return f"n64/{ENGINE_VERSION}|{selection}|{options or ConversionOptions()!r}"
+
+
+def is_identity(size, src, src_type, tgt, tgt_type, options=None) -> bool:
+    """
+    True if converting a size-byte input leaves it unchanged (same size,
+    offset 0, no swap), so the file can be copied as is. Raw copies
+    qualify too. Auto byte order needs the data, so SRAM/FlashRAM under
+    Auto never do.
+    """
+    options = options or ConversionOptions()
+    plan = get_plan(src, src_type, tgt, tgt_type)
+    if size == 0 or (plan is None and not options.allow_raw_copy):
+        return False
+    if plan is None:
+        return options.byteswap_option not in ("2 bytes", "4 bytes")
+    if options.byteswap_option == AUTO_SWAP and (src_type in BYTE_ORDER_TYPES or tgt_type in BYTE_ORDER_TYPES):
+        return False
+    if options.strict_size and not plan.accepts_size(size):
+        return False
+    swap_size = determine_swap_size(swap_required_from_table=plan.swap_required,
+                                    user_choice=options.byteswap_option)
+    return plan.transform_plan(size, swap_size).is_identity(size)
+
+
+def copy_identity(path, out_path, src, src_type, tgt, tgt_type, link_mode="copy") -> ConversionResult:
+    """Write an identity conversion (see is_identity) by copying or linking path to out_path."""
+    size = os.path.getsize(path)
+    plan = get_plan(src, src_type, tgt, tgt_type)
+    extension = plan.extension if plan else EXT_MAP.get(tgt_type, os.path.splitext(path)[1])
+    result = ConversionResult(data=None, extension=extension, tgt_size=size, offset=0,
+                              swap_size=1, plan_key=plan.key if plan else None)
+    if plan is None:
+        result.note("No matching conversion found; using raw copy.", level="WARN")
+    else:
+        result.note(f"Using conversion plan: {plan.key}", level="CONVERSION")
+        if plan.native_copy:
+            result.note("Target is Native — using direct copy.", level="CONVERSION")
+        if not plan.accepts_size(size):
+            expected = ", ".join(str(n) for n in plan.src_sizes)
+            result.note(f"Unexpected input size {size} bytes (expected {expected}).", level="WARN")
+    result.copy_method = clone_file(path, out_path, link_mode)
+    result.note(f"Input already in target format; copied with {result.copy_method}.", level="CONVERSION")
+    result.out_path = out_path
+    result.note(f"File written successfully → {out_path}", level="SUCCESS")
+    return result
+
+
+def convert_file(path, out_path, src, src_type, tgt, tgt_type, options=None, cache=None, link_mode="copy"):
+    """
+    Headless file-to-file N64 save conversion.
+    Reads path, converts it and writes the result to out_path.
+    Identity conversions skip Python entirely: the file is copied in the
+    kernel, or hard-linked/reflinked per link_mode (see clone_file).
+    Otherwise only the source_range() window is read, into a pooled buffer.
+    With a ResultCache, identical inputs reuse the stored output.
+    """
+    if not path or not os.path.exists(path):
+        raise InvalidInputError(f"Invalid input path: {path}")
+
+    src_size = os.path.getsize(path)
+    if (is_identity(src_size, src, src_type, tgt, tgt_type, options)
+            and os.path.abspath(path) != os.path.abspath(out_path)):
+        result = copy_identity(path, out_path, src, src_type, tgt, tgt_type, link_mode)
+        if options is not None and options.verify:
+            # An unchanged copy round-trips by construction
+            result.verified = True
+        return result
+
+    start, length = source_range(src_size, src, src_type, tgt, tgt_type)
+    data, src_size = read_range(path, start, length)
+    if cache is not None:
+        recipe = cache_recipe(src, src_type, tgt, tgt_type, options)
+        key = cache.key(data, f"{recipe}|{start}+{src_size}")
+        meta = cache.fetch(key, out_path)
+        if meta is not None:
+            result = ConversionResult(data=None, out_path=out_path, cached=True, **meta)
+            result.note(f"Reused cached result {key[:12]} → {out_path}", level="SUCCESS")
+            return result
+
+    result = convert_bytes(data, src, src_type, tgt, tgt_type, options,
+                           source_ext=os.path.splitext(path)[1], src_size=src_size)
+    write_bytes(result.data, out_path)
+    if cache is not None:
+        cache.put(key, result.data, {
+            "extension": result.extension,
+            "tgt_size": result.tgt_size,
+            "offset": result.offset,
+            "swap_size": result.swap_size,
+            "swap_confidence": result.swap_confidence,
+            "verified": result.verified,
+            "plan_key": result.plan_key,
+            "messages": result.messages
+        })
+    result.out_path = out_path
+    result.note(f"File written successfully → {out_path}", level="SUCCESS")
+    return result
@@ -0,0 +1,254 @@
+# systems/n64/n64_game_db.py
+
+import json
+import os
+import re
+import unicodedata
+from core.result_cache import default_cache_dir
+from .n64_constants import SaveType
+
+# Game list grouped by save type (a copy of Old Files/Lookup.txt, kept for the archived Java tool)
+DB_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "resources", "n64_save_types.txt")
+
+# Bump when the parsed layout or normalisation changes, invalidating cached indexes
+DB_FORMAT = 2
+
+# Section headings in the game list → save type (None: the game does not save)
+SECTION_TYPES = {
+    "controller pak": SaveType.MPK,
+    "eeprom": SaveType.EEP,
+    "sram": SaveType.SRA,
+    "flashram": SaveType.FLA,
+    "no save": None,
+}
+
+# Minimum trigram similarity (Dice coefficient) for a fuzzy filename match
+MIN_MATCH_SCORE = 0.6
+
+_BRACKETED = re.compile(r"\([^)]*\)|\[[^\]]*\]|\{[^}]*\}")
+_TRAILING_ARTICLE = re.compile(r",\s*(the|a|an)\s*$", re.IGNORECASE)
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+_NOTE = re.compile(r"^(?P<title>.+?) uses ")
+_ARTICLES = frozenset(("the", "a", "an"))
+
+
+def normalize_title(text: str) -> str:
+    """
+    Reduce a game title or save filename to its lookup key: lower case ASCII
+    words with bracketed tags (regions, revisions), articles and
+    punctuation removed. "Legend of Zelda: Ocarina of Time, The" and
+    "Legend of Zelda, The - Ocarina of Time (USA)" share one key.
+    """
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    text = _TRAILING_ARTICLE.sub("", _BRACKETED.sub(" ", text))
+    text = text.lower().replace("&", " and ").replace("'", "")
+    return " ".join(word for word in _NON_WORD.sub(" ", text).split() if word not in _ARTICLES)
+
+
+def trigrams(key: str) -> set[str]:
+    """Character trigrams of a lookup key, padded so word boundaries count."""
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class GameEntry:
+    """One game: display title, lookup key and the save types it uses (empty: no save)."""
+    __slots__ = ("title", "key", "save_types")
+
+    def __init__(self, title, key, save_types=()):
+        self.title = title
+        self.key = key
+        self.save_types = save_types
+
+    def __repr__(self):
+        return f"GameEntry({self.title!r}, {[t.name for t in self.save_types]})"
+
+
+class GameMatch:
+    """A database entry matched to a name, with its similarity score (0–1)."""
+    __slots__ = ("entry", "score")
+
+    def __init__(self, entry, score):
+        self.entry = entry
+        self.score = score
+
+    def __repr__(self):
+        return f"GameMatch({self.entry.title!r}, {self.score:.2f})"
+
+
+def parse_game_list(text: str) -> list[GameEntry]:
+    """
+    Parse the game list: "=====" framed section headings followed by one
+    title per line. Games listed under several sections get every type;
+    "<title> uses ..." lines are notes about a game in the current section.
+    """
+    entries = {}
+    section = None
+    in_heading = False
+    for raw in text.splitlines():
+        line = raw.strip()
+        if line.startswith("==="):
+            in_heading = not in_heading
+            continue
+        if in_heading:
+            heading = _BRACKETED.sub("", line).strip().lower()
+            section = heading if heading in SECTION_TYPES else None
+            continue
+        if not line or section is None:
+            continue
+
+        note = _NOTE.match(line)
+        title = note.group("title") if note else line
+        key = normalize_title(title)
+        if not key:
+            continue
+        entry = entries.get(key)
+        if entry is None:
+            entry = entries[key] = GameEntry(title, key)
+        save_type = SECTION_TYPES[section]
+        if save_type is not None and save_type not in entry.save_types:
+            entry.save_types += (save_type,)
+    return list(entries.values())
+
+
+class GameDatabase:
+    """
+    Game title → save type index.
+
+    Exact lookups go through a dict of normalised titles. Fuzzy lookups
+    score only the entries sharing a trigram with the query, found through
+    an inverted trigram index, so a match costs microseconds.
+    """
+    __slots__ = ("entries", "by_key", "trigram_index", "trigram_counts")
+
+    def __init__(self, entries, trigram_index=None, trigram_counts=None):
+        self.entries = list(entries)
+        self.by_key = {entry.key: entry for entry in self.entries}
+        if trigram_index is None:
+            index = {}
+            counts = []
+            for entry_id, entry in enumerate(self.entries):
+                grams = trigrams(entry.key)
+                counts.append(len(grams))
+                for gram in grams:
+                    index.setdefault(gram, []).append(entry_id)
+            trigram_index, trigram_counts = index, counts
+        self.trigram_index = {gram: tuple(ids) for gram, ids in trigram_index.items()}
+        self.trigram_counts = tuple(trigram_counts)
+
+    def __len__(self):
+        return len(self.entries)
+
+    @classmethod
+    def from_file(cls, path=DB_PATH) -> "GameDatabase":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(parse_game_list(f.read()))
+
+    def to_json(self) -> dict:
+        """Plain-data form of the built indexes (see from_json)."""
+        return {
+            "entries": [[entry.title, entry.key, [t.name for t in entry.save_types]] for entry in self.entries],
+            "trigram_index": self.trigram_index,
+            "trigram_counts": self.trigram_counts,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> "GameDatabase":
+        """Rebuild a database from to_json() output without re-indexing."""
+        entries = [GameEntry(title, key, tuple(SaveType[name] for name in types))
+                   for title, key, types in data["entries"]]
+        return cls(entries, data["trigram_index"], data["trigram_counts"])
+
+    def lookup(self, name: str) -> GameEntry | None:
+        """Entry whose normalised title equals name's, or None."""
+        return self.by_key.get(normalize_title(name))
+
+    def search(self, name: str, limit: int = 5, min_score: float = MIN_MATCH_SCORE) -> list[GameMatch]:
+        """Best fuzzy matches for name (a title or filename stem), highest score first."""
+        key = normalize_title(name)
+        if not key:
+            return []
+        exact = self.by_key.get(key)
+        if exact is not None:
+            return [GameMatch(exact, 1.0)]
+
+        query = trigrams(key)
+        shared = {}
+        for gram in query:
+            for entry_id in self.trigram_index.get(gram, ()):
+                shared[entry_id] = shared.get(entry_id, 0) + 1
+
+        matches = []
+        for entry_id, count in shared.items():
+            score = 2 * count / (len(query) + self.trigram_counts[entry_id])
+            if score >= min_score:
+                matches.append(GameMatch(self.entries[entry_id], score))
+        matches.sort(key=lambda match: match.score, reverse=True)
+        return matches[:limit]
+
+    def match(self, name: str, min_score: float = MIN_MATCH_SCORE) -> GameEntry | None:
+        """The single best entry for name, or None."""
+        matches = self.search(name, limit=1, min_score=min_score)
+        return matches[0].entry if matches else None
+
+
+def load_database(path=DB_PATH, cache_path=None) -> GameDatabase:
+    """
+    Load the game database, reusing a JSON copy of the built indexes while
+    the game list file is unchanged (same size and mtime). The cache is
+    plain data, so a tampered cache file cannot run code when loaded.
+    """
+    stat = os.stat(path)
+    stamp = [DB_FORMAT, stat.st_size, stat.st_mtime_ns]
+    cache_path = cache_path or os.path.join(default_cache_dir("game_db"), "n64_games.json")
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached["stamp"] == stamp:
+            return GameDatabase.from_json(cached)
+    except (OSError, ValueError, KeyError, TypeError, IndexError):
+        pass
+
+    database = GameDatabase.from_file(path)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"stamp": stamp, **database.to_json()}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # the cache only saves start-up time
+    return database
+
+
+_database = None
+
+
+def get_database() -> GameDatabase:
+    """The packaged game database, loaded on first use."""
+    global _database
+    if _database is None:
+        _database = load_database()
+    return _database
+
+
+def game_for_file(path: str) -> GameEntry | None:
+    """Game a save file belongs to, matched on its filename, or None."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    try:
+        return get_database().match(stem)
+    except OSError:
+        return None
+
+
+def guess_save_type(path: str, allowed=None) -> SaveType | None:
+    """
+    Native save type of the game a file is named after, or None if the
+    game is unknown or uses several types. allowed narrows the choice
+    (e.g. to the sections of an SRM).
+    """
+    entry = game_for_file(path)
+    if entry is None:
+        return None
+    types = [save_type for save_type in entry.save_types if allowed is None or save_type in allowed]
+    return types[0] if len(types) == 1 else None
@@ -0,0 +1,37 @@
+# systems/n64/n64_resolve.py
+
+import os
+from .n64_constants import SaveType
+from .n64_conversion_table import srm_sections
+from .n64_detect import SIZE_INDEX, classify_save
+from .n64_game_db import guess_save_type
+from .n64_rom import rom_save_type
+from .n64_srm import suggest_srm_target
+from .n64_utils import resolve_target_type
+
+
+def resolve_types(path, src, tgt, forced_src_type=None, forced_tgt_type=None, roms=None):
+    """
+    Return (src_type, tgt_type, error) for one input: forced types, else the
+    matching ROM, the file's extension/size/content and, for SRM sources,
+    the section holding data. error is set (and a type None) if unresolved.
+    """
+    roms = roms or {}
+    src_type = forced_src_type
+    if src_type is None and roms:
+        # The matching ROM's save type, if the file is that type's size
+        src_type = rom_save_type(roms, path)
+        if src_type is not None and src_type not in SIZE_INDEX.get(os.path.getsize(path), ()):
+            src_type = None
+    src_type = src_type or classify_save(path)
+    if src_type is None:
+        return None, None, "Unknown save type."
+
+    tgt_type = resolve_target_type(src, src_type, tgt, forced_tgt_type)
+    if tgt_type is None and src_type is SaveType.SRM:
+        # Pick the section that actually holds the save, else the one the game uses
+        tgt_type = (suggest_srm_target(path) or rom_save_type(roms, path, srm_sections)
+                    or guess_save_type(path, srm_sections))
+    if tgt_type is None:
+        return src_type, None, "Ambiguous target type; pass --tgt-type."
+    return src_type, tgt_type, None
@@ -0,0 +1,53 @@
+# systems/n64/n64_rom.py
+
+import os
+from core.rom_scanner import RomIndex, rom_for_save
+from .n64_constants import SaveType
+from .n64_game_db import get_database
+
+# A header match must beat the runner-up (with other save types) by this much
+AMBIGUITY_MARGIN = 0.05
+
+
+def _best_game(name: str):
+    """Best game database entry for name, or None if a different-typed game scores about as well."""
+    matches = get_database().search(name, limit=2)
+    if not matches:
+        return None
+    best = matches[0]
+    if len(matches) > 1:
+        runner_up = matches[1]
+        if (runner_up.entry.save_types != best.entry.save_types
+                and best.score - runner_up.score < AMBIGUITY_MARGIN):
+            return None
+    return best.entry
+
+
+def resolve_save_types(info) -> list[str]:
+    """
+    Save type names for an N64 ROM. The header does not name the save
+    chip, so its internal name is matched against the game database,
+    falling back to the ROM's filename.
+    """
+    stem = os.path.splitext(os.path.basename(info.path))[0]
+    entry = _best_game(info.title) if info.title else None
+    entry = entry or _best_game(stem)
+    return [save_type.name for save_type in entry.save_types] if entry else []
+
+
+def scan_rom_dir(directory: str, recursive: bool = False, cache_path=None) -> dict:
+    """Scan a ROM folder (cached by ROM size and mtime); returns {basename: RomInfo}."""
+    return RomIndex(cache_path, resolvers={"n64": resolve_save_types}).scan(directory, recursive)
+
+
+def rom_save_type(roms: dict, path: str, allowed=None) -> SaveType | None:
+    """
+    Save type of the N64 ROM sharing path's basename, or None if there is
+    no such ROM or it uses several types. allowed narrows the choice.
+    """
+    info = rom_for_save(roms, path)
+    if info is None or info.system != "n64":
+        return None
+    types = [SaveType[name] for name in info.save_types if name in SaveType.__members__]
+    types = [save_type for save_type in types if allowed is None or save_type in allowed]
+    return types[0] if len(types) == 1 else None
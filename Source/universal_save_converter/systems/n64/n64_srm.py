@@ -0,0 +1,323 @@
+# systems/n64/n64_srm.py
+
+import os
+from functools import lru_cache
+from core.byte_stats import byte_entropy
+from core.conversion_types import ConversionOptions, ConversionResult
+from core.exceptions import InvalidInputError, SaveReadError, SaveSizeError
+from core.file_utils import read_bytes, write_bytes
+from core.swap_utils import AUTO_SWAP, byteswap, byteswap_into, determine_swap_size
+from .n64_conversion_plans import get_plan
+from .n64_engine import detect_swaps
+from .n64_conversion_table import srm_sections
+from .n64_detect import classify_save
+from .n64_constants import (
+    FILL_BLANK, FILL_ERASED, SIZE_SRM, SIZE_MPK_PAK, SRM_EXT,
+    MPK_NOTE_TABLE_OFFSET, MPK_NOTE_TABLE_SIZE, BYTE_ORDER_TYPES,
+    SaveSystem, SaveType
+)
+
+# Section states in an occupancy map
+SECTION_BLANK = "blank"          # a single fill byte throughout
+SECTION_EMPTY_PAK = "formatted"  # Controller Paks formatted with no saves (RetroArch initialises these)
+SECTION_USED = "used"
+
+
+@lru_cache(maxsize=16)
+def _fill_block(fill: int, length: int) -> bytes:
+    """Reference block of length fill bytes for memcmp blank checks."""
+    return bytes([fill]) * length
+
+
+def is_blank(data, start: int = 0, end: int | None = None) -> bool:
+    """True if data[start:end] holds a single fill byte (0x00 or 0xFF), i.e. was never written."""
+    end = len(data) if end is None else end
+    length = end - start
+    if length <= 0:
+        return True
+    first = data[start]
+    if first not in (FILL_BLANK, FILL_ERASED):
+        return False
+    block = _fill_block(first, length)
+    if isinstance(data, (bytes, bytearray)):
+        # startswith() compares in place with memcmp, stopping at the first written byte
+        return data.startswith(block, start)
+    return bytes(data[start:end]) == block
+
+
+class SectionUsage:
+    """Occupancy of one SRM section: state, non-fill byte count and byte entropy."""
+    __slots__ = ("save_type", "offset", "size", "state", "used_bytes", "entropy")
+
+    def __init__(self, save_type, offset, size, state, used_bytes=0, entropy=0.0):
+        self.save_type = save_type
+        self.offset = offset
+        self.size = size
+        self.state = state
+        self.used_bytes = used_bytes
+        self.entropy = entropy
+
+    def __repr__(self):
+        return (f"SectionUsage({self.save_type.name}, {self.state}, "
+                f"used_bytes={self.used_bytes}, entropy={self.entropy:.2f})")
+
+    @property
+    def used(self) -> bool:
+        return self.state == SECTION_USED
+
+    def as_dict(self) -> dict:
+        return {"type": self.save_type.name, "offset": self.offset, "size": self.size, "state": self.state,
+                "used_bytes": self.used_bytes, "entropy": round(self.entropy, 3)}
+
+
+def _pak_has_notes(data, start, end) -> bool:
+    """True if any Controller Pak in data[start:end] has a non-empty note table."""
+    for pak in range(start, end, SIZE_MPK_PAK):
+        table = pak + MPK_NOTE_TABLE_OFFSET
+        if not is_blank(data, table, table + MPK_NOTE_TABLE_SIZE):
+            return True
+    return False
+
+
+def analyze_srm(data, detail: bool = True) -> dict:
+    """
+    Build the occupancy map of an SRM: {SaveType: SectionUsage} in file order.
+
+    Blank checks are memcmp comparisons that stop at the first written byte.
+    A Controller Pak section counts as used only if one of its paks has
+    saves in its note table. With detail, used sections also get their
+    non-fill byte count and byte entropy (full-section passes).
+    """
+    occupancy = {}
+    for save_type, (size, srm_offset, _) in srm_sections.items():
+        end = srm_offset + size
+        if is_blank(data, srm_offset, end):
+            state = SECTION_BLANK
+        elif save_type is SaveType.MPK and not _pak_has_notes(data, srm_offset, end):
+            state = SECTION_EMPTY_PAK
+        else:
+            state = SECTION_USED
+        usage = SectionUsage(save_type, srm_offset, size, state)
+        if detail and state != SECTION_BLANK:
+            usage.used_bytes = size - max(data.count(FILL_BLANK, srm_offset, end),
+                                          data.count(FILL_ERASED, srm_offset, end))
+            usage.entropy = byte_entropy(data, srm_offset, end)
+        occupancy[save_type] = usage
+    return occupancy
+
+
+def suggest_target_type(occupancy) -> SaveType | None:
+    """
+    The used section with the most data, or None if the SRM is empty.
+    Ranking several used sections needs a detailed occupancy map.
+    """
+    used = [usage for usage in occupancy.values() if usage.used]
+    return max(used, key=lambda usage: usage.used_bytes).save_type if used else None
+
+
+def suggest_srm_target(path: str) -> SaveType | None:
+    """Read an SRM file and return the target type holding its save data, or None."""
+    try:
+        buffer, _ = read_srm(path)
+    except SaveReadError:
+        return None
+    occupancy = analyze_srm(buffer, detail=False)
+    if sum(usage.used for usage in occupancy.values()) > 1:
+        occupancy = analyze_srm(buffer)
+    return suggest_target_type(occupancy)
+
+
+def section_swaps(plan, data, save_type, options, result) -> tuple:
+    """
+    Swap widths for one section: the table/user choice, or with Auto the
+    table's swap after correcting the detected byte order (see detect_swaps;
+    the detection is recorded on result).
+    """
+    default = determine_swap_size(swap_required_from_table=plan.swap_required,
+                                  user_choice=options.byteswap_option)
+    default = (default,) if default > 1 else ()
+    if options.byteswap_option != AUTO_SWAP or save_type not in BYTE_ORDER_TYPES:
+        return default
+    swaps, confidence = detect_swaps(data, plan)
+    result.swap_confidence = confidence
+    if swaps is None:
+        result.note(f"Could not detect the {save_type.name} byte order (confidence {confidence:.0%}); "
+                    f"using the default swap.", level="WARN")
+        return default
+    result.note(f"Detected the {save_type.name} byte order (confidence {confidence:.0%}).", level="CONVERSION")
+    return swaps
+
+
+def read_srm(path: str, strict_size: bool = False) -> tuple[bytearray, int]:
+    """
+    Read a RetroArch SRM with a single readinto() into a SIZE_SRM buffer.
+    Returns (buffer, input file size). Short files leave the missing tail
+    blank and long ones are truncated; strict_size raises SaveSizeError
+    for anything but SIZE_SRM bytes.
+    """
+    buffer = bytearray(SIZE_SRM)
+    try:
+        with open(path, "rb") as f:
+            file_size = os.fstat(f.fileno()).st_size
+            if strict_size and file_size != SIZE_SRM:
+                raise SaveSizeError(f"Input is {file_size} bytes; an SRM is {SIZE_SRM}.")
+            f.readinto(buffer)
+    except OSError as e:
+        raise SaveReadError(f"Could not read file: {path}") from e
+    return buffer, file_size
+
+
+def split_srm(buffer, tgt, options=None, include_blank=False) -> list[ConversionResult]:
+    """
+    Split an SRM buffer into its EEP/MPK/SRA/FLA sections for target system tgt.
+
+    Each section's swap is applied in place, so buffer is modified and each
+    result's data is a zero-copy memoryview into it. Sections without save
+    data (see analyze_srm) are skipped unless include_blank is set.
+    """
+    options = options or ConversionOptions()
+    view = memoryview(buffer)
+    occupancy = analyze_srm(buffer)
+    results = []
+
+    for save_type, (size, srm_offset, _) in srm_sections.items():
+        plan = get_plan(SaveSystem.RA, SaveType.SRM, tgt, save_type)
+        end = srm_offset + size
+        if not include_blank and not occupancy[save_type].used:
+            continue
+
+        section = view[srm_offset:end]
+        result = ConversionResult(
+            data=section,
+            extension=plan.extension,
+            tgt_size=size,
+            offset=plan.offset,
+            swap_size=1,
+            plan_key=plan.key
+        )
+        result.note(f"Using conversion plan: {plan.key}", level="CONVERSION")
+        swaps = section_swaps(plan, section, save_type, options, result)
+        for width in swaps:
+            byteswap_into(section, section, width)
+        swap_size = result.swap_size = swaps[0] if swaps else 1
+        result.note(f"Section {save_type.name}: {size} bytes at offset {srm_offset}"
+                    + (f", {swap_size}-byte swap" if swap_size > 1 else ""), level="CONVERSION")
+        results.append(result)
+    return results
+
+
+def explode_srm(path, out_dir, tgt, options=None, include_blank=False) -> list[ConversionResult]:
+    """
+    Read an SRM once and write each populated section to out_dir as a
+    separate save for target system tgt, named <input stem><extension>.
+    Returns one result per file written.
+    """
+    options = options or ConversionOptions()
+    buffer, file_size = read_srm(path, strict_size=options.strict_size)
+    results = split_srm(buffer, tgt, options, include_blank)
+
+    stem = os.path.splitext(os.path.basename(path))[0]
+    for result in results:
+        if file_size != SIZE_SRM:
+            result.note(f"Unexpected input size {file_size} bytes (expected {SIZE_SRM}).", level="WARN")
+        out_path = os.path.join(out_dir, stem + result.extension)
+        write_bytes(result.data, out_path)
+        result.out_path = out_path
+        result.note(f"File written successfully → {out_path}", level="SUCCESS")
+    return results
+
+
+def merge_sections(sections, src, options=None) -> ConversionResult:
+    """
+    Assemble one SRM from (SaveType, data) pairs saved by system src.
+
+    Every section is swapped straight into its window of a single
+    preallocated SIZE_SRM buffer; unused space stays blank. Raises
+    InvalidInputError for duplicate sections and SaveSizeError for data
+    that would spill into the next section.
+    """
+    options = options or ConversionOptions()
+    buffer = bytearray(SIZE_SRM)
+    view = memoryview(buffer)
+    result = ConversionResult(data=buffer, extension=SRM_EXT, tgt_size=SIZE_SRM, offset=0, swap_size=1)
+    plan_keys = []
+
+    seen = set()
+    for save_type, data in sections:
+        if save_type not in srm_sections:
+            raise InvalidInputError(f"{save_type.value} saves cannot be packed into an SRM.")
+        if save_type in seen:
+            raise InvalidInputError(f"More than one {save_type.name} input; each SRM section takes one save.")
+        seen.add(save_type)
+
+        size, srm_offset, _ = srm_sections[save_type]
+        if not data:
+            raise InvalidInputError(f"{save_type.name} input is empty.")
+        if len(data) > size:
+            raise SaveSizeError(f"{save_type.name} input is {len(data)} bytes; its SRM section holds {size}.")
+
+        plan = get_plan(src, save_type, SaveSystem.RA, SaveType.SRM)
+        if not plan.accepts_size(len(data)):
+            expected = ", ".join(str(n) for n in plan.src_sizes)
+            if options.strict_size:
+                raise SaveSizeError(f"Input is {len(data)} bytes; {plan.key} expects {expected}.")
+            result.note(f"Unexpected {save_type.name} size {len(data)} bytes (expected {expected}).", level="WARN")
+
+        swaps = section_swaps(plan, data, save_type, options, result)
+        window = view[srm_offset:srm_offset + len(data)]
+        byteswap_into(window, data, swaps[0] if swaps else 1)
+        for width in swaps[1:]:
+            byteswap(window, width, in_place=True)
+        swap_size = swaps[0] if swaps else 1
+        result.swap_size = max(result.swap_size, swap_size)
+        plan_keys.append(plan.key)
+        result.note(f"Section {save_type.name}: {len(data)} bytes at offset {srm_offset}"
+                    + (f", {swap_size}-byte swap" if swap_size > 1 else ""), level="CONVERSION")
+
+    if not plan_keys:
+        raise InvalidInputError("No saves given to pack.")
+    result.plan_key = "+".join(plan_keys)
+    return result
+
+
+def pack_srm(inputs, out_path, src, options=None) -> ConversionResult:
+    """
+    Pack native saves into one RetroArch SRM at out_path with a single write.
+    inputs holds paths, or (path, SaveType) pairs to override type detection.
+    """
+    sections = []
+    for item in inputs:
+        path, save_type = item if isinstance(item, tuple) else (item, None)
+        if not path or not os.path.isfile(path):
+            raise InvalidInputError(f"Invalid input path: {path}")
+        if os.path.abspath(path) == os.path.abspath(out_path):
+            raise InvalidInputError(f"Output would overwrite the input: {path}")
+        if save_type is None:
+            save_type = classify_save(path)
+            if not save_type:
+                raise InvalidInputError(f"Cannot detect the save type of {path}.")
+        sections.append((save_type, read_bytes(path)))
+
+    result = merge_sections(sections, src, options)
+    write_bytes(result.data, out_path)
+    result.out_path = out_path
+    result.note(f"File written successfully → {out_path}", level="SUCCESS")
+    return result
+
+
+def update_srm(path, sections, src, options=None) -> ConversionResult:
+    """
+    Merge (SaveType, data) sections into the SRM at path, keeping every
+    other section as it is (a missing file starts blank). One read, one write.
+    """
+    result = merge_sections(sections, src, options)
+    if os.path.exists(path):
+        buffer, _ = read_srm(path)
+        for save_type, _ in sections:
+            size, srm_offset, _ = srm_sections[save_type]
+            buffer[srm_offset:srm_offset + size] = result.data[srm_offset:srm_offset + size]
+        result.data = buffer
+    write_bytes(result.data, path)
+    result.out_path = path
+    result.note(f"File written successfully → {path}", level="SUCCESS")
+    return result
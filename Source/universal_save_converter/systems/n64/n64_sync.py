@@ -0,0 +1,231 @@
+# systems/n64/n64_sync.py
+
+import os
+from core.conversion_types import ConversionOptions
+from core.exceptions import ConversionError
+from core.file_utils import read_bytes
+from core.sync_manifest import SyncManifest, default_manifest_path, file_digest, scan_tree
+from .n64_constants import SaveType, SAVE_TYPE_EXT
+from .n64_conversion_table import srm_sections
+from .n64_engine import convert_file
+from .n64_resolve import resolve_types
+from .n64_srm import analyze_srm, read_srm, update_srm
+
+# How conflicts (both sides changed since the last sync) are settled
+PREFER_CHOICES = ("none", "newer", "a", "b")
+
+
+class SyncAction:
+    """
+    One step of a sync plan.
+    kind: "convert" (src_side → other side), "conflict", "missing" or "refresh"
+    (stat changed but content did not: only the manifest is updated).
+    """
+    __slots__ = ("kind", "src_side", "src_rel", "src_type", "out_rel", "tgt_type", "pair", "reason")
+
+    def __init__(self, kind, src_side=None, src_rel=None, src_type=None, out_rel=None, tgt_type=None,
+                 pair=None, reason=""):
+        self.kind = kind
+        self.src_side = src_side
+        self.src_rel = src_rel
+        self.src_type = src_type
+        self.out_rel = out_rel
+        self.tgt_type = tgt_type
+        self.pair = pair
+        self.reason = reason
+
+    def __repr__(self):
+        return f"SyncAction({self.kind}, {self.src_side}:{self.src_rel} → {self.out_rel}, {self.reason!r})"
+
+    def as_dict(self) -> dict:
+        return {"action": self.kind, "from": self.src_side, "input": self.src_rel, "output": self.out_rel,
+                "src_type": self.src_type.name if self.src_type else None,
+                "tgt_type": self.tgt_type.name if self.tgt_type else None, "reason": self.reason}
+
+
+def _other(side):
+    return "b" if side == "a" else "a"
+
+
+class SyncEngine:
+    """
+    Keeps two save folders equivalent (e.g. RetroArch saves/ and an
+    Everdrive SAVE/), converting each changed save to the other side.
+
+    plan() compares os.scandir stat data against the manifest and hashes
+    only files whose size or mtime moved, so unchanged collections cost
+    one directory walk. A save changed on one side is converted to the
+    other; if both sides changed since the last sync, or a save exists on
+    both sides before its first sync, it is a conflict, settled by prefer
+    ("newer", "a", "b") or reported ("none"). Sections
+    written into a RetroArch SRM are merged, so an SRM shared by several
+    saves keeps its other sections.
+    """
+
+    def __init__(self, a_dir, a_system, b_dir, b_system, manifest_path=None, options=None,
+                 prefer="none", recursive=True):
+        self.dirs = {"a": os.path.abspath(a_dir), "b": os.path.abspath(b_dir)}
+        self.systems = {"a": a_system, "b": b_system}
+        self.manifest = SyncManifest(manifest_path or default_manifest_path(a_dir, b_dir))
+        self.options = options or ConversionOptions()
+        self.prefer = prefer
+        self.recursive = recursive
+        self._hashes = {}
+
+    def _path(self, side, rel):
+        return os.path.join(self.dirs[side], rel)
+
+    def _digest(self, side, rel):
+        key = (side, rel)
+        if key not in self._hashes:
+            self._hashes[key] = file_digest(self._path(side, rel))
+        return self._hashes[key]
+
+    def _state(self, side, record, scan):
+        """"same", "touched" (new stat, same content), "changed" or "missing" for one side of a pair."""
+        stat = scan[side].get(record["path"])
+        if stat is None:
+            return "missing"
+        if (record["size"], record["mtime_ns"]) == tuple(stat):
+            return "same"
+        return "touched" if self._digest(side, record["path"]) == record["hash"] else "changed"
+
+    def _settle(self, pair, scan):
+        """Side whose version wins a conflict, or None to leave it to the user."""
+        if self.prefer in ("a", "b"):
+            return self.prefer
+        if self.prefer == "newer":
+            a_mtime = scan["a"][pair["a"]["path"]][1]
+            b_mtime = scan["b"][pair["b"]["path"]][1]
+            return "a" if a_mtime >= b_mtime else "b"
+        return None
+
+    def _new_pairs(self, side, rel):
+        """(src_type, out_rel, tgt_type) for each save in an unpaired file; SRMs give one per used section."""
+        path = self._path(side, rel)
+        src, tgt = self.systems[side], self.systems[_other(side)]
+        src_type, tgt_type, error = resolve_types(path, src, tgt)
+        if src_type is SaveType.SRM:
+            try:
+                used = [t for t, usage in analyze_srm(read_srm(path)[0], detail=False).items() if usage.used]
+            except ConversionError:
+                used = []
+            targets = used or ([tgt_type] if tgt_type else [])
+        else:
+            targets = [tgt_type] if tgt_type else []
+        stem = os.path.splitext(rel)[0]
+        return [(src_type, stem + SAVE_TYPE_EXT[target], target) for target in targets]
+
+    def plan(self) -> list[SyncAction]:
+        """Work out what a sync would do, without touching any file."""
+        scan = {side: scan_tree(self.dirs[side], self.recursive) for side in ("a", "b")}
+        self._hashes.clear()
+        actions = []
+
+        for pair in self.manifest.pairs:
+            a_state = self._state("a", pair["a"], scan)
+            b_state = self._state("b", pair["b"], scan)
+            if "missing" in (a_state, b_state):
+                if (a_state, b_state) != ("missing", "missing"):
+                    side = "a" if a_state == "missing" else "b"
+                    actions.append(SyncAction("missing", side, pair[side]["path"], pair=pair,
+                                              reason="deleted since the last sync; not propagated"))
+                continue
+            changed = [side for side, state in (("a", a_state), ("b", b_state)) if state == "changed"]
+            if len(changed) == 2:
+                winner = self._settle(pair, scan)
+                if winner is None:
+                    actions.append(SyncAction("conflict", "a", pair["a"]["path"], out_rel=pair["b"]["path"],
+                                              pair=pair, reason="changed on both sides"))
+                    continue
+                changed = [winner]
+            if changed:
+                side = changed[0]
+                other = _other(side)
+                actions.append(SyncAction("convert", side, pair[side]["path"], SaveType[pair[side]["type"]],
+                                          pair[other]["path"], SaveType[pair[other]["type"]], pair,
+                                          reason="changed"))
+            for side, state in (("a", a_state), ("b", b_state)):
+                if state == "touched":
+                    actions.append(SyncAction("refresh", side, pair[side]["path"], pair=pair,
+                                              reason="timestamp changed, content did not"))
+
+        # Files no pair knows about yet
+        paired = {side: self.manifest.by_path(side) for side in ("a", "b")}
+        planned_outputs = set()
+        for side in ("a", "b"):
+            other = _other(side)
+            for rel in sorted(scan[side]):
+                if rel in paired[side] or (side, rel) in planned_outputs:
+                    continue
+                for src_type, out_rel, tgt_type in self._new_pairs(side, rel):
+                    planned_outputs.add((other, out_rel))
+                    if out_rel in scan[other] and out_rel not in paired[other]:
+                        # Both copies exist but were never synced: settled like a conflict
+                        winner = self._settle({side: {"path": rel}, other: {"path": out_rel}}, scan)
+                        if winner is None:
+                            actions.append(SyncAction("conflict", side, rel, src_type, out_rel, tgt_type,
+                                                      reason="exists on both sides but was never synced"))
+                        elif winner == other:
+                            actions.append(SyncAction("convert", other, out_rel, tgt_type, rel, src_type,
+                                                      reason=f"never synced; {winner} preferred"))
+                        else:
+                            actions.append(SyncAction("convert", side, rel, src_type, out_rel, tgt_type,
+                                                      reason=f"never synced; {winner} preferred"))
+                        continue
+                    actions.append(SyncAction("convert", side, rel, src_type, out_rel, tgt_type,
+                                              reason="new"))
+        return actions
+
+    def _write(self, action):
+        """Convert one action's input into its counterpart; returns the ConversionResult."""
+        other = _other(action.src_side)
+        src_path = self._path(action.src_side, action.src_rel)
+        out_path = self._path(other, action.out_rel)
+        src, tgt = self.systems[action.src_side], self.systems[other]
+        os.makedirs(os.path.dirname(out_path), exist_ok=True)
+        if action.tgt_type is SaveType.SRM and action.src_type in srm_sections and os.path.exists(out_path):
+            # Replace only this save's section of an existing SRM
+            return update_srm(out_path, [(action.src_type, read_bytes(src_path))], src, self.options)
+        return convert_file(src_path, out_path, src, action.src_type, tgt, action.tgt_type, self.options)
+
+    def _record(self, side, rel):
+        stat = os.stat(self._path(side, rel))
+        self._hashes.pop((side, rel), None)
+        self.manifest.record(side, rel, stat.st_size, stat.st_mtime_ns, self._digest(side, rel))
+
+    def apply(self, actions) -> list[dict]:
+        """Carry out a plan, update the manifest and return one record per action."""
+        records = []
+        for action in actions:
+            record = action.as_dict()
+            if action.kind == "convert":
+                try:
+                    result = self._write(action)
+                except (ConversionError, OSError) as e:
+                    record.update(status="error", error=str(e))
+                    records.append(record)
+                    continue
+                if action.pair is None:
+                    side, other = action.src_side, _other(action.src_side)
+                    entries = {side: {"path": action.src_rel, "type": action.src_type.name},
+                               other: {"path": action.out_rel, "type": action.tgt_type.name}}
+                    action.pair = self.manifest.add(entries["a"], entries["b"])
+                self._record(action.src_side, action.src_rel)
+                self._record(_other(action.src_side), action.out_rel)
+                record.update(status="ok", plan=result.plan_key)
+            elif action.kind == "refresh":
+                self._record(action.src_side, action.src_rel)
+                record["status"] = "ok"
+            else:
+                record["status"] = action.kind
+            records.append(record)
+        self.manifest.save()
+        return records
+
+    def sync(self, dry_run=False) -> list[dict]:
+        """Plan and (unless dry_run) apply; returns the action records."""
+        actions = self.plan()
+        if dry_run:
+            return [dict(action.as_dict(), status="planned") for action in actions]
+        return self.apply(actions)
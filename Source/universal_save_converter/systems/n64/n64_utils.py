@@ -2,7 +2,8 @@
 
 from systems.n64.n64_constants import (
     EEP_LABEL, SRA_LABEL, FLA_LABEL, MPK_LABEL, SRM_LABEL,
-    NATIVE_LABEL, PJ64_LABEL, RA_LABEL, WII_LABEL
+    NATIVE_LABEL, PJ64_LABEL, RA_LABEL, WII_LABEL,
+    SaveType
 )
 
 SWAPPABLE_TYPES = [SRA_LABEL, FLA_LABEL, MPK_LABEL, SRM_LABEL]
@@ -40,3 +41,11 @@ def determine_valid_target_types(src, src_type, tgt):
 def is_byteswap_allowed(src_type):
     """Returns True if a byte-swap can be applied for this source type."""
     return src_type in SWAPPABLE_TYPES
+
+
+def resolve_target_type(src, src_type, tgt, forced_tgt_type):
+    """Pick the target type: the forced one, or the only valid one, else None."""
+    if forced_tgt_type:
+        return forced_tgt_type
+    valid = determine_valid_target_types(src.value, src_type.value, tgt.value)
+    return SaveType(valid[0]) if len(valid) == 1 else None
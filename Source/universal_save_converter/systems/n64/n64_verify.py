@@ -0,0 +1,61 @@
+# systems/n64/n64_verify.py
+
+import random
+import time
+from core.conversion_types import ConversionOptions
+from core.exceptions import ConversionError
+from core.swap_utils import AUTO_SWAP
+from .n64_constants import BYTE_ORDER_TYPES
+from .n64_conversion_plans import PLANS
+from .n64_engine import convert_bytes
+
+# Swap choices every plan is checked under (Auto only where byte order is detected)
+SELFTEST_SWAPS = ("Default", "2 bytes", "4 bytes", AUTO_SWAP)
+
+# Off-nominal input sizes checked for every plan as well: odd (a partial
+# trailing swap chunk) and larger than any save section
+SELFTEST_ODD_SIZES = (1001, 2049, 32769)
+
+
+def selftest_sizes(plan) -> tuple:
+    """Input sizes a plan is checked with: the ones it expects, then odd and oversized ones."""
+    largest = max(plan.src_sizes)
+    return tuple(dict.fromkeys((*plan.src_sizes, *SELFTEST_ODD_SIZES, largest - 1, largest + 3)))
+
+
+def sample_save(size: int, seed: int = 0) -> bytes:
+    """
+    Test input: random bytes, with the first half laid out as big-endian
+    small integers so that Auto byte order detection has something to go on.
+    """
+    rng = random.Random(seed * 1_000_003 + size)
+    words = bytearray()
+    for _ in range(size // 8):
+        words += rng.randrange(1, 200).to_bytes(4, "big")
+    return bytes(words) + rng.randbytes(size - len(words))
+
+
+def selftest(swaps=SELFTEST_SWAPS, seed: int = 0) -> dict:
+    """
+    Round-trip every compiled conversion plan (each table row plus the SRM
+    and Native rules), for every input size it expects and the odd and
+    oversized ones of selftest_sizes(), under each swap choice. Returns {"checked", "failed", "seconds", "failures": [...]}.
+    """
+    started = time.perf_counter()
+    checked, failures, samples = 0, [], {}
+    for plan in PLANS.values():
+        for size in selftest_sizes(plan):
+            if size not in samples:
+                samples[size] = sample_save(size, seed)
+            data = samples[size]
+            for swap in swaps:
+                if swap == AUTO_SWAP and not {plan.src_type, plan.tgt_type}.intersection(BYTE_ORDER_TYPES):
+                    continue
+                checked += 1
+                options = ConversionOptions(byteswap_option=swap, verify=True)
+                try:
+                    convert_bytes(data, plan.src, plan.src_type, plan.tgt, plan.tgt_type, options)
+                except ConversionError as e:
+                    failures.append({"plan": plan.key, "size": size, "byteswap": swap, "error": str(e)})
+    return {"checked": checked, "failed": len(failures), "seconds": round(time.perf_counter() - started, 3),
+            "failures": failures}